@@ -2,12 +2,12 @@ import logging
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import FileResponse, HTMLResponse, Response
 
 from app.core.dependencies import get_about_page_service
-from app.core.rendering import render_page
-from app.services import AboutPageService
+from app.core.rendering import render_cached
+from app.services import AboutPageService, PageRenderData
 
 router = APIRouter(prefix="/about", tags=["about"])
 logger = logging.getLogger(__name__)
@@ -19,11 +19,15 @@ _RESUME_PATH = Path(__file__).resolve().parents[2] / "content" / "about.md"
 
 @router.get("", response_class=HTMLResponse)
 async def about(
+    request: Request,
     page_service: AboutPageServiceDep,
-) -> HTMLResponse:
-    page = page_service.build_page()
-    logger.debug("About page rendered.")
-    return render_page(page)
+) -> Response:
+    def render() -> PageRenderData | HTMLResponse:
+        page = page_service.build_page()
+        logger.debug("About page rendered.")
+        return page
+
+    return await render_cached(request, render)
 
 
 @router.get("/resume.md", response_class=FileResponse)
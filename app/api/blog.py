@@ -3,10 +3,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from fastapi.responses import HTMLResponse, Response
+from starlette.concurrency import run_in_threadpool
 
 from app.core.dependencies import get_blog_page_service
-from app.core.rendering import is_htmx, render_fragment, render_page
-from app.services import BlogPageService
+from app.core.rendering import is_htmx, render_cached, render_fragment, run_render
+from app.services import BlogPageService, PageRenderData
 from app.services.types import BlogTagsPageContext
 
 router = APIRouter(prefix="/blog", tags=["blog"])
@@ -15,52 +16,94 @@ logger = logging.getLogger(__name__)
 BlogPageServiceDep = Annotated[BlogPageService, Depends(get_blog_page_service)]
 
 
+def _render_tags_page(
+    request: Request, page: PageRenderData
+) -> PageRenderData | HTMLResponse:
+    if is_htmx(request):
+        ctx = page.context
+        if not isinstance(ctx, BlogTagsPageContext):
+            raise TypeError(f"Expected BlogTagsPageContext, got {type(ctx).__name__}")
+        return render_fragment(
+            "@features/blog/tags-fragment.jinja",
+            tags=ctx.tags,
+            posts=ctx.posts,
+            selected_tag=ctx.selected_tag,
+        )
+    return page
+
+
 @router.get("", response_class=HTMLResponse)
-async def blog_home(page_service: BlogPageServiceDep) -> HTMLResponse:
-    page = page_service.build_home_page()
-    logger.debug("Blog home page rendered.")
-    return render_page(page)
+async def blog_home(request: Request, page_service: BlogPageServiceDep) -> Response:
+    def render() -> PageRenderData | HTMLResponse:
+        page = page_service.build_home_page()
+        logger.debug("Blog home page rendered.")
+        return page
+
+    return await render_cached(request, render)
 
 
 @router.get("/posts", response_class=HTMLResponse)
 async def blog_posts(
+    request: Request,
     page_service: BlogPageServiceDep,
     page: Annotated[int, Query(ge=1)] = 1,
-) -> HTMLResponse:
-    page_data = page_service.build_posts_page(page=page)
-    logger.debug("Blog posts page rendered.")
-    return render_page(page_data)
+) -> Response:
+    def render() -> PageRenderData | HTMLResponse:
+        page_data = page_service.build_posts_page(page=page)
+        logger.debug("Blog posts page rendered.")
+        return page_data
+
+    return await render_cached(request, render)
 
 
 @router.get("/posts/{slug}", response_class=HTMLResponse)
 async def blog_post_detail(
+    request: Request,
+    slug: Annotated[str, Path()],
+    page_service: BlogPageServiceDep,
+) -> Response:
+    def render() -> PageRenderData | HTMLResponse:
+        post = page_service.get_post(slug)
+        if post is None:
+            logger.info(f"Blog post detail not found for slug={slug}.")
+            raise HTTPException(status_code=404, detail="Blog post not found")
+        page = page_service.build_post_page(post)
+        logger.debug(f"Blog post detail page rendered for slug={slug}.")
+        return page
+
+    return await render_cached(request, render)
+
+
+@router.get("/posts/{slug}/comments", response_class=HTMLResponse)
+async def blog_post_comments(
     slug: Annotated[str, Path()],
     page_service: BlogPageServiceDep,
 ) -> HTMLResponse:
     post = page_service.get_post(slug)
     if post is None:
-        logger.info(f"Blog post detail not found for slug={slug}.")
+        logger.info(f"Blog post comments not found for slug={slug}.")
         raise HTTPException(status_code=404, detail="Blog post not found")
-    page = page_service.build_post_page(post)
-    logger.debug(f"Blog post detail page rendered for slug={slug}.")
-    return render_page(page)
+    # A comments cache miss calls the GitHub API, so keep it off the event loop.
+    comments = await run_in_threadpool(page_service.get_post_comments, post)
+    logger.debug(f"Blog post comments rendered for slug={slug}.")
+    return render_fragment(
+        "@features/blog/comments.jinja",
+        discussion_url=post.discussion_url,
+        post_title=post.title,
+        comments=comments,
+        comment_source_label="Gist" if post.gist_id else "GitHub",
+        show_cta=True,
+    )
 
 
 @router.get("/tags", response_class=HTMLResponse)
-async def blog_tags(request: Request, page_service: BlogPageServiceDep) -> HTMLResponse:
-    page = page_service.build_tags_page()
-    logger.debug("Blog tags page rendered.")
-    if is_htmx(request):
-        ctx = page.context
-        if not isinstance(ctx, BlogTagsPageContext):
-            raise TypeError(f"Expected BlogTagsPageContext, got {type(ctx).__name__}")
-        return render_fragment(
-            "@features/blog/tags-fragment.jinja",
-            tags=ctx.tags,
-            posts=ctx.posts,
-            selected_tag=ctx.selected_tag,
-        )
-    return render_page(page)
+async def blog_tags(request: Request, page_service: BlogPageServiceDep) -> Response:
+    def render() -> PageRenderData | HTMLResponse:
+        page = page_service.build_tags_page()
+        logger.debug("Blog tags page rendered.")
+        return _render_tags_page(request, page)
+
+    return await render_cached(request, render)
 
 
 @router.get("/tags/{tag}", response_class=HTMLResponse)
@@ -68,25 +111,18 @@ async def blog_tag_detail(
     tag: Annotated[str, Path()],
     request: Request,
     page_service: BlogPageServiceDep,
-) -> HTMLResponse:
-    page = page_service.build_tags_page(tag=tag)
-    logger.debug(f"Blog tag page rendered for tag={tag}.")
-    if is_htmx(request):
-        ctx = page.context
-        if not isinstance(ctx, BlogTagsPageContext):
-            raise TypeError(f"Expected BlogTagsPageContext, got {type(ctx).__name__}")
-        return render_fragment(
-            "@features/blog/tags-fragment.jinja",
-            tags=ctx.tags,
-            posts=ctx.posts,
-            selected_tag=ctx.selected_tag,
-        )
-    return render_page(page)
+) -> Response:
+    def render() -> PageRenderData | HTMLResponse:
+        page = page_service.build_tags_page(tag=tag)
+        logger.debug(f"Blog tag page rendered for tag={tag}.")
+        return _render_tags_page(request, page)
+
+    return await render_cached(request, render)
 
 
 @router.get("/feed.xml")
 async def blog_feed(page_service: BlogPageServiceDep) -> Response:
-    feed = page_service.build_rss_feed()
+    feed = await run_render(page_service.build_rss_feed)
     logger.debug("Blog RSS feed rendered.")
     return Response(
         content=feed,
@@ -2,7 +2,7 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 
 from app.core.config import settings
 from app.core.dependencies import (
@@ -13,9 +13,15 @@ from app.core.dependencies import (
 from app.core.logger import event_message
 from app.core.security import _anonymize_identifier
 from app.observability.events import LogEvent
-from app.core.rendering import is_htmx, render_fragment, render_page
+from app.core.rendering import (
+    is_htmx,
+    render_cached,
+    render_fragment,
+    render_page,
+    run_render,
+)
 from app.services.types import ContactPageContext
-from app.services import ContactPageService
+from app.services import ContactPageService, PageRenderData
 from app.services.contact import ContactOrchestrator
 
 router = APIRouter(prefix="/contact", tags=["contact"])
@@ -31,16 +37,33 @@ ContactOrchestratorDep = Annotated[
 async def contact_get(
     request: Request,
     page_service: ContactPageServiceDep,
-) -> HTMLResponse:
+) -> Response:
     logger.info(
         event_message(
             LogEvent.CONTACT_PAGE_RENDERED,
             path=request.url.path,
         )
     )
+
+    def render() -> PageRenderData | HTMLResponse:
+        page = page_service.build_page(include_csrf=False)
+        return page
+
+    return await render_cached(request, render)
+
+
+@router.get("/token", response_class=HTMLResponse)
+async def contact_token(
+    request: Request,
+    page_service: ContactPageServiceDep,
+) -> HTMLResponse:
     user_agent = request.headers.get("user-agent", "")
-    page = page_service.build_page(user_agent=user_agent)
-    return render_page(page)
+    response = render_fragment(
+        "@features/contact/token.jinja",
+        csrf_token=page_service.issue_csrf_token(user_agent=user_agent),
+    )
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 
 @router.post("", response_class=HTMLResponse)
@@ -82,7 +105,8 @@ async def contact_post(
         ctx = result.page.context
         if not isinstance(ctx, ContactPageContext):
             raise TypeError(f"Expected ContactPageContext, got {type(ctx).__name__}")
-        return render_fragment(
+        return await run_render(
+            render_fragment,
             "@features/contact/fragment.jinja",
             status_code=result.status_code,
             csrf_token=ctx.csrf_token,
@@ -90,4 +114,4 @@ async def contact_post(
             errors=ctx.errors,
             form_data=ctx.form_data,
         )
-    return render_page(result.page, status_code=result.status_code)
+    return await run_render(render_page, result.page, status_code=result.status_code)
@@ -2,11 +2,11 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 
 from app.core.dependencies import get_home_page_service
-from app.core.rendering import render_page
-from app.services import HomePageService
+from app.core.rendering import render_cached
+from app.services import HomePageService, PageRenderData
 
 router = APIRouter(tags=["home"])
 logger = logging.getLogger(__name__)
@@ -18,8 +18,10 @@ HomePageServiceDep = Annotated[HomePageService, Depends(get_home_page_service)]
 async def home(
     request: Request,
     page_service: HomePageServiceDep,
-) -> HTMLResponse:
-    user_agent = request.headers.get("user-agent", "")
-    page = page_service.build_page(user_agent=user_agent)
-    logger.debug("Home page rendered.")
-    return render_page(page)
+) -> Response:
+    def render() -> PageRenderData | HTMLResponse:
+        page = page_service.build_page()
+        logger.debug("Home page rendered.")
+        return page
+
+    return await render_cached(request, render)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from . import about, blog, contact, health, home, projects, telemetry
+from . import about, blog, contact, health, home, projects, search, telemetry
 
 api_router = APIRouter()
 api_router.include_router(health.router)
@@ -8,5 +8,6 @@ api_router.include_router(home.router)
 api_router.include_router(about.router)
 api_router.include_router(projects.router)
 api_router.include_router(blog.router)
+api_router.include_router(search.router)
 api_router.include_router(contact.router)
 api_router.include_router(telemetry.router)
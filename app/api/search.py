@@ -0,0 +1,36 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import HTMLResponse, Response
+
+from app.core.dependencies import get_search_page_service
+from app.core.rendering import is_htmx, render_fragment, run_render, stream_page
+from app.services import SearchPageService
+from app.services.types import SearchPageContext
+
+router = APIRouter(prefix="/search", tags=["search"])
+logger = logging.getLogger(__name__)
+
+SearchPageServiceDep = Annotated[SearchPageService, Depends(get_search_page_service)]
+
+
+@router.get("", response_class=HTMLResponse)
+async def search(
+    request: Request,
+    page_service: SearchPageServiceDep,
+    q: Annotated[str, Query(max_length=200)] = "",
+) -> Response:
+    page_data = await run_render(page_service.build_page, q=q)
+    logger.debug("Search page rendered.")
+    if is_htmx(request):
+        ctx = page_data.context
+        if not isinstance(ctx, SearchPageContext):
+            raise TypeError(f"Expected SearchPageContext, got {type(ctx).__name__}")
+        return await run_render(
+            render_fragment,
+            "@features/search/results.jinja",
+            q=ctx.q,
+            results=ctx.results,
+        )
+    return await stream_page(page_data)
@@ -0,0 +1,51 @@
+"""Build-time content tooling.
+
+Usage:
+    python -m app.content compile [--output PATH]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.logger import configure_logging
+from app.infrastructure.markdown import PROJECT_ROOT, compile_content_artifact
+
+_DEFAULT_OUTPUT = "build/content.sqlite3"
+
+
+def _compile(output: str) -> int:
+    path = Path(output)
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    started = time.perf_counter()
+    artifact = compile_content_artifact(path)
+    print(
+        f"Compiled {len(artifact.projects)} project(s) and "
+        f"{len(artifact.blog_posts)} blog post(s) to {path} "
+        f"in {time.perf_counter() - started:.2f}s."
+    )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.content")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_parser = commands.add_parser(
+        "compile", help="Render all content into a deployable SQLite artifact."
+    )
+    compile_parser.add_argument(
+        "--output",
+        default=settings.content_artifact_path or _DEFAULT_OUTPUT,
+        help=f"Artifact path (default: CONTENT_ARTIFACT_PATH or {_DEFAULT_OUTPUT}).",
+    )
+    args = parser.parse_args(argv)
+
+    configure_logging(settings.log_level)
+    return _compile(args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -59,10 +59,28 @@ class Settings(BaseSettings):
 
     # Content
     markdown_cache_ttl: int = Field(default=300, ge=0)
+    content_cache_dir: str = ".cache/content"
+    content_artifact_path: str = ""
+    content_watch_enabled: bool = False
+    content_warm_on_startup: bool = True
+    content_render_workers: int = Field(default=0, ge=0, le=64)
+    content_render_parallel_min_batch: int = Field(default=64, ge=1)
+    content_search_index_path: str = ".cache/search.sqlite3"
+    content_body_cache_size: int = Field(default=256, ge=1)
+    content_related_posts: int = Field(default=3, ge=0)
+    content_page_cache_size: int = Field(default=512, ge=0)
+    content_stream_pages: bool = True
+    content_page_render_threads: int = Field(default=2, ge=0, le=64)
+    content_highlight_cache_size: int = Field(default=2048, ge=0)
+    content_render_chunk_size: int = Field(default=16, ge=1, le=1024)
     dev_csp_enabled: bool = True
     github_token: str = ""
     github_api_timeout_seconds: int = Field(default=8, ge=1, le=60)
     github_gist_comments_limit: int = Field(default=20, ge=1, le=100)
+    github_comments_cache_ttl: int = Field(default=120, ge=0)
+    github_cache_dir: str = ".cache/gists"
+    github_fetch_concurrency: int = Field(default=8, ge=1, le=32)
+    github_fetch_deadline_seconds: float = Field(default=10.0, gt=0, le=120)
 
     # Contact
     contact_webhook_url: str = ""
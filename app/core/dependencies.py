@@ -22,6 +22,7 @@ from app.services import (
     HomePageService,
     ProfileService,
     ProjectsPageService,
+    SearchPageService,
 )
 from app.services.contact import ContactOrchestrator
 
@@ -129,6 +130,11 @@ def get_projects_page_service() -> ProjectsPageService:
     return ProjectsPageService()
 
 
+@lru_cache(maxsize=1)
+def get_search_page_service() -> SearchPageService:
+    return SearchPageService()
+
+
 @lru_cache(maxsize=1)
 def get_blog_page_service() -> BlogPageService:
     return BlogPageService()
@@ -153,13 +159,21 @@ def get_contact_orchestrator() -> ContactOrchestrator:
     )
 
 
-def render_template(template: str, **context: Any) -> str:
-    """Render a Jx template without silent fallback behavior."""
+def render_template(
+    template: str, *, head_flushed: bool = False, **context: Any
+) -> str:
+    """Render a Jx template without silent fallback behavior.
+
+    ``head_flushed`` makes the base layout skip the document head, for pages
+    whose head was already streamed on its own.
+    """
     catalog = get_catalog()
     resolved_template = template
     if template.startswith("pages/"):
         resolved_template = f"@pages/{template.split('/', 1)[1]}"
-    rendered = catalog.render(resolved_template, **context)
+    rendered = catalog.render(
+        resolved_template, globals={"head_flushed": head_flushed}, **context
+    )
     logger.debug(
         f"Template rendered successfully: template={template} resolved={resolved_template}"
     )
@@ -0,0 +1,82 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from app.observability.metrics import AppMetrics, get_app_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class RenderExecutor:
+    """Bounded thread pool that keeps page building and rendering off the loop.
+
+    At most ``max_workers`` renders run at once; the rest wait in the queue,
+    whose depth and wait time are exported as metrics. ``max_workers=0`` runs
+    work inline on the event loop.
+    """
+
+    def __init__(self, max_workers: int, *, metrics: AppMetrics | None = None) -> None:
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render")
+            if max_workers > 0
+            else None
+        )
+        self._metrics = metrics or get_app_metrics()
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    async def run[T](self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        call = functools.partial(func, *args, **kwargs)
+        if self._executor is None:
+            return call()
+
+        # Log records and spans in the worker keep the request's context.
+        context = contextvars.copy_context()
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+        self._metrics.render_task_queued()
+
+        def work() -> T:
+            wait_ms = (time.perf_counter() - submitted) * 1000
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            self._metrics.render_task_started(wait_ms=wait_ms)
+            try:
+                return context.run(call)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                self._metrics.render_task_finished()
+
+        future = self._executor.submit(work)
+        future.add_done_callback(self._forget_if_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _forget_if_cancelled(self, future: Future[Any]) -> None:
+        # A request cancelled while its render is queued cancels the future,
+        # so ``work`` never runs to move it out of the queue.
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+            self._metrics.render_task_cancelled()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
@@ -1,24 +1,227 @@
+import hashlib
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
 from typing import Any
 
+from cachetools import LRUCache
 from fastapi import Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 
+from app.core.config import settings
 from app.core.dependencies import render_template
+from app.core.render_executor import RenderExecutor
+from app.infrastructure.markdown import content_generation, content_loaded
 from app.services import PageRenderData
+from app.services.types import context_values
+
+_render_executor = RenderExecutor(settings.content_page_render_threads)
+
+
+async def run_render[T](func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run page building or rendering on the bounded render thread pool."""
+    return await _render_executor.run(func, *args, **kwargs)
 
 
 def is_htmx(request: Request) -> bool:
-    return request.headers.get("HX-Request") == "true"
+    """Whether to answer with a fragment instead of the full page.
+
+    A history restore after a pushed URL misses the htmx cache and needs the
+    full page, so it does not count.
+    """
+    return (
+        request.headers.get("HX-Request") == "true"
+        and request.headers.get("HX-History-Restore-Request") != "true"
+    )
 
 
 def render_page(page: PageRenderData, *, status_code: int = 200) -> HTMLResponse:
-    context = page.context.model_dump()
-    html = render_template(page.template, **context)
+    html = render_template(page.template, **context_values(page.context))
     return HTMLResponse(content=html, status_code=status_code)
 
 
+# The body is encoded once and sent as zero-copy slices of that buffer, so
+# the server can apply backpressure without a second copy of the page.
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def render_head(page: PageRenderData) -> bytes:
+    """Render the document head of a streamed page, encoded."""
+    head = render_template("@layouts/head.jinja", seo=page.context.seo)
+    return (head + "\n").encode("utf-8")
+
+
+def render_body(page: PageRenderData) -> bytes:
+    """Render everything after the document head, encoded."""
+    html = render_template(
+        page.template, head_flushed=True, **context_values(page.context)
+    )
+    return html.encode("utf-8")
+
+
+def iter_page(page: PageRenderData) -> Iterator[bytes | memoryview]:
+    """Yield a page as streamed: the head first, then the body in slices.
+
+    The body renders only after the head has been yielded.
+    """
+    yield render_head(page)
+    yield from _slices(render_body(page))
+
+
+def _slices(body: bytes) -> Iterator[memoryview]:
+    view = memoryview(body)
+    for start in range(0, len(body), _STREAM_CHUNK_BYTES):
+        yield view[start : start + _STREAM_CHUNK_BYTES]
+
+
+async def _stream_body(
+    page: PageRenderData,
+    head: bytes,
+    on_complete: Callable[[bytes, bytes], None] | None = None,
+) -> AsyncIterator[bytes | memoryview]:
+    # The body renders on the render pool while the head is on the wire. A
+    # template error there aborts the response before ``on_complete`` runs.
+    yield head
+    body = await run_render(render_body, page)
+    for chunk in _slices(body):
+        yield chunk
+    if on_complete is not None:
+        on_complete(head, body)
+
+
+async def stream_page(
+    page: PageRenderData,
+    *,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    head = await run_render(render_head, page)
+    return StreamingResponse(
+        _stream_body(page, head),
+        status_code=status_code,
+        media_type="text/html",
+        headers=headers,
+    )
+
+
 def render_fragment(
     template: str, *, status_code: int = 200, **context: Any
 ) -> HTMLResponse:
     html = render_template(template, **context)
     return HTMLResponse(content=html, status_code=status_code)
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    body: bytes
+    etag: str
+
+
+class PageCache:
+    """Bounded LRU of rendered page bytes; ``maxsize=0`` disables it."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: LRUCache[tuple[Any, ...], CachedPage] | None = (
+            LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> CachedPage | None:
+        if self._entries is None:
+            return None
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: tuple[Any, ...], page: CachedPage) -> None:
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries[key] = page
+
+    @property
+    def enabled(self) -> bool:
+        return self._entries is not None
+
+    def clear(self) -> None:
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries.clear()
+
+
+# Templates reload from disk in debug, so cached pages would hide edits there.
+_page_cache = PageCache(0 if settings.debug else settings.content_page_cache_size)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match", "")
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def _etag_for(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+async def _stream_into_cache(
+    key: tuple[Any, ...], page: PageRenderData, headers: dict[str, str]
+) -> StreamingResponse:
+    def store(head: bytes, body: bytes) -> None:
+        document = head + body
+        _page_cache.put(key, CachedPage(body=document, etag=_etag_for(document)))
+
+    head = await run_render(render_head, page)
+    return StreamingResponse(
+        _stream_body(page, head, store if _page_cache.enabled else None),
+        media_type="text/html",
+        headers=headers,
+    )
+
+
+async def render_cached(
+    request: Request, render: Callable[[], PageRenderData | HTMLResponse]
+) -> Response:
+    """Serve a GET page from the page cache, calling ``render`` only on a miss.
+
+    Entries are keyed by path, query, HTMX-ness and the content generation, so
+    any content swap retires them. The ETag is a hash of the body, so it also
+    matches across workers and restarts; a match returns 304 with no body.
+    ``render`` returns page data for full pages, which stream on a miss when
+    ``CONTENT_STREAM_PAGES`` is on (the ETag follows from the next request),
+    or a ready response for fragments. Only 200 responses are stored, and a
+    streamed one only after its body has rendered.
+    Misses build and render on the render thread pool (``run_render``).
+    """
+    # Until the first load finishes, reading the generation builds content.
+    generation = (
+        content_generation()
+        if content_loaded()
+        else await run_render(content_generation)
+    )
+    key = (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        is_htmx(request),
+        generation,
+    )
+    headers = {"Cache-Control": "no-cache", "Vary": "HX-Request"}
+    page = _page_cache.get(key)
+    if page is None:
+        rendered = await run_render(render)
+        if isinstance(rendered, PageRenderData):
+            if settings.content_stream_pages:
+                return await _stream_into_cache(key, rendered, headers)
+            rendered = await run_render(render_page, rendered)
+        if rendered.status_code != 200:
+            return rendered
+        body = bytes(rendered.body)
+        page = CachedPage(body=body, etag=_etag_for(body))
+        _page_cache.put(key, page)
+
+    headers["ETag"] = page.etag
+    if _etag_matches(request, page.etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=page.body, headers=headers)
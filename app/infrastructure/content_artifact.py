@@ -0,0 +1,188 @@
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from app.models.models import BlogPost, Project
+from app.models.schemas import AboutContent
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT = "3"
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE entries (
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (kind, position)
+);
+CREATE TABLE bodies (digest TEXT PRIMARY KEY, html TEXT NOT NULL);
+"""
+
+
+@dataclass(frozen=True)
+class ContentArtifact:
+    """Fully compiled site content, as produced by ``python -m app.content compile``.
+
+    Rendered bodies stay in the file and are read one at a time by ``body()``.
+    """
+
+    pipeline_version: str
+    about: AboutContent
+    projects: tuple[Project, ...]
+    blog_posts: tuple[BlogPost, ...]
+    path: Path | None = None
+
+    def body(self, digest: str) -> str | None:
+        if self.path is None:
+            return None
+        try:
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            try:
+                row = connection.execute(
+                    "SELECT html FROM bodies WHERE digest = ?", (digest,)
+                ).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            logger.exception(f"Failed to read body from content artifact: {self.path}")
+            return None
+        return row[0] if row is not None else None
+
+
+def _encode(item: Project | BlogPost) -> str:
+    payload = asdict(item)
+    if payload["date"] is not None:
+        payload["date"] = payload["date"].isoformat()
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _decode_fields(payload: dict[str, Any], tuple_fields: tuple[str, ...]) -> None:
+    for field in tuple_fields:
+        payload[field] = tuple(payload[field])
+    if payload["date"] is not None:
+        payload["date"] = date.fromisoformat(payload["date"])
+
+
+def _decode_project(raw: str) -> Project:
+    payload = json.loads(raw)
+    _decode_fields(payload, ("tags", "tech_stack"))
+    return Project(**payload)
+
+
+def _decode_blog_post(raw: str) -> BlogPost:
+    payload = json.loads(raw)
+    _decode_fields(payload, ("tags",))
+    return BlogPost(**payload)
+
+
+def write_content_artifact(
+    path: Path, artifact: ContentArtifact, bodies: dict[str, str]
+) -> None:
+    """Write ``artifact`` and its rendered ``bodies`` to a SQLite file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        connection = sqlite3.connect(tmp_name)
+        try:
+            connection.executescript(_SCHEMA)
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("format", ARTIFACT_FORMAT),
+                    ("pipeline_version", artifact.pipeline_version),
+                    ("built_at", str(int(time.time()))),
+                ],
+            )
+            rows = [("about", 0, artifact.about.model_dump_json())]
+            rows += [
+                ("projects", position, _encode(project))
+                for position, project in enumerate(artifact.projects)
+            ]
+            rows += [
+                ("blog", position, _encode(post))
+                for position, post in enumerate(artifact.blog_posts)
+            ]
+            connection.executemany(
+                "INSERT INTO entries (kind, position, payload) VALUES (?, ?, ?)", rows
+            )
+            connection.executemany(
+                "INSERT INTO bodies (digest, html) VALUES (?, ?)", bodies.items()
+            )
+            connection.commit()
+        finally:
+            connection.close()
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_content_artifact(path: Path, pipeline_version: str) -> ContentArtifact | None:
+    """Load an artifact, or return ``None`` if it is missing, unreadable or stale."""
+    if not path.is_file():
+        logger.warning(f"Content artifact not found at {path}; compiling on demand.")
+        return None
+
+    started = time.perf_counter()
+    try:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+            rows = connection.execute(
+                "SELECT kind, payload FROM entries ORDER BY kind, position"
+            ).fetchall()
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        logger.exception(f"Failed to read content artifact: {path}")
+        return None
+
+    if meta.get("format") != ARTIFACT_FORMAT:
+        logger.warning(f"Ignoring content artifact with unknown format: {path}")
+        return None
+    if meta.get("pipeline_version") != pipeline_version:
+        logger.warning(
+            f"Ignoring content artifact built by another pipeline version: {path}"
+        )
+        return None
+
+    about: AboutContent | None = None
+    projects: list[Project] = []
+    blog_posts: list[BlogPost] = []
+    try:
+        for kind, payload in rows:
+            if kind == "about":
+                about = AboutContent.model_validate_json(payload)
+            elif kind == "projects":
+                projects.append(_decode_project(payload))
+            elif kind == "blog":
+                blog_posts.append(_decode_blog_post(payload))
+    except (TypeError, ValueError):
+        logger.exception(f"Corrupt entry in content artifact: {path}")
+        return None
+    if about is None:
+        logger.warning(f"Content artifact has no about entry: {path}")
+        return None
+
+    logger.info(
+        f"Loaded content artifact {path} with {len(projects)} project(s) and "
+        f"{len(blog_posts)} blog post(s) in {time.perf_counter() - started:.3f}s."
+    )
+    return ContentArtifact(
+        pipeline_version=pipeline_version,
+        about=about,
+        projects=tuple(projects),
+        blog_posts=tuple(blog_posts),
+        path=path,
+    )
@@ -0,0 +1,203 @@
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    value: Any
+    loaded_at: float
+    stale_version: int
+
+
+class SnapshotCache:
+    """Keyed snapshots served stale-while-revalidate with single-flight loads.
+
+    Only the first load of a key (or the first after ``clear``) runs in the
+    caller; every caller racing it waits on the same future. Once a snapshot
+    exists it is always returned immediately: an expired or stale snapshot
+    schedules one background rebuild and is swapped for the new value only
+    after that rebuild completes. A failed rebuild keeps the previous snapshot
+    and restarts its TTL, so it is not retried on every request.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._snapshots: dict[str, _Snapshot] = {}
+        self._loading: dict[str, Future[Any]] = {}
+        self._refreshing: set[str] = set()
+        self._stale_versions: dict[str, int] = {}
+        self._epoch = 0
+        self._generation = 0
+        self._listeners: list[Callable[[str], None]] = []
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on a clear and whenever a swap changes a value.
+
+        A rebuild that returns an equal value keeps the previous one and the
+        generation, so pages and ETags keyed on it survive no-op refreshes.
+        """
+        return self._generation
+
+    def advance_generation(self) -> None:
+        """Retire pages keyed on the current generation, keeping every snapshot.
+
+        For derived data that changed while the snapshots compare equal.
+        """
+        with self._lock:
+            self._generation += 1
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._snapshots
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def is_stale(self, key: str) -> bool:
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            return snapshot is not None and self._needs_refresh(key, snapshot)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._loading.clear()
+            self._stale_versions.clear()
+            self._epoch += 1
+            self._generation += 1
+
+    def mark_stale(self, keys: set[str]) -> None:
+        """Flag snapshots for a background rebuild without evicting them."""
+        with self._lock:
+            for key in keys:
+                self._stale_versions[key] = self._stale_versions.get(key, 0) + 1
+
+    def cached(self, key: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+        def decorator(loader: Callable[[], Any]) -> Callable[[], Any]:
+            @functools.wraps(loader)
+            def wrapper() -> Any:
+                return self.get(key, loader)
+
+            return wrapper
+
+        return decorator
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                if self._needs_refresh(key, snapshot) and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(key, loader, self._epoch),
+                        name=f"content-refresh-{key}",
+                        daemon=True,
+                    ).start()
+                return snapshot.value
+
+            future = self._loading.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._loading[key] = future
+            epoch = self._epoch
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = self._load(key, loader, epoch)
+        except BaseException as exc:
+            with self._lock:
+                if self._loading.get(key) is future:
+                    del self._loading[key]
+            future.set_exception(exc)
+            raise
+        future.set_result(value)
+        return value
+
+    def _needs_refresh(self, key: str, snapshot: _Snapshot) -> bool:
+        if snapshot.stale_version != self._stale_versions.get(key, 0):
+            return True
+        return time.monotonic() - snapshot.loaded_at >= self._ttl
+
+    def _load(self, key: str, loader: Callable[[], Any], epoch: int) -> Any:
+        with self._lock:
+            stale_version = self._stale_versions.get(key, 0)
+        value = loader()
+        changed = False
+        with self._lock:
+            # A clear() while loading means the value may predate the reset.
+            if epoch == self._epoch:
+                previous = self._snapshots.get(key)
+                if previous is not None and (
+                    previous.value is value or previous.value == value
+                ):
+                    value = previous.value
+                else:
+                    self._generation += 1
+                    changed = True
+                self._snapshots[key] = _Snapshot(
+                    value=value,
+                    loaded_at=time.monotonic(),
+                    stale_version=stale_version,
+                )
+                self._loading.pop(key, None)
+        if changed:
+            self._notify(key)
+        return value
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(key)`` after a load swaps in a changed value.
+
+        It runs on the thread that did the load, so it should hand slow work
+        to a thread of its own.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, key: str) -> None:
+        for listener in self._listeners:
+            try:
+                listener(key)
+            except Exception:
+                logger.exception(f"Content cache listener failed for key={key}.")
+
+    def _refresh(self, key: str, loader: Callable[[], Any], epoch: int) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            stale_version = self._stale_versions.get(key, 0)
+        try:
+            self._load(key, loader, epoch)
+        except Exception:
+            logger.exception(f"Background content refresh failed for key={key}.")
+            self._keep_after_failure(key, epoch, stale_version)
+        else:
+            logger.info(
+                f"Refreshed content key={key} in background in "
+                f"{time.perf_counter() - started:.3f}s."
+            )
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _keep_after_failure(self, key: str, epoch: int, stale_version: int) -> None:
+        # Restart the TTL on the previous value, so a broken source is retried
+        # once per TTL or on its next change, not on every request.
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if epoch == self._epoch and snapshot is not None:
+                self._snapshots[key] = _Snapshot(
+                    value=snapshot.value,
+                    loaded_at=time.monotonic(),
+                    stale_version=stale_version,
+                )
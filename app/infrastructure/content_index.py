@@ -0,0 +1,195 @@
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True)
+class IndexRefreshStats:
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    rebuilt: int = 0
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.added or self.changed or self.removed or self.rebuilt)
+
+
+@dataclass(frozen=True)
+class SlugIndex[T]:
+    """An ordered content snapshot with O(1) slug, position and neighbor lookups."""
+
+    items: tuple[T, ...]
+    by_slug: dict[str, T]
+    positions: dict[str, int]
+    neighbors: dict[str, tuple[T | None, T | None]]
+
+    @classmethod
+    def build(cls, items: tuple[T, ...], slug_of: Callable[[T], str]) -> Self:
+        by_slug: dict[str, T] = {}
+        positions: dict[str, int] = {}
+        neighbors: dict[str, tuple[T | None, T | None]] = {}
+        last = len(items) - 1
+        for position, item in enumerate(items):
+            slug = slug_of(item)
+            # Duplicate slugs resolve to the first item, as a linear scan would.
+            if slug in by_slug:
+                continue
+            by_slug[slug] = item
+            positions[slug] = position
+            neighbors[slug] = (
+                items[position - 1] if position > 0 else None,
+                items[position + 1] if position < last else None,
+            )
+        return cls(items, by_slug, positions, neighbors)
+
+
+@dataclass
+class _IndexEntry[T]:
+    fingerprint: FileFingerprint
+    digest: str
+    item: T | None
+
+
+class ContentIndex[T]:
+    """Per-file memo of built content items for one markdown directory.
+
+    A refresh is a single ``scandir`` pass: files whose mtime and size are
+    unchanged reuse their previous item, touched files are re-hashed and only
+    rebuilt when their bytes differ, and removed files are dropped.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._directory: Path | None = None
+        self._entries: dict[str, _IndexEntry[T]] = {}
+        self._items: tuple[T, ...] = ()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scan(directory: Path) -> dict[str, FileFingerprint]:
+        fingerprints: dict[str, FileFingerprint] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".md") or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    fingerprints[entry.path] = FileFingerprint(
+                        mtime_ns=stat.st_mtime_ns, size=stat.st_size
+                    )
+        except OSError:
+            logger.exception(f"Failed to scan content directory: {directory}")
+        return fingerprints
+
+    @staticmethod
+    def _read(path: Path) -> tuple[str, str] | None:
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            logger.exception(f"Failed to read markdown file: {path}")
+            return None
+        return hashlib.sha256(raw).hexdigest(), raw.decode("utf-8", errors="replace")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._directory = None
+            self._entries = {}
+            self._items = ()
+
+    def refresh(
+        self,
+        directory: Path,
+        build: Callable[[Sequence[tuple[Path, str]]], Sequence[T | None]],
+        *,
+        is_volatile: Callable[[T], bool] | None = None,
+    ) -> tuple[tuple[T, ...], IndexRefreshStats]:
+        """Return items for every ``*.md`` file in reverse filename order.
+
+        ``build`` receives the path and decoded text of every added or changed
+        file in one batch and returns one item per source, or ``None`` to skip
+        a file (for example, invalid frontmatter). Items flagged by
+        ``is_volatile`` depend on data outside the file and are rebuilt on
+        every refresh.
+        """
+        with self._lock:
+            if self._directory != directory:
+                self._directory = directory
+                self._entries = {}
+                self._items = ()
+
+            fingerprints = self._scan(directory)
+            previous = self._entries
+            entries: dict[str, _IndexEntry[T]] = {}
+            pending: list[tuple[_IndexEntry[T], Path, str]] = []
+            added = changed = rebuilt = 0
+
+            for key in sorted(fingerprints, reverse=True):
+                fingerprint = fingerprints[key]
+                entry = previous.get(key)
+                path = Path(key)
+
+                if entry is not None and entry.fingerprint == fingerprint:
+                    if (
+                        entry.item is not None
+                        and is_volatile
+                        and is_volatile(entry.item)
+                    ):
+                        read = self._read(path)
+                        if read is not None:
+                            pending.append((entry, path, read[1]))
+                            rebuilt += 1
+                    entries[key] = entry
+                    continue
+
+                read = self._read(path)
+                if read is None:
+                    continue
+                digest, text = read
+
+                if entry is not None and entry.digest == digest:
+                    entry.fingerprint = fingerprint
+                    entries[key] = entry
+                    continue
+
+                if entry is None:
+                    added += 1
+                else:
+                    changed += 1
+                entries[key] = _IndexEntry(
+                    fingerprint=fingerprint, digest=digest, item=None
+                )
+                pending.append((entries[key], path, text))
+
+            if pending:
+                items = build([(path, text) for _, path, text in pending])
+                for (entry, _, _), item in zip(pending, items, strict=True):
+                    entry.item = item
+
+            removed = len(previous.keys() - entries.keys())
+            stats = IndexRefreshStats(
+                added=added, changed=changed, removed=removed, rebuilt=rebuilt
+            )
+            self._entries = entries
+            if stats.dirty or not self._items:
+                self._items = tuple(
+                    entry.item for entry in entries.values() if entry.item is not None
+                )
+            logger.debug(
+                f"Content index refreshed: index={self._name} files={len(entries)}"
+                f" added={added} changed={changed} removed={removed} rebuilt={rebuilt}"
+            )
+            return self._items, stats
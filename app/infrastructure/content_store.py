@@ -0,0 +1,168 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write ``data`` as JSON via a temporary file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class CacheWriter:
+    """Write JSON cache entries under ``root``, warning once if it is unwritable.
+
+    A read-only or full disk fails every write the same way, so the first
+    failure logs a warning with ``consequence`` and later ones log at debug.
+    """
+
+    def __init__(self, label: str, root: Path | None, consequence: str) -> None:
+        self._label = label
+        self._root = root
+        self._consequence = consequence
+        self._warned = False
+
+    def write(self, path: Path, data: Any) -> None:
+        try:
+            write_json_atomic(path, data)
+        except OSError as exc:
+            if self._warned:
+                logger.debug(f"Failed to write {self._label} entry: {path}")
+                return
+            self._warned = True
+            logger.warning(
+                f"{self._label.capitalize()} under {self._root} is not writable"
+                f" ({exc}); {self._consequence}"
+            )
+        except (TypeError, ValueError):
+            logger.exception(f"Failed to write {self._label} entry: {path}")
+
+
+class CompiledContentStore:
+    """On-disk cache of compiled markdown shared across restarts and workers.
+
+    Entries live under ``<root>/<pipeline_version>/<kind>/<hash>.json``, so a
+    change to the render pipeline starts a fresh namespace instead of serving
+    HTML compiled with old extensions or sanitizer rules. Writes go through a
+    temporary file and ``os.replace`` so concurrent workers never observe a
+    partial entry. ``prune`` drops other pipeline versions and every entry
+    this process has not read or written.
+    """
+
+    def __init__(self, root: Path | None, pipeline_version: str) -> None:
+        self._base = root
+        self._root = root / pipeline_version if root is not None else None
+        self._pipeline_version = pipeline_version
+        self._writer = CacheWriter(
+            "compiled content cache",
+            self._root,
+            "content still renders, but compiled output is not persisted.",
+        )
+        self._used: set[tuple[str, str]] = set()
+        self._used_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._root is not None
+
+    @property
+    def pipeline_version(self) -> str:
+        return self._pipeline_version
+
+    def _entry_path(self, kind: str, source_hash: str) -> Path | None:
+        if self._root is None:
+            return None
+        return self._root / kind / f"{source_hash}.json"
+
+    def get(self, kind: str, source_hash: str) -> dict[str, Any] | None:
+        path = self._entry_path(kind, source_hash)
+        if path is None:
+            return None
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError:
+            logger.exception(f"Failed to read compiled content entry: {path}")
+            return None
+
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            logger.warning(f"Discarding corrupt compiled content entry: {path}")
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != (
+            self._pipeline_version
+        ):
+            return None
+        payload = entry.get("payload")
+        if not isinstance(payload, dict):
+            return None
+        self._mark_used(kind, source_hash)
+        return payload
+
+    def put(self, kind: str, source_hash: str, payload: dict[str, Any]) -> None:
+        path = self._entry_path(kind, source_hash)
+        if path is None:
+            return
+        entry = {"version": self._pipeline_version, "payload": payload}
+        self._mark_used(kind, source_hash)
+        self._writer.write(path, entry)
+
+    def _mark_used(self, kind: str, source_hash: str) -> None:
+        with self._used_lock:
+            self._used.add((kind, source_hash))
+
+    def prune(self, keep: Iterable[tuple[str, str]] = ()) -> int:
+        """Delete other pipeline versions and entries not used since startup.
+
+        Call it once every snapshot has loaded, so the entries still in use
+        have been read or written. ``keep`` lists ``(kind, hash)`` entries
+        that are loaded lazily and must survive. Returns the number of
+        entries and version directories removed.
+        """
+        if self._base is None or self._root is None:
+            return 0
+        with self._used_lock:
+            live = self._used | set(keep)
+
+        removed = 0
+        try:
+            versions = list(self._base.iterdir())
+        except OSError:
+            return 0
+        for version_dir in versions:
+            if version_dir.name != self._pipeline_version and version_dir.is_dir():
+                shutil.rmtree(version_dir, ignore_errors=True)
+                removed += 1
+        for path in self._root.glob("*/*.json"):
+            if (path.parent.name, path.stem) in live:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError:
+                logger.debug(f"Failed to prune compiled content entry: {path}")
+                continue
+            removed += 1
+        if removed:
+            logger.info(
+                f"Pruned {removed} stale compiled content item(s) in {self._base}."
+            )
+        return removed
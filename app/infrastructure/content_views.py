@@ -0,0 +1,177 @@
+import re
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Self
+
+from app.infrastructure.content_index import SlugIndex
+from app.infrastructure.related_posts import nearest_neighbors
+from app.infrastructure.search_index import SearchIndex
+from app.models.models import BlogPost, BlogTag, Project
+
+# Spellings that name the same topic. Keys and values are normalized tag keys.
+TAG_ALIASES: dict[str, str] = {
+    "postgres": "postgresql",
+    "pg": "postgresql",
+    "py": "python",
+    "python3": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "k8s": "kubernetes",
+    "golang": "go",
+    "fast-api": "fastapi",
+}
+
+
+def _slug_of(item: Project | BlogPost) -> str:
+    return item.slug
+
+
+def _featured_first[T: (Project, BlogPost)](items: tuple[T, ...]) -> tuple[T, ...]:
+    return tuple(item for item in items if item.featured) + tuple(
+        item for item in items if not item.featured
+    )
+
+
+def _tag_key(tag: str) -> str:
+    return re.sub(r"[\s_]+", "-", tag.strip().casefold())
+
+
+def normalize_tag(tag: str) -> str:
+    """Map a tag as written to the key it is indexed under, aliases merged."""
+    key = _tag_key(tag)
+    return TAG_ALIASES.get(key, key)
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """Projects in display order plus the views every request derives from them."""
+
+    index: SlugIndex[Project]
+    featured_first: tuple[Project, ...]
+    search: SearchIndex[Project]
+
+    @classmethod
+    def build(cls, projects: tuple[Project, ...], body_texts: Sequence[str]) -> Self:
+        documents = [
+            (
+                (project.title, 3.0),
+                (" ".join((*project.tags, *project.tech_stack)), 2.0),
+                (project.description, 1.5),
+                (body_text, 1.0),
+            )
+            for project, body_text in zip(projects, body_texts, strict=True)
+        ]
+        return cls(
+            index=SlugIndex.build(projects, _slug_of),
+            featured_first=_featured_first(projects),
+            search=SearchIndex(projects, documents),
+        )
+
+
+@dataclass(frozen=True)
+class BlogSnapshot:
+    """Posts newest first plus the views every request derives from them."""
+
+    index: SlugIndex[BlogPost]
+    featured_first: tuple[BlogPost, ...]
+    related: dict[str, tuple[BlogPost, ...]]
+
+    @classmethod
+    def build(
+        cls,
+        posts: tuple[BlogPost, ...],
+        body_texts: Sequence[str] | None = None,
+        *,
+        related_count: int = 3,
+    ) -> Self:
+        if body_texts is None:
+            body_texts = [""] * len(posts)
+        documents = [
+            (
+                (post.title, 2.0),
+                (" ".join(post.tags), 3.0),
+                (post.description, 1.5),
+                (body_text, 1.0),
+            )
+            for post, body_text in zip(posts, body_texts, strict=True)
+        ]
+        neighbors = nearest_neighbors(documents, related_count)
+        return cls(
+            index=SlugIndex.build(posts, _slug_of),
+            featured_first=_featured_first(posts),
+            related={
+                post.slug: tuple(posts[other] for other in others)
+                for post, others in zip(posts, neighbors, strict=True)
+            },
+        )
+
+
+@dataclass(frozen=True)
+class TagEntry:
+    key: str
+    name: str
+    posts: tuple[BlogPost, ...]
+    projects: tuple[Project, ...]
+
+
+@dataclass(frozen=True)
+class TagTaxonomy:
+    """Tags shared by posts and projects, keyed by normalized name.
+
+    Each entry keeps its posting lists in snapshot order, so filtering by tag
+    is one dict lookup. The display name is the most common spelling that is
+    not an alias (``PostgreSQL`` over ``postgres``).
+    """
+
+    entries: dict[str, TagEntry]
+    blog_tags: tuple[BlogTag, ...]
+    project_tags: tuple[str, ...]
+
+    @classmethod
+    def build(cls, projects: Sequence[Project], posts: Sequence[BlogPost]) -> Self:
+        spellings: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        post_lists: defaultdict[str, list[BlogPost]] = defaultdict(list)
+        project_lists: defaultdict[str, list[Project]] = defaultdict(list)
+
+        for item, postings in (
+            *((post, post_lists) for post in posts),
+            *((project, project_lists) for project in projects),
+        ):
+            seen: set[str] = set()
+            for tag in item.tags:
+                name = tag.strip()
+                if not name:
+                    continue
+                key = normalize_tag(name)
+                spellings[key][name] += 1
+                if key not in seen:
+                    seen.add(key)
+                    postings[key].append(item)
+
+        entries = {
+            key: TagEntry(
+                key=key,
+                name=max(
+                    counts,
+                    key=lambda name: (_tag_key(name) == key, counts[name]),
+                ),
+                posts=tuple(post_lists[key]),
+                projects=tuple(project_lists[key]),
+            )
+            for key, counts in spellings.items()
+        }
+        blog_tags = tuple(
+            BlogTag(name=entry.name, count=len(entry.posts))
+            for entry in sorted(
+                (entry for entry in entries.values() if entry.posts),
+                key=lambda entry: (-len(entry.posts), entry.name),
+            )
+        )
+        project_tags = tuple(
+            sorted(entry.name for entry in entries.values() if entry.projects)
+        )
+        return cls(entries, blog_tags, project_tags)
+
+    def get(self, tag: str) -> TagEntry | None:
+        return self.entries.get(normalize_tag(tag))
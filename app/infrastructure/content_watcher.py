@@ -0,0 +1,223 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class _Inotify:
+    """Minimal ctypes binding for Linux inotify, watching a directory tree."""
+
+    def __init__(self, root: Path) -> None:
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.fd = fd
+        self._watches: dict[int, Path] = {}
+        for directory, _, _ in os.walk(root):
+            self._add_watch(Path(directory))
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(directory), ctypes.c_uint32(_WATCH_MASK)
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            logger.warning(
+                f"Failed to watch content directory {directory}: {os.strerror(errno)}"
+            )
+            return
+        self._watches[wd] = directory
+
+    def read_paths(self) -> tuple[set[Path], bool]:
+        """Drain pending events; the flag reports a kernel queue overflow."""
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return set(), False
+
+        paths: set[Path] = set()
+        overflowed = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if mask & _IN_Q_OVERFLOW:
+                overflowed = True
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            path = directory / os.fsdecode(raw_name) if raw_name else directory
+            paths.add(path)
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                self._add_watch(path)
+        return paths, overflowed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _snapshot_tree(root: Path) -> dict[Path, tuple[int, int]]:
+    snapshot: dict[Path, tuple[int, int]] = {}
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = Path(directory) / filename
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class ContentWatcher:
+    """Report changed paths under ``root`` from a background thread.
+
+    Uses inotify on Linux and falls back to periodic stat polling elsewhere.
+    Bursts of events (editors often write, rename and chmod in sequence) are
+    coalesced for ``debounce_seconds`` before ``on_change`` is called with
+    every path touched in the burst. A kernel queue overflow reports ``root``
+    itself so callers can invalidate everything.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        on_change: Callable[[set[Path]], None],
+        *,
+        debounce_seconds: float = 0.2,
+        poll_interval_seconds: float = 1.0,
+    ) -> None:
+        self._root = root
+        self._on_change = on_change
+        self._debounce_seconds = debounce_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify: _Inotify | None = None
+        self._wake_read: int | None = None
+        self._wake_write: int | None = None
+        self._snapshot: dict[Path, tuple[int, int]] = {}
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify is not None else "polling"
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        if sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify(self._root)
+                self._wake_read, self._wake_write = os.pipe()
+            except (OSError, AttributeError):
+                logger.exception("inotify unavailable; falling back to polling.")
+                self._inotify = None
+
+        if self._inotify is None:
+            self._snapshot = _snapshot_tree(self._root)
+        target = self._run_inotify if self._inotify is not None else self._run_polling
+        self._thread = threading.Thread(
+            target=target, name="content-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Content watcher started for {self._root} using backend={self.backend}."
+        )
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        if self._wake_write is not None:
+            os.write(self._wake_write, b"\0")
+        self._thread.join(timeout=5)
+        self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        for fd in (self._wake_read, self._wake_write):
+            if fd is not None:
+                os.close(fd)
+        self._wake_read = self._wake_write = None
+        logger.info("Content watcher stopped.")
+
+    def _emit(self, paths: set[Path]) -> None:
+        if not paths:
+            return
+        try:
+            self._on_change(paths)
+        except Exception:
+            logger.exception("Content watcher change handler failed.")
+
+    def _run_inotify(self) -> None:
+        inotify = self._inotify
+        if inotify is None or self._wake_read is None:
+            return
+        pending: set[Path] = set()
+        while not self._stop.is_set():
+            timeout = self._debounce_seconds if pending else None
+            ready, _, _ = select.select([inotify.fd, self._wake_read], [], [], timeout)
+            if self._stop.is_set():
+                return
+            if not ready:
+                self._emit(pending)
+                pending = set()
+                continue
+            paths, overflowed = inotify.read_paths()
+            pending.update(paths)
+            if overflowed:
+                pending.add(self._root)
+
+    def _run_polling(self) -> None:
+        while not self._stop.wait(self._poll_interval_seconds):
+            current = _snapshot_tree(self._root)
+            snapshot = self._snapshot
+            changed = {
+                path
+                for path in snapshot.keys() | current.keys()
+                if snapshot.get(path) != current.get(path)
+            }
+            self._snapshot = current
+            self._emit(changed)
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from app.core.config import settings
+from app.infrastructure.content_store import CacheWriter
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def github_client() -> httpx.Client:
+    """Return the process-wide keep-alive client used for GitHub requests."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                follow_redirects=True,
+                timeout=float(settings.github_api_timeout_seconds),
+                limits=httpx.Limits(
+                    max_connections=settings.github_fetch_concurrency,
+                    max_keepalive_connections=settings.github_fetch_concurrency,
+                ),
+            )
+        return _client
+
+
+def close_github_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def fetch_concurrently[K: Hashable, V](
+    tasks: dict[K, Callable[[], V]],
+    *,
+    max_workers: int,
+    deadline_seconds: float,
+) -> dict[K, V]:
+    """Run ``tasks`` on a bounded thread pool and return those done by the deadline.
+
+    Keys whose task is still running, or raised, when ``deadline_seconds``
+    elapse are missing from the result so callers can fall back per key.
+    Late tasks are left to finish in the background; the shared client's
+    request timeout bounds how long they can run.
+    """
+    if not tasks:
+        return {}
+
+    started = time.perf_counter()
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(tasks)), thread_name_prefix="gist-fetch"
+    )
+    try:
+        futures = {executor.submit(task): key for key, task in tasks.items()}
+        done, not_done = wait(futures, timeout=deadline_seconds)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results: dict[K, V] = {}
+    for future in done:
+        key = futures[future]
+        try:
+            results[key] = future.result()
+        except Exception:
+            logger.exception(f"Gist fetch failed for key={key}.")
+    if not_done:
+        logger.warning(
+            f"Gist fetch deadline of {deadline_seconds:.1f}s reached with "
+            f"{len(not_done)} of {len(tasks)} request(s) unfinished."
+        )
+    logger.info(
+        f"Fetched {len(results)} of {len(tasks)} gist resource(s) in "
+        f"{time.perf_counter() - started:.3f}s."
+    )
+    return results
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    text: str
+    stale: bool = False
+
+
+class GistResponseCache:
+    """Disk cache of GitHub GET responses revalidated with ETag/Last-Modified.
+
+    A cached entry is sent back as ``If-None-Match``/``If-Modified-Since``, so
+    an unchanged gist costs a 304 that GitHub does not count against the rate
+    limit. When GitHub is unreachable, rate-limited or failing, the last good
+    body is returned with ``stale=True``. A 404 drops the entry.
+    """
+
+    def __init__(self, root: Path | None) -> None:
+        self._root = root
+        self._writer = CacheWriter("gist cache", root, "responses are not persisted.")
+
+    @property
+    def enabled(self) -> bool:
+        return self._root is not None
+
+    def _entry_path(self, url: str, params: dict[str, str] | None) -> Path | None:
+        if self._root is None:
+            return None
+        key = url if not params else f"{url}?{sorted(params.items())}"
+        return self._root / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _read(self, path: Path | None) -> dict[str, str] | None:
+        if path is None:
+            return None
+        try:
+            entry = json.loads(path.read_bytes())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable gist cache entry: {path}")
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("text"), str):
+            return None
+        return entry
+
+    def _write(self, path: Path | None, response: httpx.Response) -> None:
+        if path is None:
+            return
+        entry = {
+            "url": str(response.request.url),
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "text": response.text,
+        }
+        self._writer.write(path, entry)
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        params: dict[str, str] | None = None,
+    ) -> CachedResponse | None:
+        path = self._entry_path(url, params)
+        cached = self._read(path)
+        request_headers = dict(headers)
+        if cached is not None:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            response = github_client().get(url, headers=request_headers, params=params)
+        except httpx.HTTPError:
+            return self._fallback(url, cached, "request failed")
+
+        if response.status_code == 304 and cached is not None:
+            return CachedResponse(200, cached["text"])
+        if response.status_code == 404:
+            if path is not None:
+                path.unlink(missing_ok=True)
+            return CachedResponse(404, "")
+        if response.is_success:
+            self._write(path, response)
+            return CachedResponse(response.status_code, response.text)
+        return self._fallback(url, cached, f"status={response.status_code}")
+
+    def _fallback(
+        self, url: str, cached: dict[str, str] | None, reason: str
+    ) -> CachedResponse | None:
+        if cached is None:
+            logger.warning(f"GitHub request failed for url={url} ({reason}).")
+            return None
+        logger.warning(
+            f"GitHub request failed for url={url} ({reason}); serving cached copy."
+        )
+        return CachedResponse(200, cached["text"], stale=True)
@@ -1,21 +1,46 @@
+import hashlib
+import html
+import importlib.metadata
+import json
 import logging
+import math
 import re
+import sqlite3
 import threading
 from datetime import datetime
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import httpx
 import markdown
 import nh3
-from cachetools import TTLCache, cached
+from cachetools import LRUCache, TTLCache, cached
 from cachetools.keys import hashkey
 from pydantic import ValidationError
 import yaml
 
 from app.core.config import settings
-from app.models.models import BlogComment, BlogPost, Project
+from app.infrastructure.content_artifact import (
+    ContentArtifact,
+    read_content_artifact,
+    write_content_artifact,
+)
+from app.infrastructure.content_cache import SnapshotCache
+from app.infrastructure.content_index import ContentIndex
+from app.infrastructure.content_store import CompiledContentStore
+from app.infrastructure.content_views import (
+    BlogSnapshot,
+    ProjectSnapshot,
+    TagTaxonomy,
+)
+from app.infrastructure.gist_fetch import GistResponseCache, fetch_concurrently
+from app.infrastructure.markdown_engine import CachedHighlightExtension, MarkdownPool
+from app.infrastructure.render_pool import render_batch, resolve_worker_count
+from app.infrastructure.search_store import FullTextIndex, SearchDocument
+from app.models.models import BlogComment, BlogPost, Project, SearchResult
 from app.models.schemas import (
     AboutContent,
     AboutFrontmatter,
@@ -35,16 +60,33 @@ logger = logging.getLogger(__name__)
 _GIST_ID_PATTERN = re.compile(r"^[0-9a-fA-F]{8,40}$")
 
 
-def _parse_frontmatter(filepath: Path) -> tuple[dict[str, Any], str]:
+def _read_markdown_file(filepath: Path) -> str:
     if not filepath.exists():
-        return {}, ""
+        return ""
 
     try:
-        text = filepath.read_text(encoding="utf-8")
+        return filepath.read_text(encoding="utf-8")
     except OSError:
         logger.exception(f"Failed to read markdown file: {filepath}")
+        return ""
+
+
+def _parse_frontmatter(filepath: Path) -> tuple[dict[str, Any], str]:
+    return _split_frontmatter(_read_markdown_file(filepath), filepath)
+
+
+def _parse_source(root: Path, source_path: str) -> tuple[dict[str, Any], str]:
+    """Parse an item's source, stored relative to ``root`` so artifacts move."""
+    if not source_path:
+        return {}, ""
+    filepath = root / source_path
+    if not filepath.is_file():
+        logger.warning(f"Content source not found: {filepath}")
         return {}, ""
+    return _parse_frontmatter(filepath)
+
 
+def _split_frontmatter(text: str, filepath: Path) -> tuple[dict[str, Any], str]:
     if text.startswith("---"):
         parts = text.split("---", 2)
         if len(parts) == 3:
@@ -58,13 +100,22 @@ def _parse_frontmatter(filepath: Path) -> tuple[dict[str, Any], str]:
     return {}, text.strip()
 
 
+_MARKDOWN_EXTENSIONS = ("fenced_code", "codehilite", "tables", "toc", "attr_list")
+
+
+def _build_markdown_engine() -> markdown.Markdown:
+    return markdown.Markdown(
+        extensions=[*_MARKDOWN_EXTENSIONS, CachedHighlightExtension()]
+    )
+
+
+_markdown_pool = MarkdownPool(_build_markdown_engine)
+
+
 def _render_md(content: str) -> str:
     if not content:
         return ""
-    return markdown.markdown(
-        content,
-        extensions=["fenced_code", "codehilite", "tables", "toc", "attr_list"],
-    )
+    return _markdown_pool.convert(content)
 
 
 _NH3_ALLOWED_TAGS = {
@@ -128,6 +179,75 @@ def _sanitize_html(html: str) -> str:
     )
 
 
+# Bump when parsing or rendering changes in a way the inputs below do not
+# capture, so compiled content written by older code is ignored.
+_PIPELINE_REVISION = 2
+
+
+def _pipeline_version() -> str:
+    fingerprint = json.dumps(
+        {
+            "revision": _PIPELINE_REVISION,
+            "extensions": _MARKDOWN_EXTENSIONS,
+            "tags": sorted(_NH3_ALLOWED_TAGS),
+            "attributes": {
+                tag: sorted(attrs) for tag, attrs in sorted(_NH3_ALLOWED_ATTRS.items())
+            },
+            "url_schemes": sorted(_NH3_URL_SCHEMES),
+            "libraries": {
+                name: _package_version(name) for name in ("markdown", "nh3", "pygments")
+            },
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(fingerprint.encode()).hexdigest()[:16]
+
+
+def _package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _source_digest(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _resolve_data_path(setting: str) -> Path | None:
+    """Resolve a path setting: empty disables it, relative is under the project."""
+    raw_path = setting.strip()
+    if not raw_path:
+        return None
+    path = Path(raw_path)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def _build_compiled_store() -> CompiledContentStore:
+    return CompiledContentStore(
+        _resolve_data_path(settings.content_cache_dir), _pipeline_version()
+    )
+
+
+def _build_content_artifact() -> ContentArtifact | None:
+    artifact_path = _resolve_data_path(settings.content_artifact_path)
+    if artifact_path is None:
+        return None
+    return read_content_artifact(artifact_path, _pipeline_version())
+
+
+def _build_search_index() -> FullTextIndex:
+    return FullTextIndex(_resolve_data_path(settings.content_search_index_path))
+
+
+def _build_gist_cache() -> GistResponseCache:
+    return GistResponseCache(_resolve_data_path(settings.github_cache_dir))
+
+
 def _extract_description(markdown_body: str) -> str:
     lines = [line.strip() for line in markdown_body.splitlines() if line.strip()]
     for line in lines:
@@ -143,42 +263,139 @@ _ABOUT_SECTION_PATTERN = re.compile(r"^\s*##\s+(.+?)\s*$")
 _ABOUT_ENTRY_PATTERN = re.compile(r"^\s*###\s+(.+?)\s*$")
 _ABOUT_META_PATTERN = re.compile(r"^\s*\*\*(.+?):\*\*\s*(.+?)\s*$")
 _ABOUT_LIST_PATTERN = re.compile(r"^\s*[-*+]\s+(.+?)\s*$")
+_FENCE_PATTERN = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+_ABOUT_NODE_MARKER_PATTERN = re.compile(
+    r"^<p>about-node-marker-(\d+)</p>$", re.MULTILINE
+)
 
 
 def _normalize_about_key(value: str) -> str:
     return re.sub(r"[^a-z0-9]+", "_", value.strip().lower()).strip("_")
 
 
-def _split_markdown_sections(
-    content: str, heading_pattern: re.Pattern[str]
-) -> tuple[str, list[tuple[str, str]]]:
-    preamble_lines: list[str] = []
-    sections: list[tuple[str, str]] = []
-    current_title = ""
-    current_lines: list[str] = []
+@dataclass
+class _AboutNode:
+    """One heading of ``about.md`` with its own lines and, once rendered, its HTML."""
+
+    title: str
+    lines: list[str] = field(default_factory=list)
+    children: list["_AboutNode"] = field(default_factory=list)
+    metadata: dict[str, str] = field(default_factory=dict)
+    html: str = ""
+
+    @property
+    def markdown(self) -> str:
+        return "\n".join(self.lines).strip()
+
+    @property
+    def full_markdown(self) -> str:
+        """The node's own text followed by its ``###`` entries, as authored."""
+        parts = [self.markdown]
+        parts += [f"### {child.title}\n\n{child.markdown}" for child in self.children]
+        return "\n\n".join(part for part in parts if part)
+
+
+def _build_about_tree(body: str) -> _AboutNode:
+    """Split the body into hero, ``##`` sections and ``###`` entries in one pass.
+
+    Heading lines inside ``` or ~~~ fences are kept as text.
+    """
+    root = _AboutNode("")
+    section: _AboutNode | None = None
+    entry: _AboutNode | None = None
+    fence = ""
+
+    for line in body.splitlines():
+        fence_match = _FENCE_PATTERN.match(line)
+        if fence:
+            # A closing fence repeats the opening character at least as often
+            # and carries no info string.
+            if (
+                fence_match
+                and fence_match.group(1).startswith(fence)
+                and not line.strip().strip(fence[0])
+            ):
+                fence = ""
+            (entry or section or root).lines.append(line)
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            (entry or section or root).lines.append(line)
+            continue
 
-    for line in content.splitlines():
-        match = heading_pattern.match(line)
+        match = _ABOUT_SECTION_PATTERN.match(line)
         if match:
-            if current_title:
-                sections.append((current_title, "\n".join(current_lines).strip()))
-            else:
-                preamble_lines = (
-                    current_lines.copy() if current_lines else preamble_lines
-                )
-            current_title = match.group(1).strip()
-            current_lines = []
+            section = _AboutNode(match.group(1).strip())
+            root.children.append(section)
+            entry = None
+            continue
+        match = _ABOUT_ENTRY_PATTERN.match(line) if section is not None else None
+        if match and section is not None:
+            entry = _AboutNode(match.group(1).strip())
+            section.children.append(entry)
             continue
+        (entry or section or root).lines.append(line)
+
+    return root
+
+
+def _render_about_tree(
+    body: str, root: _AboutNode, targets: Sequence[_AboutNode]
+) -> str:
+    """Render the whole tree in one markdown pass and return the body HTML.
+
+    Only ``targets`` need HTML of their own, so a marker paragraph is placed
+    around each of them and the rendered document is cut back into pieces at
+    those markers. A targeted section keeps its ``###`` entries in its HTML.
+    If the markers do not come back in order (an unclosed fence, say), the
+    body is rendered whole and each target on its own instead.
+    """
+    wanted = {id(node) for node in targets}
+    segments: list[tuple[_AboutNode | None, list[str]]] = []
 
-        if current_title:
-            current_lines.append(line)
+    def _add(node: _AboutNode | None, markdown_text: str) -> None:
+        if node is None and segments and segments[-1][0] is None:
+            segments[-1][1].append(markdown_text)
         else:
-            preamble_lines.append(line)
+            segments.append((node, [markdown_text]))
 
-    if current_title:
-        sections.append((current_title, "\n".join(current_lines).strip()))
+    _add(root, root.markdown)
+    for section in root.children:
+        _add(None, f"## {section.title}")
+        if id(section) in wanted:
+            _add(section, section.full_markdown)
+            continue
+        _add(None, section.markdown)
+        for entry in section.children:
+            content = entry.markdown
+            if id(entry) not in wanted:
+                _add(None, f"### {entry.title}\n\n{content}")
+                continue
+            entry.metadata, body = _extract_about_metadata(content)
+            head = content[: len(content) - len(body)].strip()
+            _add(None, f"### {entry.title}\n\n{head}")
+            _add(entry, body)
+
+    sources = ["\n\n".join(part for part in parts if part) for _, parts in segments]
+    document = "".join(
+        f"{source}\n\nabout-node-marker-{index}\n\n"
+        for index, source in enumerate(sources[:-1])
+    )
+    split = _ABOUT_NODE_MARKER_PATTERN.split(
+        _sanitize_html(_render_md(document + sources[-1]))
+    )
+    if split[1::2] != [str(index) for index in range(len(sources) - 1)]:
+        logger.warning("About markdown did not split cleanly; rendering it whole.")
+        for (node, _), source in zip(segments, sources, strict=True):
+            if node is not None:
+                node.html = _render_sanitized_markdown(source)
+        return _render_sanitized_markdown(body)
 
-    return "\n".join(preamble_lines).strip(), sections
+    pieces = [piece.strip() for piece in split[0::2]]
+    for (node, _), piece_html in zip(segments, pieces, strict=True):
+        if node is not None:
+            node.html = piece_html
+    return "\n".join(piece for piece in pieces if piece)
 
 
 def _extract_about_metadata(content: str) -> tuple[dict[str, str], str]:
@@ -267,103 +484,109 @@ def _render_sanitized_markdown(content: str) -> str:
     return _sanitize_html(_render_md(content))
 
 
-def _parse_about_work_experience(content: str) -> list[WorkExperienceItem]:
-    _, entries = _split_markdown_sections(content, _ABOUT_ENTRY_PATTERN)
+def _parse_about_work_experience(
+    entries: list[_AboutNode],
+) -> list[WorkExperienceItem]:
     items: list[WorkExperienceItem] = []
 
-    for title, entry_content in entries:
-        metadata, body = _extract_about_metadata(entry_content)
-        start_date, end_date = _resolve_period_metadata(metadata)
+    for entry in entries:
+        start_date, end_date = _resolve_period_metadata(entry.metadata)
         items.append(
             WorkExperienceItem(
-                title=title.strip(),
-                company=metadata.get("company", ""),
-                location=metadata.get("location", ""),
+                title=entry.title,
+                company=entry.metadata.get("company", ""),
+                location=entry.metadata.get("location", ""),
                 start_date=start_date,
                 end_date=end_date,
-                content_html=_render_sanitized_markdown(body),
+                content_html=entry.html,
             )
         )
 
     return items
 
 
-def _parse_about_education(content: str) -> list[EducationItem]:
-    _, entries = _split_markdown_sections(content, _ABOUT_ENTRY_PATTERN)
+def _parse_about_education(entries: list[_AboutNode]) -> list[EducationItem]:
     items: list[EducationItem] = []
 
-    for title, entry_content in entries:
-        metadata, body = _extract_about_metadata(entry_content)
-        start_date, end_date = _resolve_period_metadata(metadata)
+    for entry in entries:
+        start_date, end_date = _resolve_period_metadata(entry.metadata)
         items.append(
             EducationItem(
-                school=title.strip(),
-                degree=metadata.get("degree", ""),
+                school=entry.title,
+                degree=entry.metadata.get("degree", ""),
                 start_date=start_date,
                 end_date=end_date,
-                details_html=_render_sanitized_markdown(body),
+                details_html=entry.html,
             )
         )
 
     return items
 
 
-def _parse_about_certificates(content: str) -> list[CertificateItem]:
-    _, entries = _split_markdown_sections(content, _ABOUT_ENTRY_PATTERN)
+def _parse_about_certificates(entries: list[_AboutNode]) -> list[CertificateItem]:
     items: list[CertificateItem] = []
 
-    for title, entry_content in entries:
-        metadata, body = _extract_about_metadata(entry_content)
+    for entry in entries:
         items.append(
             CertificateItem(
-                name=title.strip(),
-                issuer=metadata.get("issuer", ""),
-                date=metadata.get("date", ""),
-                credential_id=metadata.get("credential_id", ""),
-                details_html=_render_sanitized_markdown(body),
+                name=entry.title,
+                issuer=entry.metadata.get("issuer", ""),
+                date=entry.metadata.get("date", ""),
+                credential_id=entry.metadata.get("credential_id", ""),
+                details_html=entry.html,
             )
         )
 
     return items
 
 
-def _parse_about_skill_groups(content: str) -> list[SkillGroupItem]:
-    section_intro, entries = _split_markdown_sections(content, _ABOUT_ENTRY_PATTERN)
+def _parse_about_skill_groups(section: _AboutNode | None) -> list[SkillGroupItem]:
     groups: list[SkillGroupItem] = []
+    if section is None:
+        return groups
 
-    if entries:
-        for title, entry_content in entries:
-            skills = _extract_skill_values(entry_content)
+    if section.children:
+        for entry in section.children:
+            skills = _extract_skill_values(entry.markdown)
             if skills:
-                groups.append(SkillGroupItem(title=title.strip(), skills=skills))
+                groups.append(SkillGroupItem(title=entry.title, skills=skills))
         return groups
 
-    intro_skills = _extract_skill_values(section_intro)
+    intro_skills = _extract_skill_values(section.markdown)
     if intro_skills:
         groups.append(SkillGroupItem(title="Core", skills=intro_skills))
     return groups
 
 
 def _parse_about_body(body: str) -> dict[str, Any]:
-    hero_markdown, sections = _split_markdown_sections(body, _ABOUT_SECTION_PATTERN)
+    tree = _build_about_tree(body)
 
-    section_map = {
-        _normalize_about_key(title): content
-        for title, content in sections
-        if title.strip()
+    # Later sections with the same normalized title win, as authored last.
+    sections = {
+        _normalize_about_key(section.title): section
+        for section in tree.children
+        if section.title
     }
 
+    def _entries(key: str) -> list[_AboutNode]:
+        section = sections.get(key)
+        return section.children if section is not None else []
+
+    about_section = sections.get("about")
+    targets = [tree, *([about_section] if about_section else [])]
+    for key in ("work_experience", "education", "certificates"):
+        targets += _entries(key)
+    body_html = _render_about_tree(body, tree, targets)
     return {
-        "hero_markdown": hero_markdown,
-        "hero_html": _render_sanitized_markdown(hero_markdown),
-        "about_markdown": section_map.get("about", ""),
-        "about_html": _render_sanitized_markdown(section_map.get("about", "")),
-        "work_experience": _parse_about_work_experience(
-            section_map.get("work_experience", "")
-        ),
-        "education": _parse_about_education(section_map.get("education", "")),
-        "certificates": _parse_about_certificates(section_map.get("certificates", "")),
-        "skill_groups": _parse_about_skill_groups(section_map.get("skills", "")),
+        "body_html": body_html,
+        "hero_markdown": tree.markdown,
+        "hero_html": tree.html,
+        "about_markdown": about_section.full_markdown if about_section else "",
+        "about_html": about_section.html if about_section else "",
+        "work_experience": _parse_about_work_experience(_entries("work_experience")),
+        "education": _parse_about_education(_entries("education")),
+        "certificates": _parse_about_certificates(_entries("certificates")),
+        "skill_groups": _parse_about_skill_groups(sections.get("skills")),
     }
 
 
@@ -414,38 +637,27 @@ def _fetch_gist_payload(gist_id: str) -> dict[str, Any] | None:
         return None
 
     url = f"https://api.github.com/gists/{gist_id}"
+    response = _gist_cache.get(url, headers=_github_api_headers())
+    if response is None:
+        return None
+    if response.status_code == 404:
+        logger.warning(f"Gist not found for gist_id={gist_id}.")
+        return None
     try:
-        with httpx.Client(
-            follow_redirects=True,
-            timeout=float(settings.github_api_timeout_seconds),
-        ) as client:
-            response = client.get(url, headers=_github_api_headers())
-        if response.status_code == 404:
-            logger.warning(f"Gist not found for gist_id={gist_id}.")
-            return None
-        response.raise_for_status()
-        payload = response.json()
-        if isinstance(payload, dict):
-            return payload
-    except (httpx.HTTPError, ValueError):
-        logger.exception(f"Failed to fetch gist payload for gist_id={gist_id}.")
-    return None
+        payload = json.loads(response.text)
+    except ValueError:
+        logger.exception(f"Failed to parse gist payload for gist_id={gist_id}.")
+        return None
+    return payload if isinstance(payload, dict) else None
 
 
 def _fetch_gist_raw_content(raw_url: str) -> str:
     if not raw_url:
         return ""
-    try:
-        with httpx.Client(
-            follow_redirects=True,
-            timeout=float(settings.github_api_timeout_seconds),
-        ) as client:
-            response = client.get(raw_url, headers={"User-Agent": "site-app"})
-        response.raise_for_status()
-        return response.text.strip()
-    except httpx.HTTPError:
-        logger.exception(f"Failed to fetch gist raw content from raw_url={raw_url}.")
+    response = _gist_cache.get(raw_url, headers={"User-Agent": "site-app"})
+    if response is None or response.status_code == 404:
         return ""
+    return response.text.strip()
 
 
 def _pick_gist_file(
@@ -511,21 +723,18 @@ def _fetch_gist_comments(gist_id: str) -> tuple[BlogComment, ...]:
         return ()
 
     url = f"https://api.github.com/gists/{gist_id}/comments"
+    response = _gist_cache.get(
+        url,
+        headers=_github_api_headers(),
+        params={"per_page": str(settings.github_gist_comments_limit)},
+    )
+    if response is None:
+        return ()
+    if response.status_code == 404:
+        logger.warning(f"Gist comments not found for gist_id={gist_id}.")
+        return ()
     try:
-        with httpx.Client(
-            follow_redirects=True,
-            timeout=float(settings.github_api_timeout_seconds),
-        ) as client:
-            response = client.get(
-                url,
-                headers=_github_api_headers(),
-                params={"per_page": str(settings.github_gist_comments_limit)},
-            )
-        if response.status_code == 404:
-            logger.warning(f"Gist comments not found for gist_id={gist_id}.")
-            return ()
-        response.raise_for_status()
-        payload = response.json()
+        payload = json.loads(response.text)
         if not isinstance(payload, list):
             return ()
 
@@ -553,11 +762,32 @@ def _fetch_gist_comments(gist_id: str) -> tuple[BlogComment, ...]:
             )
 
         return tuple(comments)
-    except (httpx.HTTPError, ValueError):
-        logger.exception(f"Failed to fetch gist comments for gist_id={gist_id}.")
+    except ValueError:
+        logger.exception(f"Failed to parse gist comments for gist_id={gist_id}.")
         return ()
 
 
+def _fetch_gist_markdown(gist_id: str, file_hint: str) -> str:
+    gist_payload = _fetch_gist_payload(gist_id)
+    if gist_payload is None:
+        return ""
+    return _extract_gist_markdown(gist_payload, file_hint)
+
+
+def _build_comments_cache() -> TTLCache:
+    return TTLCache(maxsize=256, ttl=settings.github_comments_cache_ttl)
+
+
+_comments_cache: TTLCache = _build_comments_cache()
+_comments_lock = threading.Lock()
+
+
+@cached(cache=_comments_cache, key=hashkey, lock=_comments_lock)
+def load_gist_comments(gist_id: str) -> tuple[BlogComment, ...]:
+    """Return the comments of a gist, cached per gist for a short TTL."""
+    return _fetch_gist_comments(gist_id)
+
+
 def _gist_comments_url(gist_url: str) -> str:
     url = gist_url.strip()
     if not url:
@@ -567,30 +797,129 @@ def _gist_comments_url(gist_url: str) -> str:
     return f"{url}#comments"
 
 
-def _build_content_cache() -> TTLCache:
+def _build_content_cache() -> SnapshotCache:
     ttl = settings.markdown_cache_ttl
     if ttl <= 0:
         ttl = 60 * 60 * 24 * 365
-    return TTLCache(maxsize=16, ttl=ttl)
+    return SnapshotCache(ttl_seconds=ttl)
+
+
+_content_cache: SnapshotCache = _build_content_cache()
+_compiled_store: CompiledContentStore = _build_compiled_store()
+_gist_cache: GistResponseCache = _build_gist_cache()
+_content_artifact: ContentArtifact | None = _build_content_artifact()
+_body_cache: LRUCache[str, str] = LRUCache(maxsize=settings.content_body_cache_size)
+_body_lock = threading.Lock()
+_project_index: ContentIndex[Project] = ContentIndex("projects")
+_blog_index: ContentIndex[BlogPost] = ContentIndex("blog")
+
+
+def content_cache_keys_for(path: Path) -> set[str]:
+    """Map a changed path under ``CONTENT_DIR`` to the cache keys it affects."""
+    if path == CONTENT_DIR or CONTENT_DIR not in path.parents:
+        return {"about", "all_projects", "all_blog_posts"}
+    if path == CONTENT_DIR / "about.md":
+        return {"about"}
+    if path == PROJECTS_DIR or PROJECTS_DIR in path.parents:
+        return {"all_projects"}
+    if path == BLOG_DIR or BLOG_DIR in path.parents:
+        return {"all_blog_posts"}
+    return set()
+
+
+def content_generation() -> int:
+    """Return a counter that changes whenever a content snapshot is swapped.
+
+    The snapshots are touched first, so expired ones still schedule their
+    background refresh when every page is served from the page cache.
+    """
+    load_about()
+    load_project_snapshot()
+    load_blog_snapshot()
+    return _content_cache.generation
+
+
+def content_loaded() -> bool:
+    """Whether every content snapshot is in memory, so loads return at once."""
+    return all(
+        key in _content_cache for key in ("about", "all_projects", "all_blog_posts")
+    )
+
+
+def invalidate_content(keys: set[str]) -> None:
+    # Readers keep getting the previous snapshot until the rebuild swaps in.
+    _content_cache.mark_stale(keys)
+    if keys:
+        logger.info(f"Content cache marked stale for keys={sorted(keys)}.")
 
 
-_content_cache: TTLCache = _build_content_cache()
-_cache_lock = threading.Lock()
+def warm_content() -> None:
+    """Build every content snapshot so no request pays for the first load.
 
+    Once all of them have loaded, compiled entries that none of them used are
+    pruned from the compiled store.
+    """
+    warmed = True
+    for loader in (
+        load_about,
+        load_all_projects,
+        load_all_blog_posts,
+        sync_search_index,
+    ):
+        try:
+            loader()
+        except Exception:
+            warmed = False
+            logger.exception(f"Content warm-up failed for {loader.__name__}.")
+    if warmed:
+        prune_compiled_store()
+
+
+def prune_compiled_store() -> int:
+    """Drop compiled entries for old pipeline versions and old content."""
+    # Bodies are compiled lazily, so keep those of every loaded item.
+    digests = {
+        item.body_digest
+        for item in (*load_all_projects(), *load_all_blog_posts())
+        if item.body_digest
+    }
+    return _compiled_store.prune(
+        [(kind, digest) for digest in digests for kind in ("body", "gist")]
+    )
 
-@cached(cache=_content_cache, key=lambda: hashkey("about"), lock=_cache_lock)
+
+def invalidate_content_paths(paths: set[Path]) -> None:
+    keys: set[str] = set()
+    for path in paths:
+        keys |= content_cache_keys_for(path)
+    invalidate_content(keys)
+
+
+@_content_cache.cached("about")
 def load_about() -> AboutContent:
+    if _content_artifact is not None:
+        return _content_artifact.about
+    return _compile_about()
+
+
+def _compile_about() -> AboutContent:
     about_path = CONTENT_DIR / "about.md"
-    meta, body = _parse_frontmatter(about_path)
+    text = _read_markdown_file(about_path)
+    digest = _source_digest(text)
+    compiled = _compiled_store.get("about", digest)
+    if compiled is not None:
+        logger.info(f"About content loaded from compiled cache for {about_path}.")
+        return AboutContent.model_validate(compiled)
+
+    meta, body = _split_frontmatter(text, about_path)
     frontmatter = AboutFrontmatter.model_validate(meta)
     body_markdown = body or "Content coming soon."
     parsed_about = _parse_about_body(body_markdown)
-    sanitized = _render_sanitized_markdown(body_markdown)
     logger.info(f"About content loaded from {about_path}.")
-    return AboutContent(
+    about = AboutContent(
         frontmatter=frontmatter,
         body_markdown=body_markdown,
-        body_html=sanitized,
+        body_html=parsed_about["body_html"],
         hero_markdown=parsed_about["hero_markdown"],
         hero_html=parsed_about["hero_html"],
         about_markdown=parsed_about["about_markdown"],
@@ -600,131 +929,659 @@ def load_about() -> AboutContent:
         certificates=parsed_about["certificates"],
         skill_groups=parsed_about["skill_groups"],
     )
+    _compiled_store.put("about", digest, about.model_dump(mode="json"))
+    return about
 
 
-@cached(cache=_content_cache, key=lambda: hashkey("all_projects"), lock=_cache_lock)
-def load_all_projects() -> tuple[Project, ...]:
+@dataclass
+class _CompileJob:
+    kind: str
+    digest: str
+    payload: dict[str, Any]
+    body_markdown: str
+
+
+def _html_to_text(content_html: str) -> str:
+    return " ".join(html.unescape(re.sub(r"<[^>]+>", " ", content_html)).split())
+
+
+def _estimate_read_time_minutes(content_html: str) -> int:
+    plain_text = re.sub(r"<[^>]+>", " ", content_html)
+    words = [word for word in plain_text.split() if word.strip()]
+    return max(1, math.ceil(len(words) / 220))
+
+
+def _remember_body(body_digest: str, content_html: str) -> None:
+    _compiled_store.put("body", body_digest, {"content_html": content_html})
+    with _body_lock:
+        _body_cache[body_digest] = content_html
+
+
+def _run_compile_jobs(jobs: list[_CompileJob]) -> None:
+    """Render every pending body in one batch and persist the finished entries."""
+    if not jobs:
+        return
+    rendered = render_batch(
+        [job.body_markdown for job in jobs],
+        _render_sanitized_markdown,
+        workers=resolve_worker_count(settings.content_render_workers),
+        min_batch=settings.content_render_parallel_min_batch,
+        chunk_size=settings.content_render_chunk_size,
+    )
+    for job, content_html in zip(jobs, rendered, strict=True):
+        body_digest = _source_digest(job.body_markdown)
+        _remember_body(body_digest, content_html)
+        job.payload["body_digest"] = body_digest
+        job.payload["read_time_minutes"] = _estimate_read_time_minutes(content_html)
+        _compiled_store.put(job.kind, job.digest, job.payload)
+
+
+def _compile_project(
+    md_file: Path, text: str
+) -> tuple[dict[str, Any] | None, _CompileJob | None]:
+    digest = _source_digest(text)
+    compiled = _compiled_store.get("projects", digest)
+    if compiled is not None:
+        return compiled, None
+
+    meta, body = _split_frontmatter(text, md_file)
+    try:
+        frontmatter = ProjectFrontmatter.model_validate(meta)
+    except ValidationError:
+        logger.exception(f"Invalid project frontmatter in file: {md_file}")
+        return None, None
+
+    compiled = {"frontmatter": frontmatter.model_dump(mode="json", by_alias=True)}
+    return compiled, _CompileJob("projects", digest, compiled, body)
+
+
+def _build_projects(sources: Sequence[tuple[Path, str]]) -> list[Project | None]:
+    compiled = [_compile_project(md_file, text) for md_file, text in sources]
+    _run_compile_jobs([job for _, job in compiled if job is not None])
+    return [
+        _project_from_compiled(md_file, payload) if payload is not None else None
+        for (md_file, _), (payload, _) in zip(sources, compiled, strict=True)
+    ]
+
+
+def _project_from_compiled(md_file: Path, compiled: dict[str, Any]) -> Project:
+    frontmatter = ProjectFrontmatter.model_validate(compiled["frontmatter"])
+    resolved_title = frontmatter.title or md_file.stem.replace("-", " ").title()
+    resolved_slug = frontmatter.slug or md_file.stem
+    return Project(
+        slug=resolved_slug,
+        title=resolved_title,
+        description=frontmatter.description,
+        thumbnail=frontmatter.thumbnail,
+        tags=tuple(frontmatter.tags),
+        tech_stack=tuple(frontmatter.tech_stack),
+        github_url=frontmatter.github_url or None,
+        live_url=frontmatter.live_url or None,
+        date=frontmatter.published_date,
+        featured=frontmatter.featured,
+        body_digest=compiled["body_digest"],
+        source_path=md_file.relative_to(PROJECTS_DIR).as_posix(),
+    )
+
+
+def _compile_all_projects() -> tuple[Project, ...]:
     if not PROJECTS_DIR.exists():
         logger.info(
             f"Projects directory {PROJECTS_DIR} not found. Returning empty project list."
         )
+        _project_index.clear()
         return ()
 
-    projects: list[Project] = []
-    for md_file in sorted(PROJECTS_DIR.glob("*.md"), reverse=True):
-        meta, body = _parse_frontmatter(md_file)
-        try:
-            frontmatter = ProjectFrontmatter.model_validate(meta)
-        except ValidationError:
-            logger.exception(f"Invalid project frontmatter in file: {md_file}")
-            continue
+    projects, stats = _project_index.refresh(PROJECTS_DIR, _build_projects)
+    logger.info(
+        f"Loaded {len(projects)} project(s) from {PROJECTS_DIR}"
+        f" (added={stats.added} changed={stats.changed} removed={stats.removed})."
+    )
+    return projects
 
-        resolved_title = frontmatter.title or md_file.stem.replace("-", " ").title()
-        resolved_slug = frontmatter.slug or md_file.stem
-        projects.append(
-            Project(
-                slug=resolved_slug,
-                title=resolved_title,
-                description=frontmatter.description,
-                content_html=_sanitize_html(_render_md(body)),
-                thumbnail=frontmatter.thumbnail,
-                tags=tuple(frontmatter.tags),
-                tech_stack=tuple(frontmatter.tech_stack),
-                github_url=frontmatter.github_url or None,
-                live_url=frontmatter.live_url or None,
-                date=frontmatter.published_date,
-                featured=frontmatter.featured,
-            )
-        )
-    logger.info(f"Loaded {len(projects)} project(s) from {PROJECTS_DIR}.")
-    return tuple(projects)
+
+# The last snapshot built, so a refresh that finds no changes can return it
+# as is instead of re-reading every source and rebuilding its search index.
+_project_snapshot: ProjectSnapshot | None = None
+
+
+@_content_cache.cached("all_projects")
+def load_project_snapshot() -> ProjectSnapshot:
+    global _project_snapshot
+    if _content_artifact is not None:
+        projects = _content_artifact.projects
+    else:
+        projects = _compile_all_projects()
+    previous = _project_snapshot
+    if previous is not None and previous.index.items == projects:
+        return previous
+    # Search indexes the markdown source; it reads files but renders nothing.
+    body_texts = [
+        _parse_source(PROJECTS_DIR, project.source_path)[1] for project in projects
+    ]
+    _project_snapshot = ProjectSnapshot.build(projects, body_texts)
+    return _project_snapshot
+
+
+def load_all_projects() -> tuple[Project, ...]:
+    return load_project_snapshot().index.items
 
 
 def get_project_by_slug(slug: str) -> Project | None:
-    project = next(
-        (project for project in load_all_projects() if project.slug == slug), None
-    )
+    project = load_project_snapshot().index.by_slug.get(slug)
     if project is None:
         logger.info(f"Project not found for slug={slug}.")
     return project
 
 
-@cached(cache=_content_cache, key=lambda: hashkey("all_blog_posts"), lock=_cache_lock)
-def load_all_blog_posts() -> tuple[BlogPost, ...]:
-    if not BLOG_DIR.exists():
-        logger.info(f"Blog directory {BLOG_DIR} not found. Returning empty post list.")
-        return ()
+def _compile_gist_body(body_markdown: str) -> dict[str, Any]:
+    digest = _source_digest(body_markdown)
+    compiled = _compiled_store.get("gist", digest)
+    body_missing = not _has_body(digest)
+    if compiled is not None and not body_missing:
+        return compiled
+
+    # Detail pages never fetch a gist, so every refresh puts back a body that
+    # was evicted or never persisted.
+    content_html = _render_sanitized_markdown(body_markdown)
+    _remember_body(digest, content_html)
+    if body_missing:
+        # Pages cached meanwhile show the placeholder under a snapshot that
+        # still compares equal, so retire them with the generation.
+        _content_cache.advance_generation()
+    if compiled is None:
+        compiled = {
+            "body_digest": digest,
+            "description": _extract_description(body_markdown),
+            "read_time_minutes": _estimate_read_time_minutes(content_html),
+        }
+        _compiled_store.put("gist", digest, compiled)
+    return compiled
+
+
+def _compile_blog_post(
+    md_file: Path, text: str
+) -> tuple[dict[str, Any] | None, _CompileJob | None]:
+    digest = _source_digest(text)
+    compiled = _compiled_store.get("blog", digest)
+    if compiled is not None:
+        return compiled, None
+
+    meta, body = _split_frontmatter(text, md_file)
+    try:
+        frontmatter = BlogPostFrontmatter.model_validate(meta)
+    except ValidationError:
+        logger.exception(f"Invalid blog post frontmatter in file: {md_file}")
+        return None, None
+
+    # Posts without a local body are resolved from their gist at build time,
+    # so only the frontmatter is stored for them here.
+    body_markdown = body.strip()
+    compiled = {
+        "frontmatter": frontmatter.model_dump(mode="json", by_alias=True),
+        "has_body": bool(body_markdown),
+        "description": _extract_description(body_markdown) if body_markdown else "",
+    }
+    if not body_markdown:
+        _compiled_store.put("blog", digest, compiled)
+        return compiled, None
+    return compiled, _CompileJob("blog", digest, compiled, body_markdown)
 
-    posts: list[BlogPost] = []
-    for md_file in sorted(BLOG_DIR.glob("*.md"), reverse=True):
-        meta, body = _parse_frontmatter(md_file)
-        try:
-            frontmatter = BlogPostFrontmatter.model_validate(meta)
-        except ValidationError:
-            logger.exception(f"Invalid blog post frontmatter in file: {md_file}")
-            continue
 
-        if frontmatter.draft and not settings.debug:
-            logger.info(f"Skipping draft blog post in file: {md_file}")
+def _fetch_gist_bodies(compiled: Sequence[dict[str, Any] | None]) -> dict[str, str]:
+    """Fetch the bodies of gist-only posts in a batch under one deadline."""
+    tasks: dict[str, Callable[[], str]] = {}
+    for payload in compiled:
+        if payload is None or payload["has_body"]:
             continue
+        frontmatter = payload["frontmatter"]
+        gist_id = _extract_gist_id(str(frontmatter.get("gist_url") or "").strip())
+        if gist_id:
+            file_hint = str(frontmatter.get("gist_file") or "")
+            tasks[gist_id] = partial(_fetch_gist_markdown, gist_id, file_hint)
+
+    return fetch_concurrently(
+        tasks,
+        max_workers=settings.github_fetch_concurrency,
+        deadline_seconds=settings.github_fetch_deadline_seconds,
+    )
 
-        resolved_title = frontmatter.title or md_file.stem.replace("-", " ").title()
-        resolved_slug = frontmatter.slug or md_file.stem
-        gist_url = frontmatter.gist_url.strip()
-        gist_id = _extract_gist_id(gist_url)
-        if gist_url and not gist_id:
-            logger.warning(
-                f"Invalid gist_url for blog post slug={resolved_slug}: gist_url={gist_url}"
-            )
 
-        body_markdown = body.strip()
-        if not body_markdown and gist_id:
-            gist_payload = _fetch_gist_payload(gist_id)
-            if gist_payload is not None:
-                body_markdown = _extract_gist_markdown(
-                    gist_payload, frontmatter.gist_file
-                )
+def _build_blog_posts(sources: Sequence[tuple[Path, str]]) -> list[BlogPost | None]:
+    compiled = [_compile_blog_post(md_file, text) for md_file, text in sources]
+    _run_compile_jobs([job for _, job in compiled if job is not None])
+    gist_bodies = _fetch_gist_bodies([payload for payload, _ in compiled])
+    return [
+        _blog_post_from_compiled(md_file, payload, gist_bodies)
+        if payload is not None
+        else None
+        for (md_file, _), (payload, _) in zip(sources, compiled, strict=True)
+    ]
+
+
+def _blog_post_from_compiled(
+    md_file: Path, compiled: dict[str, Any], gist_bodies: dict[str, str]
+) -> BlogPost | None:
+    frontmatter = BlogPostFrontmatter.model_validate(compiled["frontmatter"])
+    if frontmatter.draft and not settings.debug:
+        logger.info(f"Skipping draft blog post in file: {md_file}")
+        return None
+
+    resolved_title = frontmatter.title or md_file.stem.replace("-", " ").title()
+    resolved_slug = frontmatter.slug or md_file.stem
+    gist_url = frontmatter.gist_url.strip()
+    gist_id = _extract_gist_id(gist_url)
+    if gist_url and not gist_id:
+        logger.warning(
+            f"Invalid gist_url for blog post slug={resolved_slug}: gist_url={gist_url}"
+        )
+
+    if compiled["has_body"]:
+        rendered = compiled
+    else:
+        # A gist missing from the results failed or missed the fetch deadline.
+        body_markdown = gist_bodies.get(gist_id, "")
         if not body_markdown:
             body_markdown = "Content coming soon."
+        rendered = _compile_gist_body(body_markdown)
 
-        resolved_description = (
-            frontmatter.description.strip()
-            if frontmatter.description.strip()
-            else _extract_description(body_markdown)
-        )
-        comments = _fetch_gist_comments(gist_id) if gist_id else ()
-        resolved_discussion_url = frontmatter.discussion_url.strip()
-        if gist_url:
-            resolved_discussion_url = _gist_comments_url(gist_url)
-
-        posts.append(
-            BlogPost(
-                slug=resolved_slug,
-                title=resolved_title,
-                description=resolved_description,
-                content_html=_sanitize_html(_render_md(body_markdown)),
-                tags=tuple(frontmatter.tags),
-                author=frontmatter.author.strip(),
-                discussion_url=resolved_discussion_url,
-                gist_url=gist_url,
-                gist_id=gist_id,
-                comments=comments,
-                date=frontmatter.published_date,
-                featured=frontmatter.featured,
-            )
-        )
+    resolved_description = (
+        frontmatter.description.strip()
+        if frontmatter.description.strip()
+        else rendered["description"]
+    )
+    resolved_discussion_url = frontmatter.discussion_url.strip()
+    if gist_url:
+        resolved_discussion_url = _gist_comments_url(gist_url)
+
+    return BlogPost(
+        slug=resolved_slug,
+        title=resolved_title,
+        description=resolved_description,
+        tags=tuple(frontmatter.tags),
+        author=frontmatter.author.strip(),
+        discussion_url=resolved_discussion_url,
+        gist_url=gist_url,
+        gist_id=gist_id,
+        date=frontmatter.published_date,
+        featured=frontmatter.featured,
+        read_time_minutes=rendered["read_time_minutes"],
+        body_digest=rendered["body_digest"],
+        source_path=md_file.relative_to(BLOG_DIR).as_posix(),
+    )
 
+
+def _is_gist_backed(post: BlogPost) -> bool:
+    # Gist bodies live on GitHub, so an unchanged file is not enough to reuse
+    # the previously built post.
+    return bool(post.gist_id)
+
+
+def _compile_all_blog_posts() -> tuple[BlogPost, ...]:
+    if not BLOG_DIR.exists():
+        logger.info(f"Blog directory {BLOG_DIR} not found. Returning empty post list.")
+        _blog_index.clear()
+        return ()
+
+    posts, stats = _blog_index.refresh(
+        BLOG_DIR, _build_blog_posts, is_volatile=_is_gist_backed
+    )
+    # Index items arrive in filename order, which usually tracks publish
+    # order, so this sort is close to linear and only runs on a cache miss.
     sorted_posts = sorted(
         posts,
         key=lambda post: (post.date is not None, post.date, post.slug),
         reverse=True,
     )
-    logger.info(f"Loaded {len(sorted_posts)} blog post(s) from {BLOG_DIR}.")
+    logger.info(
+        f"Loaded {len(sorted_posts)} blog post(s) from {BLOG_DIR}"
+        f" (added={stats.added} changed={stats.changed} removed={stats.removed})."
+    )
     return tuple(sorted_posts)
 
 
+# Like ``_project_snapshot``, keyed by the related-posts count it was built with.
+_blog_snapshot: tuple[int, BlogSnapshot] | None = None
+
+
+@_content_cache.cached("all_blog_posts")
+def load_blog_snapshot() -> BlogSnapshot:
+    global _blog_snapshot
+    if _content_artifact is not None:
+        posts = _content_artifact.blog_posts
+    else:
+        posts = _compile_all_blog_posts()
+    related_count = settings.content_related_posts
+    previous = _blog_snapshot
+    # Posts carry their body digest, so equal posts mean equal related posts.
+    if (
+        previous is not None
+        and previous[0] == related_count
+        and previous[1].index.items == posts
+    ):
+        return previous[1]
+    # Related posts compare the markdown source; gist-only posts fall back to
+    # their title, tags and description.
+    body_texts = [_parse_source(BLOG_DIR, post.source_path)[1] for post in posts]
+    snapshot = BlogSnapshot.build(posts, body_texts, related_count=related_count)
+    _blog_snapshot = (related_count, snapshot)
+    return snapshot
+
+
+def get_related_blog_posts(slug: str) -> tuple[BlogPost, ...]:
+    return load_blog_snapshot().related.get(slug, ())
+
+
+def load_all_blog_posts() -> tuple[BlogPost, ...]:
+    return load_blog_snapshot().index.items
+
+
 def get_blog_post_by_slug(slug: str) -> BlogPost | None:
-    post = next((post for post in load_all_blog_posts() if post.slug == slug), None)
+    post = load_blog_snapshot().index.by_slug.get(slug)
     if post is None:
         logger.info(f"Blog post not found for slug={slug}.")
     return post
+
+
+def get_adjacent_blog_posts(slug: str) -> tuple[BlogPost | None, BlogPost | None]:
+    return load_blog_snapshot().index.neighbors.get(slug, (None, None))
+
+
+_taxonomy: tuple[ProjectSnapshot, BlogSnapshot, TagTaxonomy] | None = None
+_taxonomy_lock = threading.Lock()
+
+
+def load_tagged_snapshots() -> tuple[ProjectSnapshot, BlogSnapshot, TagTaxonomy]:
+    """Return the project and blog snapshots with the tag index built from them.
+
+    Callers that combine tag posting lists with snapshot views read all three
+    from here, so a swap between loads cannot mix two generations. The index is
+    rebuilt only when either snapshot object has been swapped.
+    """
+    global _taxonomy
+    projects = load_project_snapshot()
+    posts = load_blog_snapshot()
+    with _taxonomy_lock:
+        if (
+            _taxonomy is None
+            or _taxonomy[0] is not projects
+            or _taxonomy[1] is not posts
+        ):
+            taxonomy = TagTaxonomy.build(projects.index.items, posts.index.items)
+            _taxonomy = (projects, posts, taxonomy)
+        return _taxonomy
+
+
+def load_tag_taxonomy() -> TagTaxonomy:
+    """Return the tag index for the current project and blog snapshots."""
+    return load_tagged_snapshots()[2]
+
+
+def _stored_body(body_digest: str) -> str | None:
+    if _content_artifact is not None:
+        content_html = _content_artifact.body(body_digest)
+        if content_html is not None:
+            return content_html
+    stored = _compiled_store.get("body", body_digest)
+    if stored is not None and isinstance(stored.get("content_html"), str):
+        return stored["content_html"]
+    return None
+
+
+def _has_body(body_digest: str) -> bool:
+    with _body_lock:
+        if body_digest in _body_cache:
+            return True
+    return _stored_body(body_digest) is not None
+
+
+def _load_body(body_digest: str, read_markdown: Callable[[], str]) -> str:
+    with _body_lock:
+        content_html = _body_cache.get(body_digest)
+    if content_html is not None:
+        return content_html
+
+    content_html = _stored_body(body_digest)
+    if content_html is None:
+        body_markdown = read_markdown()
+        content_html = _render_sanitized_markdown(body_markdown)
+        if _source_digest(body_markdown) != body_digest:
+            # The source changed since the snapshot was built; serve the new
+            # body but do not file it under the old digest.
+            return content_html
+        _compiled_store.put("body", body_digest, {"content_html": content_html})
+
+    with _body_lock:
+        _body_cache[body_digest] = content_html
+    return content_html
+
+
+def _read_blog_body_markdown(post: BlogPost, *, fetch_gist: bool) -> str:
+    meta, body = _parse_source(BLOG_DIR, post.source_path)
+    if body:
+        return body
+    gist_markdown = ""
+    if post.gist_id and fetch_gist:
+        gist_markdown = _fetch_gist_markdown(
+            post.gist_id, str(meta.get("gist_file") or "")
+        )
+    elif post.gist_id:
+        # The blog refresh fetches the gist and stores its body off the
+        # request path; until then the placeholder is served uncached.
+        logger.info(f"Gist body not cached for slug={post.slug}; refreshing.")
+        invalidate_content({"all_blog_posts"})
+        load_blog_snapshot()
+    return gist_markdown or "Content coming soon."
+
+
+def load_project_body(project: Project) -> str:
+    """Return rendered project HTML from the body LRU, rendering it on a miss."""
+    return _load_body(
+        project.body_digest,
+        lambda: _parse_source(PROJECTS_DIR, project.source_path)[1],
+    )
+
+
+def load_blog_post_body(post: BlogPost, *, fetch_gist: bool = False) -> str:
+    """Return rendered post HTML from the body LRU, rendering it on a miss.
+
+    A gist-only body that is not cached is fetched from GitHub only with
+    ``fetch_gist``; otherwise a placeholder is returned and the blog snapshot
+    is refreshed in the background.
+    """
+    return _load_body(
+        post.body_digest,
+        lambda: _read_blog_body_markdown(post, fetch_gist=fetch_gist),
+    )
+
+
+def _about_search_documents(
+    about: AboutContent,
+) -> list[tuple[SearchDocument, str]]:
+    entries = [
+        (
+            "about",
+            about.frontmatter.name or "About",
+            about.frontmatter.role,
+            f"{about.hero_html}\n{about.about_html}",
+        )
+    ]
+    entries += [
+        (
+            f"about:experience:{index}",
+            f"{item.title} at {item.company}" if item.company else item.title,
+            item.location,
+            item.content_html,
+        )
+        for index, item in enumerate(about.work_experience)
+    ]
+    entries += [
+        (f"about:education:{index}", item.school, item.degree, item.details_html)
+        for index, item in enumerate(about.education)
+    ]
+    entries += [
+        (f"about:certificate:{index}", item.name, item.issuer, item.details_html)
+        for index, item in enumerate(about.certificates)
+    ]
+    return [
+        (
+            SearchDocument(
+                key=key,
+                kind="about",
+                title=title,
+                url="/about",
+                tags=tags,
+                body_digest=_source_digest(body_html),
+            ),
+            body_html,
+        )
+        for key, title, tags, body_html in entries
+    ]
+
+
+_search_index = _build_search_index()
+_search_synced: tuple[object, ...] = ()
+_search_sync_lock = threading.Lock()
+_search_sync_thread: threading.Thread | None = None
+_search_sync_again = False
+_search_schedule_lock = threading.Lock()
+
+
+def sync_search_index() -> None:
+    """Bring the full-text index in line with the current content snapshots.
+
+    Documents are matched by digest, so only new or edited entries load their
+    rendered body; nothing happens while the snapshots are unchanged.
+    """
+    global _search_synced
+    about = load_about()
+    projects = load_project_snapshot()
+    posts = load_blog_snapshot()
+    sources = (about, projects, posts)
+    with _search_sync_lock:
+        if len(_search_synced) == len(sources) and all(
+            synced is source for synced, source in zip(_search_synced, sources)
+        ):
+            return
+
+        bodies: dict[str, Callable[[], str]] = {}
+        documents: list[SearchDocument] = []
+        for document, body_html in _about_search_documents(about):
+            documents.append(document)
+            bodies[document.key] = partial(str, body_html)
+        for project in projects.index.items:
+            key = f"project:{project.slug}"
+            documents.append(
+                SearchDocument(
+                    key=key,
+                    kind="project",
+                    title=project.title,
+                    url=f"/projects/{project.slug}",
+                    tags=" ".join((*project.tags, *project.tech_stack)),
+                    body_digest=project.body_digest,
+                )
+            )
+            bodies[key] = partial(load_project_body, project)
+        for post in posts.index.items:
+            key = f"post:{post.slug}"
+            documents.append(
+                SearchDocument(
+                    key=key,
+                    kind="post",
+                    title=post.title,
+                    url=f"/blog/posts/{post.slug}",
+                    tags=" ".join(post.tags),
+                    body_digest=post.body_digest,
+                )
+            )
+            # The index keeps a body until its digest changes, so it must
+            # not store the placeholder of an uncached gist.
+            bodies[key] = partial(load_blog_post_body, post, fetch_gist=True)
+
+        try:
+            _search_index.sync(
+                documents, lambda document: _html_to_text(bodies[document.key]())
+            )
+        except sqlite3.Error:
+            # Left unsynced, so the next search tries again.
+            logger.exception("Search index sync failed.")
+            return
+        _search_synced = sources
+
+
+def _search_index_current() -> bool:
+    sources = (load_about(), load_project_snapshot(), load_blog_snapshot())
+    synced = _search_synced
+    return len(synced) == len(sources) and all(
+        synced_source is source for synced_source, source in zip(synced, sources)
+    )
+
+
+def schedule_search_sync() -> None:
+    """Sync the full-text index on a background thread.
+
+    Calls made while a sync runs coalesce into one more pass after it.
+    """
+    global _search_sync_thread, _search_sync_again
+    with _search_schedule_lock:
+        if _search_sync_thread is not None:
+            _search_sync_again = True
+            return
+        _search_sync_thread = threading.Thread(
+            target=_run_search_syncs, name="search-sync", daemon=True
+        )
+        _search_sync_thread.start()
+
+
+def _run_search_syncs() -> None:
+    global _search_sync_thread, _search_sync_again
+    while True:
+        try:
+            sync_search_index()
+        except Exception:
+            logger.exception("Background search index sync failed.")
+        with _search_schedule_lock:
+            if not _search_sync_again:
+                _search_sync_thread = None
+                return
+            _search_sync_again = False
+
+
+def _sync_search_after_swap(key: str) -> None:
+    # Until the warm-up or a first search has built the index, there is
+    # nothing to keep in line.
+    if _search_synced:
+        schedule_search_sync()
+
+
+_content_cache.add_listener(_sync_search_after_swap)
+
+
+def search_content(query: str, *, limit: int = 20) -> tuple[SearchResult, ...]:
+    """Search posts, projects and the about page, best match first.
+
+    This only queries the index. The warm-up and every snapshot swap sync it
+    off the request path; an index found behind schedules that sync too.
+    """
+    if not _search_index_current():
+        schedule_search_sync()
+    return _search_index.search(query, limit=limit)
+
+
+def compile_content_artifact(path: Path) -> ContentArtifact:
+    """Run the full pipeline once, ignoring any loaded artifact, and write it to ``path``."""
+    projects = _compile_all_projects()
+    blog_posts = _compile_all_blog_posts()
+    bodies = {project.body_digest: load_project_body(project) for project in projects}
+    bodies |= {
+        post.body_digest: load_blog_post_body(post, fetch_gist=True)
+        for post in blog_posts
+    }
+    artifact = ContentArtifact(
+        pipeline_version=_pipeline_version(),
+        about=_compile_about(),
+        projects=projects,
+        blog_posts=blog_posts,
+    )
+    write_content_artifact(path, artifact, bodies)
+    return artifact
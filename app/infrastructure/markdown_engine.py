@@ -0,0 +1,142 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+import markdown
+from markdown.extensions import Extension, fenced_code
+from markdown.preprocessors import Preprocessor
+
+from app.core.config import settings
+from app.observability.metrics import get_app_metrics
+
+
+class MarkdownPool:
+    """Thread-safe pool of preconfigured ``Markdown`` instances.
+
+    Building a ``Markdown`` object registers every extension, which costs more
+    than converting a short document. Instances are checked out by one thread
+    at a time and ``reset()`` after each conversion so no state (toc ids,
+    footnotes, references) leaks into the next document. At most ``max_idle``
+    instances are kept between uses; extra ones built under contention are
+    dropped.
+    """
+
+    def __init__(
+        self, factory: Callable[[], markdown.Markdown], *, max_idle: int = 8
+    ) -> None:
+        self._factory = factory
+        self._max_idle = max_idle
+        self._idle: list[markdown.Markdown] = []
+        self._lock = threading.Lock()
+
+    def convert(self, text: str) -> str:
+        with self._lock:
+            engine = self._idle.pop() if self._idle else None
+        if engine is None:
+            engine = self._factory()
+        try:
+            return engine.convert(text)
+        finally:
+            engine.reset()
+            with self._lock:
+                if len(self._idle) < self._max_idle:
+                    self._idle.append(engine)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
+
+
+class HighlightCache:
+    """Bounded LRU of highlighted code blocks keyed by a hash of their inputs."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        get_app_metrics().record_highlight_cache(hit=html is not None)
+        return html
+
+    def put(self, key: str, html: str) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+highlight_cache = HighlightCache(settings.content_highlight_cache_size)
+
+
+class _CachedFencedCodePreprocessor(Preprocessor):
+    """Serve fenced code blocks from ``highlight_cache`` before ``fenced_code`` runs.
+
+    A miss is handed on its own to the instance's stock fenced-code
+    preprocessor, and the HTML it stashes is cached, so the output is exactly
+    what the extension would produce.
+    """
+
+    def run(self, lines: list[str]) -> list[str]:
+        fenced = self.md.preprocessors["fenced_code_block"]
+        if not isinstance(fenced, fenced_code.FencedBlockPreprocessor):
+            return lines
+        if not fenced.checked_for_deps:
+            # Loads the codehilite and attr_list settings used below.
+            fenced.run([])
+        options = json.dumps(
+            [fenced.config, fenced.codehilite_conf, fenced.use_attr_list],
+            default=repr,
+            sort_keys=True,
+        )
+        stash = self.md.htmlStash
+        text = "\n".join(lines)
+        index = 0
+        while match := fenced.FENCED_BLOCK_RE.search(text, index):
+            block = match.group(0)
+            key = hashlib.sha256(f"{options}\0{block}".encode()).hexdigest()
+            html = highlight_cache.get(key)
+            if html is None:
+                stored = stash.html_counter
+                fenced.run(block.split("\n"))
+                html = str(stash.rawHtmlBlocks[stored])
+                placeholder = stash.get_placeholder(stored)
+                highlight_cache.put(key, html)
+            else:
+                placeholder = stash.store(html)
+            text = f"{text[: match.start()]}\n{placeholder}\n{text[match.end() :]}"
+            index = match.start() + 1 + len(placeholder)
+        return text.split("\n")
+
+
+class CachedHighlightExtension(Extension):
+    """Reuse highlighted fenced code blocks on the ``Markdown`` it is added to."""
+
+    def extendMarkdown(self, md: markdown.Markdown) -> None:
+        # Just before fenced_code (25), after whitespace normalization (30).
+        md.preprocessors.register(
+            _CachedFencedCodePreprocessor(md), "cached_fenced_code_block", 26
+        )
@@ -0,0 +1,171 @@
+import math
+from collections import Counter
+from collections.abc import Sequence
+from itertools import repeat
+
+import numpy as np
+
+from app.infrastructure.search_index import tokenize
+
+# Terms in more than this share of documents say little about topic and would
+# dominate the products, so they are dropped like stop words. Below four
+# documents the cutoff would leave no term that two documents share.
+_MAX_DOCUMENT_FREQUENCY = 0.5
+_MIN_DOCUMENTS_FOR_FREQUENCY_CUTOFF = 4
+# Each vector keeps only its highest-weighted terms. The tail barely moves the
+# cosine but multiplies the work of the product.
+_MAX_TERMS_PER_DOCUMENT = 32
+# Scores are accumulated a block of rows at a time, so peak memory stays near
+# this many float64 scores and expanded postings regardless of corpus size.
+_BLOCK_CELLS = 1 << 20
+
+
+def nearest_neighbors(
+    documents: Sequence[Sequence[tuple[str, float]]], k: int
+) -> tuple[tuple[int, ...], ...]:
+    """Return the ``k`` most similar documents to each one, by TF-IDF cosine.
+
+    Documents are weighted ``(text, weight)`` fields, as in ``SearchIndex``.
+    Vectors use sublinear term frequency and smoothed IDF, keep only their top
+    terms, and are L2-normalized. Similarities are the sparse product
+    ``X @ X.T``, computed in NumPy one block of rows at a time. Ties go to the
+    earlier document.
+    """
+    count = len(documents)
+    if k <= 0 or count < 2:
+        return tuple(() for _ in documents)
+
+    frequencies: list[Counter[str]] = []
+    document_frequency: Counter[str] = Counter()
+    for fields in documents:
+        frequency: Counter[str] = Counter()
+        for text, weight in fields:
+            for term, seen in Counter(tokenize(text)).items():
+                frequency[term] += seen * weight
+        frequencies.append(frequency)
+        document_frequency.update(frequency.keys())
+
+    max_documents = count
+    if count >= _MIN_DOCUMENTS_FOR_FREQUENCY_CUTOFF:
+        max_documents = int(count * _MAX_DOCUMENT_FREQUENCY)
+    term_ids: dict[str, int] = {}
+    idf_values: list[float] = []
+    for term, seen in document_frequency.items():
+        if seen <= max_documents:
+            term_ids[term] = len(idf_values)
+            idf_values.append(math.log((1 + count) / (1 + seen)) + 1)
+    idf = np.asarray(idf_values, dtype=np.float64)
+
+    row_terms: list[np.ndarray] = []
+    row_values: list[np.ndarray] = []
+    row_ptr = [0]
+    for frequency in frequencies:
+        ids = np.fromiter(
+            map(term_ids.get, frequency, repeat(-1)),
+            dtype=np.int64,
+            count=len(frequency),
+        )
+        values = np.fromiter(frequency.values(), dtype=np.float64, count=len(frequency))
+        kept = (ids >= 0) & (values > 0)
+        ids = ids[kept]
+        weights = (1 + np.log(values[kept])) * idf[ids]
+        top = np.argsort(-weights, kind="stable")[:_MAX_TERMS_PER_DOCUMENT]
+        ids, weights = ids[top], weights[top]
+        norm = math.sqrt(float(weights @ weights))
+        if not norm:
+            ids, weights, norm = ids[:0], weights[:0], 1.0
+        row_terms.append(ids)
+        row_values.append(weights / norm)
+        row_ptr.append(row_ptr[-1] + len(ids))
+
+    rows = _CsrRows(
+        np.asarray(row_ptr, dtype=np.int64),
+        np.concatenate(row_terms),
+        np.concatenate(row_values),
+        term_count=len(term_ids),
+    )
+    neighbors: list[tuple[int, ...]] = []
+    for start, stop in rows.blocks(count):
+        neighbors.extend(_top_k(rows.scores(start, stop), k))
+    return tuple(neighbors)
+
+
+class _CsrRows:
+    """Document vectors in CSR form plus the same entries grouped by term."""
+
+    def __init__(
+        self,
+        row_ptr: np.ndarray,
+        terms: np.ndarray,
+        values: np.ndarray,
+        *,
+        term_count: int,
+    ) -> None:
+        self.row_ptr = row_ptr
+        self.terms = terms
+        self.values = values
+        entry_rows = np.repeat(np.arange(len(row_ptr) - 1), np.diff(row_ptr))
+        order = np.argsort(terms, kind="stable")
+        self.posting_rows = entry_rows[order]
+        self.posting_values = values[order]
+        self.posting_ptr = np.zeros(term_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(terms, minlength=term_count), out=self.posting_ptr[1:])
+        self.entry_rows = entry_rows
+
+    def blocks(self, count: int) -> list[tuple[int, int]]:
+        """Split rows so each block expands to about ``_BLOCK_CELLS`` products."""
+        posting_lengths = np.diff(self.posting_ptr)
+        row_cost = np.bincount(
+            self.entry_rows,
+            weights=posting_lengths[self.terms],
+            minlength=count,
+        )
+        max_rows = max(1, _BLOCK_CELLS // count)
+        blocks: list[tuple[int, int]] = []
+        start = 0
+        cost = 0.0
+        for row in range(count):
+            if row > start and (
+                row - start >= max_rows or cost + row_cost[row] > _BLOCK_CELLS
+            ):
+                blocks.append((start, row))
+                start, cost = row, 0.0
+            cost += row_cost[row]
+        blocks.append((start, count))
+        return blocks
+
+    def scores(self, start: int, stop: int) -> np.ndarray:
+        """Dense cosine rows ``start:stop`` against every document."""
+        count = len(self.row_ptr) - 1
+        first, last = self.row_ptr[start], self.row_ptr[stop]
+        terms = self.terms[first:last]
+        starts = self.posting_ptr[terms]
+        lengths = self.posting_ptr[terms + 1] - starts
+        # Expand each entry of the block into the postings of its term.
+        entry = np.repeat(np.arange(len(terms)), lengths)
+        offsets = np.arange(int(lengths.sum())) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        postings = starts[entry] + offsets
+        cells = (self.entry_rows[first:last][entry] - start) * count
+        cells += self.posting_rows[postings]
+        products = self.values[first:last][entry] * self.posting_values[postings]
+        scores = np.bincount(cells, weights=products, minlength=(stop - start) * count)
+        scores = scores.reshape(stop - start, count)
+        scores[np.arange(stop - start), np.arange(start, stop)] = 0.0
+        return scores
+
+
+def _top_k(scores: np.ndarray, k: int) -> list[tuple[int, ...]]:
+    count = scores.shape[1]
+    if k < count:
+        kth = np.partition(scores, count - k, axis=1)[:, count - k]
+    else:
+        kth = np.zeros(len(scores))
+    neighbors: list[tuple[int, ...]] = []
+    for row, threshold in zip(scores, kth, strict=True):
+        candidates = np.flatnonzero(row >= max(threshold, np.finfo(float).tiny))
+        # lexsort keys run last-first: highest score, then lowest index.
+        ranked = candidates[np.lexsort((candidates, -row[candidates]))][:k]
+        neighbors.append(tuple(int(index) for index in ranked))
+    return neighbors
@@ -0,0 +1,104 @@
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import batched
+
+logger = logging.getLogger(__name__)
+
+# Each spawned worker imports the whole app, so the default stays small even
+# on hosts with many CPUs.
+MAX_DEFAULT_WORKERS = 8
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _available_cpus() -> int:
+    # A container sees the host's CPU count; the affinity mask is what it may use.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def resolve_worker_count(configured: int) -> int:
+    """Return the pool size for a configured value, where ``0`` means one per CPU.
+
+    The default counts the CPUs this process may run on, capped at
+    ``MAX_DEFAULT_WORKERS``.
+    """
+    if configured > 0:
+        return configured
+    return min(_available_cpus(), MAX_DEFAULT_WORKERS)
+
+
+def _render_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared pool, replacing it only when ``workers`` changes."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _pool is None:
+            # "spawn" avoids forking a process that may already run server threads.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_render_pool() -> None:
+    """Stop the shared worker processes; the next large batch starts a new pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def render_batch(
+    sources: Sequence[str],
+    render: Callable[[str], str],
+    *,
+    workers: int,
+    min_batch: int,
+    chunk_size: int,
+) -> list[str]:
+    """Render ``sources`` in order, fanning out to a process pool for large batches.
+
+    ``render`` must be a module-level function so it can be pickled. The pool
+    is started on the first large batch and reused by later ones. Sources are
+    submitted in windows of ``workers * chunk_size * 2`` so only a bounded
+    slice of markdown and HTML is in flight between processes at any time.
+    Small batches, or a single worker, use the calling thread.
+    """
+    if workers <= 1 or len(sources) < min_batch:
+        return [render(source) for source in sources]
+
+    window = workers * chunk_size * 2
+    rendered: list[str] = []
+    executor = _render_pool(workers)
+    try:
+        for chunk in batched(sources, window):
+            rendered.extend(executor.map(render, chunk, chunksize=chunk_size))
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool on the next batch.
+        _discard_pool(executor)
+        raise
+    logger.info(
+        f"Rendered {len(rendered)} markdown document(s) with {workers} worker process(es)."
+    )
+    return rendered
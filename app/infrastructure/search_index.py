@@ -0,0 +1,112 @@
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Sequence
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# A query term that only matches as a prefix ("fast" -> "fastapi") scores
+# less than an exact hit, so whole words rank first while the user types.
+_PREFIX_WEIGHT = 0.5
+# Single characters match exactly, and longer prefixes expand to at most this
+# many terms, so one short keystroke cannot walk the whole vocabulary.
+_MIN_PREFIX_LENGTH = 2
+_MAX_PREFIX_TERMS = 64
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class SearchIndex[T]:
+    """In-memory inverted index with BM25F-style ranking and prefix matching.
+
+    Each document is a list of ``(text, weight)`` fields; a term's frequency
+    is the weighted sum of its counts across fields. Every query term must
+    match, either exactly or as a prefix of an indexed term, so a lookup
+    touches only the posting lists of matching terms and never scans items.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        documents: Sequence[Sequence[tuple[str, float]]],
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        postings: defaultdict[str, dict[int, float]] = defaultdict(dict)
+        lengths: list[float] = []
+        for doc_id, fields in enumerate(documents):
+            length = 0.0
+            for text, weight in fields:
+                for term in tokenize(text):
+                    document_postings = postings[term]
+                    document_postings[doc_id] = (
+                        document_postings.get(doc_id, 0.0) + weight
+                    )
+                    length += weight
+            lengths.append(length)
+
+        self._items = tuple(items)
+        self._postings = dict(postings)
+        self._terms = sorted(self._postings)
+        self._k1 = k1
+        self._b = b
+        self._lengths = lengths
+        self._average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        count = len(self._items)
+        self._idf = {
+            term: math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self._postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _expand(self, token: str) -> list[tuple[str, float]]:
+        if len(token) < _MIN_PREFIX_LENGTH:
+            return [(token, 1.0)] if token in self._postings else []
+        matches: list[tuple[str, float]] = []
+        position = bisect_left(self._terms, token)
+        end = min(len(self._terms), position + _MAX_PREFIX_TERMS)
+        while position < end and self._terms[position].startswith(token):
+            term = self._terms[position]
+            matches.append((term, 1.0 if term == token else _PREFIX_WEIGHT))
+            position += 1
+        return matches
+
+    def search(self, query: str) -> tuple[T, ...]:
+        """Return items matching every query term, best BM25 score first."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return ()
+
+        scores: dict[int, float] | None = None
+        for token in tokens:
+            token_scores: dict[int, float] = {}
+            for term, term_weight in self._expand(token):
+                idf = self._idf[term] * term_weight
+                for doc_id, frequency in self._postings[term].items():
+                    norm = self._k1 * (
+                        1
+                        - self._b
+                        + self._b * self._lengths[doc_id] / self._average_length
+                    )
+                    score = idf * frequency * (self._k1 + 1) / (frequency + norm)
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    doc_id: score + token_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in token_scores
+                }
+            if not scores:
+                return ()
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return tuple(self._items[doc_id] for doc_id, _ in ranked)
@@ -0,0 +1,179 @@
+import hashlib
+import html
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.infrastructure.search_index import tokenize
+from app.models.models import SearchResult
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+    title,
+    tags,
+    body,
+    key UNINDEXED,
+    kind UNINDEXED,
+    url UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Control characters never survive the HTML-to-text step, so they can mark
+# snippet highlights through html.escape() and become <mark> tags afterwards.
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    key: str
+    kind: str
+    title: str
+    url: str
+    tags: str
+    # Cheap stand-in for the body, so unchanged documents skip loading it.
+    body_digest: str
+
+    @property
+    def digest(self) -> str:
+        fingerprint = (
+            f"{self.kind}\0{self.title}\0{self.url}\0{self.tags}\0{self.body_digest}"
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+class FullTextIndex:
+    """SQLite FTS5 index of site content, kept on disk outside worker memory.
+
+    ``sync`` is incremental: documents are compared by digest and only added,
+    changed or removed rows are written. ``None`` keeps the index in memory,
+    and so does a path that cannot be opened (a read-only filesystem, say).
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @staticmethod
+    def _open(target: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            target, check_same_thread=False, timeout=5.0, isolation_level=None
+        )
+        try:
+            if target != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection: sqlite3.Connection | None = None
+            if self._path is not None:
+                try:
+                    self._path.parent.mkdir(parents=True, exist_ok=True)
+                    connection = self._open(str(self._path))
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning(
+                        f"Search index path={self._path} cannot be opened ({exc}); "
+                        "keeping the index in memory."
+                    )
+            self._connection = connection or self._open(":memory:")
+        return self._connection
+
+    def sync(
+        self,
+        documents: Iterable[SearchDocument],
+        load_body: Callable[[SearchDocument], str],
+    ) -> int:
+        """Bring the index in line with ``documents``; return rows written."""
+        wanted = {document.key: document for document in documents}
+        with self._lock:
+            connection = self._connect()
+            stored = dict(connection.execute("SELECT key, digest FROM documents"))
+            stale = [key for key, digest in stored.items() if key not in wanted]
+            changed = [
+                document
+                for key, document in wanted.items()
+                if stored.get(key) != document.digest
+            ]
+            if not stale and not changed:
+                return 0
+
+            rows = [(document, load_body(document)) for document in changed]
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for key in stale + [document.key for document in changed]:
+                    connection.execute("DELETE FROM search WHERE key = ?", (key,))
+                    connection.execute("DELETE FROM documents WHERE key = ?", (key,))
+                connection.executemany(
+                    "INSERT INTO search (title, tags, body, key, kind, url)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [(d.title, d.tags, body, d.key, d.kind, d.url) for d, body in rows],
+                )
+                connection.executemany(
+                    "INSERT INTO documents (key, digest) VALUES (?, ?)",
+                    [(d.key, d.digest) for d, _ in rows],
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        written = len(stale) + len(changed)
+        logger.info(
+            f"Search index synced: {len(changed)} upserted, {len(stale)} removed."
+        )
+        return written
+
+    def search(self, query: str, *, limit: int = 20) -> tuple[SearchResult, ...]:
+        """Run ``query`` as prefix terms that must all match, best rank first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return ()
+        match = " AND ".join(f'"{term}"*' for term in terms)
+        try:
+            with self._lock:
+                rows = (
+                    self._connect()
+                    .execute(
+                        "SELECT kind, title, url,"
+                        " snippet(search, 2, ?, ?, '…', 16)"
+                        " FROM search WHERE search MATCH ?"
+                        " ORDER BY bm25(search, 5.0, 3.0, 1.0) LIMIT ?",
+                        (_MARK_START, _MARK_END, match, limit),
+                    )
+                    .fetchall()
+                )
+        except sqlite3.Error:
+            logger.exception(f"Search query failed: {query!r}")
+            return ()
+        return tuple(
+            SearchResult(
+                kind=kind,
+                title=title,
+                url=url,
+                snippet_html=html.escape(snippet)
+                .replace(_MARK_START, "<mark>")
+                .replace(_MARK_END, "</mark>"),
+            )
+            for kind, title, url, snippet in rows
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
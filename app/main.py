@@ -1,4 +1,7 @@
 import logging
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -21,6 +24,14 @@ from app.core.security import (
     RequestTracingMiddleware,
     SecurityHeadersMiddleware,
 )
+from app.infrastructure.content_watcher import ContentWatcher
+from app.infrastructure.gist_fetch import close_github_client
+from app.infrastructure.markdown import (
+    CONTENT_DIR,
+    invalidate_content_paths,
+    warm_content,
+)
+from app.infrastructure.render_pool import shutdown_render_pool
 from app.services.seo import seo_for_page
 
 logger = logging.getLogger(__name__)
@@ -32,6 +43,25 @@ def rate_limit_handler(request: Request, exc: Exception) -> Response:
     return HTMLResponse("Rate limit exceeded.", status_code=429)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    watcher: ContentWatcher | None = None
+    if settings.content_watch_enabled and CONTENT_DIR.exists():
+        watcher = ContentWatcher(CONTENT_DIR, invalidate_content_paths)
+        watcher.start()
+    if settings.content_warm_on_startup:
+        threading.Thread(
+            target=warm_content, name="content-warmup", daemon=True
+        ).start()
+    try:
+        yield
+    finally:
+        if watcher is not None:
+            watcher.stop()
+        close_github_client()
+        shutdown_render_pool()
+
+
 def create_app() -> FastAPI:
     configure_logging(settings.log_level)
     logger.info("Creating FastAPI application.")
@@ -42,6 +72,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.debug else None,
         redoc_url=None,
         openapi_url="/openapi.json" if settings.debug else None,
+        lifespan=lifespan,
     )
 
     static_dir = Path(__file__).resolve().parent / "static"
@@ -1,13 +1,33 @@
+import sys
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date as DateType
 
+from cachetools import LRUCache
 
-@dataclass(frozen=True)
+# Bounded, so label sets of edited or removed content age out instead of
+# living for the whole process; a set evicted while in use just stops being
+# shared with later instances.
+_shared_labels: LRUCache[tuple[str, ...], tuple[str, ...]] = LRUCache(maxsize=4096)
+_shared_labels_lock = threading.Lock()
+
+
+def intern_labels(values: Iterable[str]) -> tuple[str, ...]:
+    """Return one shared tuple of interned strings per distinct label set."""
+    labels = tuple(sys.intern(value) for value in values)
+    with _shared_labels_lock:
+        shared = _shared_labels.get(labels)
+        if shared is None:
+            _shared_labels[labels] = shared = labels
+    return shared
+
+
+@dataclass(frozen=True, slots=True)
 class Project:
     slug: str
     title: str
     description: str
-    content_html: str
     thumbnail: str = ""
     tags: tuple[str, ...] = ()
     tech_stack: tuple[str, ...] = ()
@@ -15,31 +35,43 @@ class Project:
     live_url: str | None = None
     date: DateType | None = None
     featured: bool = False
+    # The rendered body lives in a separate LRU tier keyed by this digest.
+    body_digest: str = ""
+    source_path: str = ""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tags", intern_labels(self.tags))
+        object.__setattr__(self, "tech_stack", intern_labels(self.tech_stack))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlogPost:
     slug: str
     title: str
     description: str
-    content_html: str
     tags: tuple[str, ...] = ()
     author: str = ""
     discussion_url: str = ""
     gist_url: str = ""
     gist_id: str = ""
-    comments: tuple["BlogComment", ...] = ()
     date: DateType | None = None
     featured: bool = False
+    read_time_minutes: int = 1
+    body_digest: str = ""
+    source_path: str = ""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tags", intern_labels(self.tags))
+        object.__setattr__(self, "author", sys.intern(self.author))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BlogTag:
     name: str
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlogComment:
     author: str
     body: str
@@ -47,3 +79,11 @@ class BlogComment:
     profile_url: str = ""
     html_url: str = ""
     avatar_url: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    kind: str
+    title: str
+    url: str
+    snippet_html: str = ""
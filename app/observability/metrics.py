@@ -36,6 +36,26 @@ class AppMetrics:
             description="Notification channel outcomes.",
             unit="1",
         )
+        self._highlight_cache_total = meter.create_counter(
+            name="site.content.highlight_cache_total",
+            description="Code block highlight cache lookups by outcome.",
+            unit="1",
+        )
+        self._render_queue_depth = meter.create_up_down_counter(
+            name="site.render.queue_depth",
+            description="Page renders waiting for a render thread.",
+            unit="1",
+        )
+        self._render_active = meter.create_up_down_counter(
+            name="site.render.active",
+            description="Page renders running on a render thread.",
+            unit="1",
+        )
+        self._render_queue_wait_ms = meter.create_histogram(
+            name="site.render.queue_wait_ms",
+            description="Time a page render waited for a render thread.",
+            unit="ms",
+        )
 
     def request_started(self, *, method: str, path: str) -> None:
         self._requests_in_flight.add(1, attributes={"method": method, "path": path})
@@ -69,6 +89,25 @@ class AppMetrics:
         self._notification_total.add(1, attributes=attributes)
         self._notification_duration_ms.record(duration_ms, attributes=attributes)
 
+    def record_highlight_cache(self, *, hit: bool) -> None:
+        self._highlight_cache_total.add(
+            1, attributes={"outcome": "hit" if hit else "miss"}
+        )
+
+    def render_task_queued(self) -> None:
+        self._render_queue_depth.add(1)
+
+    def render_task_started(self, *, wait_ms: float) -> None:
+        self._render_queue_depth.add(-1)
+        self._render_active.add(1)
+        self._render_queue_wait_ms.record(wait_ms)
+
+    def render_task_finished(self) -> None:
+        self._render_active.add(-1)
+
+    def render_task_cancelled(self) -> None:
+        self._render_queue_depth.add(-1)
+
 
 @lru_cache(maxsize=1)
 def get_app_metrics() -> AppMetrics:
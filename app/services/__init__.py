@@ -8,6 +8,7 @@ from app.services.contact import (
 from app.services.home import HomePageService
 from app.services.profile import ProfileService
 from app.services.projects import ProjectsPageService
+from app.services.search import SearchPageService
 from app.services.seo import seo_for_page, seo_for_project
 from app.services.types import ContactSubmissionResult, PageRenderData
 
@@ -22,6 +23,7 @@ __all__ = [
     "PageRenderData",
     "ProfileService",
     "ProjectsPageService",
+    "SearchPageService",
     "seo_for_page",
     "seo_for_project",
 ]
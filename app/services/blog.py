@@ -1,17 +1,21 @@
 import logging
 import math
-import re
-from collections import Counter
 from datetime import datetime, time, timezone
 from email.utils import format_datetime
 from xml.sax.saxutils import escape
 
 from app.core.config import settings
-from app.models.models import BlogPost, BlogTag
+from app.models.models import BlogComment, BlogPost
 from app.infrastructure.markdown import (
+    get_adjacent_blog_posts,
     get_blog_post_by_slug,
+    get_related_blog_posts,
     load_about,
     load_all_blog_posts,
+    load_blog_post_body,
+    load_blog_snapshot,
+    load_gist_comments,
+    load_tag_taxonomy,
 )
 from app.services.seo import seo_for_page
 from app.services.types import (
@@ -30,58 +34,18 @@ class BlogPageService:
     def _post_url(slug: str) -> str:
         return f"/blog/posts/{slug}"
 
-    @staticmethod
-    def _normalize_tag(tag: str) -> str:
-        return tag.strip().lower()
-
-    @staticmethod
-    def _build_tag_stats(posts: tuple[BlogPost, ...]) -> tuple[BlogTag, ...]:
-        counter: Counter[str] = Counter()
-        for post in posts:
-            for tag in post.tags:
-                normalized = tag.strip()
-                if normalized:
-                    counter[normalized] += 1
-
-        tags = tuple(
-            BlogTag(name=name, count=count)
-            for name, count in sorted(
-                counter.items(), key=lambda item: (-item[1], item[0])
-            )
-        )
-        return tags
-
     @staticmethod
     def _resolve_site_name() -> str:
         about_content = load_about()
         site_name = str(about_content.frontmatter.name or settings.site_name).strip()
         return site_name or settings.site_name
 
-    @staticmethod
-    def _estimate_read_time_minutes(content_html: str) -> int:
-        plain_text = re.sub(r"<[^>]+>", " ", content_html)
-        words = [word for word in plain_text.split() if word.strip()]
-        return max(1, math.ceil(len(words) / 220))
-
-    def _adjacent_posts(
-        self, post: BlogPost
-    ) -> tuple[BlogPost | None, BlogPost | None]:
-        posts = load_all_blog_posts()
-        for index, candidate in enumerate(posts):
-            if candidate.slug != post.slug:
-                continue
-            previous_post = posts[index - 1] if index > 0 else None
-            next_post = posts[index + 1] if index + 1 < len(posts) else None
-            return previous_post, next_post
-        return None, None
-
     def build_home_page(self) -> PageRenderData:
-        posts = load_all_blog_posts()
-        featured_candidates = [post for post in posts if post.featured]
-        non_featured_candidates = [post for post in posts if not post.featured]
-        featured_posts = tuple((featured_candidates + non_featured_candidates)[:3])
+        snapshot = load_blog_snapshot()
+        posts = snapshot.index.items
+        featured_posts = snapshot.featured_first[:3]
         recent_posts = posts[:3]
-        tags = self._build_tag_stats(posts)[:10]
+        tags = load_tag_taxonomy().blog_tags[:10]
 
         seo = seo_for_page(
             title="Blog",
@@ -129,6 +93,11 @@ class BlogPageService:
     def get_post(self, slug: str) -> BlogPost | None:
         return get_blog_post_by_slug(slug)
 
+    def get_post_comments(self, post: BlogPost) -> tuple[BlogComment, ...]:
+        if not post.gist_id:
+            return ()
+        return load_gist_comments(post.gist_id)
+
     def build_post_page(self, post: BlogPost) -> PageRenderData:
         seo = seo_for_page(
             title=post.title,
@@ -137,37 +106,34 @@ class BlogPageService:
             og_type="article",
             keywords=post.tags,
         )
-        previous_post, next_post = self._adjacent_posts(post)
-        read_time_minutes = self._estimate_read_time_minutes(post.content_html)
+        previous_post, next_post = get_adjacent_blog_posts(post.slug)
         return PageRenderData(
             template="pages/blog/detail.jinja",
             context=BlogPostDetailPageContext(
                 seo=seo,
                 post=post,
+                content_html=load_blog_post_body(post),
                 previous_post=previous_post,
                 next_post=next_post,
-                read_time_minutes=read_time_minutes,
+                related_posts=get_related_blog_posts(post.slug),
+                read_time_minutes=post.read_time_minutes,
             ),
         )
 
     def build_tags_page(self, tag: str | None = None) -> PageRenderData:
-        posts = load_all_blog_posts()
-        tags = self._build_tag_stats(posts)
+        taxonomy = load_tag_taxonomy()
         selected_tag = tag.strip() if tag else ""
-        selected_tag_normalized = self._normalize_tag(selected_tag)
-
-        if selected_tag_normalized:
-            filtered_posts = tuple(
-                post
-                for post in posts
-                if selected_tag_normalized
-                in {self._normalize_tag(post_tag) for post_tag in post.tags}
-            )
+
+        if selected_tag:
+            entry = taxonomy.get(selected_tag)
+            filtered_posts = entry.posts if entry is not None else ()
+            if entry is not None:
+                selected_tag = entry.name
             title = f"Tag: {selected_tag}"
             description = f"Posts tagged with {selected_tag}."
             path = f"/blog/tags/{selected_tag}"
         else:
-            filtered_posts = posts
+            filtered_posts = load_all_blog_posts()
             title = "Blog Tags"
             description = "Browse posts by tag."
             path = "/blog/tags"
@@ -181,7 +147,7 @@ class BlogPageService:
             template="pages/blog/tags.jinja",
             context=BlogTagsPageContext(
                 seo=seo,
-                tags=tags,
+                tags=taxonomy.blog_tags,
                 posts=filtered_posts,
                 selected_tag=selected_tag,
             ),
@@ -38,10 +38,14 @@ class ContactPageService:
     ) -> None:
         self._csrf_token_factory = csrf_token_factory
 
+    def issue_csrf_token(self, *, user_agent: str = "") -> str:
+        return self._csrf_token_factory(user_agent=user_agent)
+
     def build_page(
         self,
         *,
         user_agent: str = "",
+        include_csrf: bool = True,
         current_csrf: str | None = None,
         success: str = "",
         errors: dict[str, str] | None = None,
@@ -52,7 +56,11 @@ class ContactPageService:
             description="Get in touch with me.",
             path="/contact",
         )
-        csrf_token = current_csrf or self._csrf_token_factory(user_agent=user_agent)
+        # Without a token the form fetches one from /contact/token, so the
+        # page itself is the same for every visitor and can be cached.
+        csrf_token = ""
+        if include_csrf:
+            csrf_token = current_csrf or self.issue_csrf_token(user_agent=user_agent)
         return PageRenderData(
             template="pages/contact.jinja",
             context=ContactPageContext(
@@ -1,8 +1,6 @@
 import logging
-from typing import Callable
 
-from app.core.security import generate_csrf_token
-from app.infrastructure.markdown import load_all_blog_posts, load_all_projects
+from app.infrastructure.markdown import load_all_blog_posts, load_project_snapshot
 from app.services.seo import seo_for_page
 from app.services.types import HomePageContext, PageRenderData
 
@@ -10,21 +8,10 @@ logger = logging.getLogger(__name__)
 
 
 class HomePageService:
-    def __init__(
-        self, csrf_token_factory: Callable[..., str] = generate_csrf_token
-    ) -> None:
-        self._csrf_token_factory = csrf_token_factory
-
-    def build_page(self, *, user_agent: str = "") -> PageRenderData:
-        all_projects = list(load_all_projects())
-        all_posts = list(load_all_blog_posts())
-        featured_projects = [project for project in all_projects if project.featured]
-        non_featured_projects = [
-            project for project in all_projects if not project.featured
-        ]
-        featured = (featured_projects + non_featured_projects)[:3]
-        latest_posts = all_posts[:3]
-        csrf_token = self._csrf_token_factory(user_agent=user_agent)
+    def build_page(self) -> PageRenderData:
+        projects = load_project_snapshot()
+        featured = projects.featured_first[:3]
+        latest_posts = load_all_blog_posts()[:3]
         seo = seo_for_page(
             title="Home",
             description="Python developer site with projects, experience, and contact details.",
@@ -33,15 +20,14 @@ class HomePageService:
         logger.debug(
             "Home use-case built with featured_count=%s total_projects=%s latest_posts=%s",
             len(featured),
-            len(all_projects),
+            len(projects.index.items),
             len(latest_posts),
         )
         return PageRenderData(
             template="pages/home.jinja",
             context=HomePageContext(
                 seo=seo,
-                featured=tuple(featured),
-                latest_posts=tuple(latest_posts),
-                csrf_token=csrf_token,
+                featured=featured,
+                latest_posts=latest_posts,
             ),
         )
@@ -2,7 +2,11 @@ import logging
 import math
 
 from app.models.models import Project
-from app.infrastructure.markdown import get_project_by_slug, load_all_projects
+from app.infrastructure.markdown import (
+    get_project_by_slug,
+    load_project_body,
+    load_tagged_snapshots,
+)
 from app.services.seo import seo_for_page, seo_for_project
 from app.services.types import (
     PageRenderData,
@@ -23,22 +27,19 @@ class ProjectsPageService:
         page: int = 1,
         page_size: int = 10,
     ) -> PageRenderData:
-        all_projects = load_all_projects()
-        all_tags = tuple(sorted({t for p in all_projects for t in p.tags}))
+        snapshot, _, taxonomy = load_tagged_snapshots()
+        all_tags = taxonomy.project_tags
 
-        filtered = all_projects
-        if q:
-            q_lower = q.lower()
-            filtered = tuple(
-                p
-                for p in filtered
-                if q_lower in p.title.lower() or q_lower in p.description.lower()
-            )
+        filtered = snapshot.index.items
         if tag:
-            tag_lower = tag.lower()
-            filtered = tuple(
-                p for p in filtered if any(t.lower() == tag_lower for t in p.tags)
-            )
+            entry = taxonomy.get(tag)
+            filtered = entry.projects if entry is not None else ()
+        if q:
+            ranked = snapshot.search.search(q)
+            if tag:
+                allowed = {id(project) for project in filtered}
+                ranked = tuple(project for project in ranked if id(project) in allowed)
+            filtered = ranked
         if featured is not None:
             filtered = tuple(p for p in filtered if p.featured == featured)
 
@@ -80,5 +81,6 @@ class ProjectsPageService:
             context=ProjectDetailPageContext(
                 seo=seo,
                 project=project,
+                content_html=load_project_body(project),
             ),
         )
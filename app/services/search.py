@@ -0,0 +1,25 @@
+import logging
+
+from app.infrastructure.markdown import search_content
+from app.services.seo import seo_for_page
+from app.services.types import PageRenderData, SearchPageContext
+
+logger = logging.getLogger(__name__)
+
+
+class SearchPageService:
+    def build_page(self, *, q: str = "", limit: int = 20) -> PageRenderData:
+        query = q.strip()
+        results = search_content(query, limit=limit) if query else ()
+        seo = seo_for_page(
+            title="Search",
+            description="Search posts, projects and experience.",
+            path="/search",
+        )
+        logger.debug(
+            f"Search use-case built with result_count={len(results)} (q={query!r})"
+        )
+        return PageRenderData(
+            template="pages/search.jinja",
+            context=SearchPageContext(seo=seo, q=query, results=results),
+        )
@@ -1,9 +1,7 @@
-from dataclasses import dataclass
-from typing import TypeAlias
+from dataclasses import dataclass, field
+from typing import Any, TypeAlias
 
-from pydantic import BaseModel, ConfigDict, Field
-
-from app.models.models import BlogPost, BlogTag, Project
+from app.models.models import BlogPost, BlogTag, Project, SearchResult
 from app.models.schemas import (
     AboutFrontmatter,
     CertificateItem,
@@ -15,19 +13,16 @@ from app.models.schemas import (
 )
 
 
-class HomePageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class HomePageContext:
     seo: SEOMeta
     featured: tuple[Project, ...]
     latest_posts: tuple[BlogPost, ...]
-    csrf_token: str
     current_path: str = "/"
 
 
-class AboutPageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class AboutPageContext:
     seo: SEOMeta
     meta: AboutFrontmatter
     hero_html: str
@@ -39,9 +34,8 @@ class AboutPageContext(BaseModel):
     current_path: str = "/about"
 
 
-class ProjectsListPageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class ProjectsListPageContext:
     seo: SEOMeta
     projects: tuple[Project, ...]
     all_tags: tuple[str, ...] = ()
@@ -52,28 +46,26 @@ class ProjectsListPageContext(BaseModel):
     current_path: str = "/projects"
 
 
-class ProjectDetailPageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class ProjectDetailPageContext:
     seo: SEOMeta
     project: Project
+    content_html: str = ""
     current_path: str = "/projects"
 
 
-class ContactPageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class ContactPageContext:
     seo: SEOMeta
-    csrf_token: str
+    csrf_token: str = ""
     success: str = ""
-    errors: dict[str, str] = Field(default_factory=dict)
-    form_data: dict[str, str] = Field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    form_data: dict[str, str] = field(default_factory=dict)
     current_path: str = "/contact"
 
 
-class BlogHomePageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class BlogHomePageContext:
     seo: SEOMeta
     featured_posts: tuple[BlogPost, ...]
     recent_posts: tuple[BlogPost, ...]
@@ -81,9 +73,8 @@ class BlogHomePageContext(BaseModel):
     current_path: str = "/blog"
 
 
-class BlogPostsPageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class BlogPostsPageContext:
     seo: SEOMeta
     posts: tuple[BlogPost, ...]
     page: int = 1
@@ -91,20 +82,20 @@ class BlogPostsPageContext(BaseModel):
     current_path: str = "/blog"
 
 
-class BlogPostDetailPageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class BlogPostDetailPageContext:
     seo: SEOMeta
     post: BlogPost
+    content_html: str = ""
     previous_post: BlogPost | None = None
     next_post: BlogPost | None = None
+    related_posts: tuple[BlogPost, ...] = ()
     read_time_minutes: int = 1
     current_path: str = "/blog"
 
 
-class BlogTagsPageContext(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
-
+@dataclass(frozen=True, slots=True)
+class BlogTagsPageContext:
     seo: SEOMeta
     tags: tuple[BlogTag, ...]
     posts: tuple[BlogPost, ...]
@@ -112,6 +103,14 @@ class BlogTagsPageContext(BaseModel):
     current_path: str = "/blog"
 
 
+@dataclass(frozen=True, slots=True)
+class SearchPageContext:
+    seo: SEOMeta
+    q: str = ""
+    results: tuple[SearchResult, ...] = ()
+    current_path: str = "/search"
+
+
 PageContext: TypeAlias = (
     HomePageContext
     | AboutPageContext
@@ -122,9 +121,16 @@ PageContext: TypeAlias = (
     | BlogPostsPageContext
     | BlogPostDetailPageContext
     | BlogTagsPageContext
+    | SearchPageContext
 )
 
 
+def context_values(context: PageContext) -> dict[str, Any]:
+    """Map a context's fields to their values without copying nested objects."""
+    # Slotted dataclasses list their field names in __slots__.
+    return {name: getattr(context, name) for name in context.__slots__}
+
+
 @dataclass(frozen=True)
 class PageRenderData:
     template: str
@@ -0,0 +1,73 @@
+"""Compare per-document cost of markdown.markdown() and the pooled engine.
+
+Usage:
+    uv run python -m benchmarks.markdown_engine --rounds 2000
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+os.environ.setdefault("CONTENT_CACHE_DIR", "")
+
+import markdown  # noqa: E402
+
+from app.infrastructure.markdown import (  # noqa: E402
+    _MARKDOWN_EXTENSIONS,
+    _build_markdown_engine,
+)
+from app.infrastructure.markdown_engine import MarkdownPool  # noqa: E402
+
+# Short about.md-style entries, where construction dominates, and a full post.
+_DOCUMENTS = {
+    "about entry": "Built **backend** services with `FastAPI` and PostgreSQL.",
+    "post": """# Post
+
+Intro with **bold** text and a [link](https://example.com).
+
+## Section
+
+```python
+def handler(request: dict[str, str]) -> int:
+    return sum(len(value) for value in request.values())
+```
+
+| Column | Value |
+| ------ | ----- |
+| a      | 1     |
+""",
+}
+
+
+def _per_document_us(render, text: str, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        render(text)
+    return (time.perf_counter() - started) / rounds * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    pool = MarkdownPool(_build_markdown_engine)
+    extensions = list(_MARKDOWN_EXTENSIONS)
+    print(f"{'document':<14} {'markdown()':>12} {'pool':>12} {'speedup':>8}")
+    for name, text in _DOCUMENTS.items():
+        assert pool.convert(text) == markdown.markdown(text, extensions=extensions)
+        fresh_us = _per_document_us(
+            lambda text: markdown.markdown(text, extensions=extensions),
+            text,
+            args.rounds,
+        )
+        pooled_us = _per_document_us(pool.convert, text, args.rounds)
+        print(
+            f"{name:<14} {fresh_us:>10.1f}us {pooled_us:>10.1f}us "
+            f"{fresh_us / pooled_us:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
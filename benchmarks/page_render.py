@@ -0,0 +1,72 @@
+"""Measure per-request CPU to build each page's context and render it.
+
+Runs the page service and ``render_page`` in-process (no HTTP, no page cache)
+and reports CPU microseconds per request, so context-building and template
+changes can be compared before and after.
+
+Usage:
+    uv run python -m benchmarks.page_render --rounds 300
+"""
+
+import argparse
+import os
+import time
+from collections.abc import Callable
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+os.environ.setdefault("CONTENT_CACHE_DIR", "")
+os.environ.setdefault("CONTENT_SEARCH_INDEX_PATH", "")
+
+from app.core.dependencies import (
+    get_about_page_service,
+    get_blog_page_service,
+    get_contact_page_service,
+    get_home_page_service,
+    get_projects_page_service,
+    get_search_page_service,
+)
+from app.core.rendering import render_page
+from app.infrastructure.markdown import (
+    load_all_blog_posts,
+    load_all_projects,
+)
+from app.services import PageRenderData
+
+
+def _pages() -> dict[str, Callable[[], PageRenderData]]:
+    blog = get_blog_page_service()
+    projects = get_projects_page_service()
+    post = load_all_blog_posts()[0]
+    project = load_all_projects()[0]
+    return {
+        "/": get_home_page_service().build_page,
+        "/about": get_about_page_service().build_page,
+        "/projects": projects.build_list_page,
+        "/projects/{slug}": lambda: projects.build_detail_page(project),
+        "/blog": blog.build_home_page,
+        "/blog/posts": blog.build_posts_page,
+        "/blog/posts/{slug}": lambda: blog.build_post_page(post),
+        "/blog/tags": blog.build_tags_page,
+        "/contact": lambda: get_contact_page_service().build_page(include_csrf=False),
+        "/search?q=python": lambda: get_search_page_service().build_page(q="python"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'page':<20} {'cpu/request':>12}")
+    for path, build in _pages().items():
+        for _ in range(10):
+            render_page(build())
+        started = time.process_time()
+        for _ in range(args.rounds):
+            render_page(build())
+        elapsed = (time.process_time() - started) / args.rounds
+        print(f"{path:<20} {elapsed * 1_000_000:>10.0f}us")
+
+
+if __name__ == "__main__":
+    main()
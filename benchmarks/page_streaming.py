@@ -0,0 +1,72 @@
+"""Compare peak memory and time of streamed and buffered page renders.
+
+The streamed mode renders the head, then the body, and encodes the body once
+into the buffer its slices are sent from. Both modes include storing the
+document for the page cache, as a miss with the cache on does. This runs
+in-process, with no HTTP.
+
+Usage:
+    uv run python -m benchmarks.page_streaming --rounds 50
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+os.environ.setdefault("CONTENT_CACHE_DIR", "")
+os.environ.setdefault("CONTENT_SEARCH_INDEX_PATH", "")
+
+from app.core.rendering import render_body, render_head, render_page
+from app.services import PageRenderData
+from benchmarks.page_render import _pages
+
+
+def _buffered(page: PageRenderData) -> None:
+    bytes(render_page(page).body)
+
+
+def _streamed(page: PageRenderData) -> None:
+    head = render_head(page)
+    body = render_body(page)
+    for start in range(0, len(body), 64 * 1024):
+        memoryview(body)[start : start + 64 * 1024]
+    head + body
+
+
+def _measure(
+    build: Callable[[], PageRenderData],
+    send: Callable[[PageRenderData], None],
+    rounds: int,
+) -> tuple[float, int]:
+    page = build()
+    tracemalloc.start()
+    send(page)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        send(page)
+    return (time.perf_counter() - started) / rounds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'page':<20} {'buffered':>10} {'peak':>8} {'streamed':>10} {'peak':>8}")
+    for path, build in _pages().items():
+        _measure(build, _buffered, 5)
+        buffered, buffered_peak = _measure(build, _buffered, args.rounds)
+        streamed, streamed_peak = _measure(build, _streamed, args.rounds)
+        print(
+            f"{path:<20} {buffered * 1_000_000:>8.0f}us {buffered_peak // 1024:>6}KB"
+            f" {streamed * 1_000_000:>8.0f}us {streamed_peak // 1024:>6}KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare the old substring scan with the inverted index for /projects?q=.
+
+Usage:
+    uv run python -m benchmarks.project_search --sizes 1000 10000 50000
+"""
+
+import argparse
+import random
+import time
+
+from app.infrastructure.search_index import SearchIndex
+
+_WORDS = [
+    "api", "async", "cache", "celery", "cli", "django", "docker", "fastapi",
+    "graphql", "http", "kafka", "kubernetes", "logging", "metrics",
+    "observability", "postgres", "pydantic", "python", "queue", "redis", "rest",
+    "rust", "security", "sqlalchemy", "sqlite", "testing", "tracing", "typer",
+    "worker",
+]  # fmt: skip
+
+
+def _corpus(size: int) -> list[tuple[str, str]]:
+    rng = random.Random(size)
+    # A long tail of rare words, as in real descriptions and bodies.
+    vocabulary = [f"{rng.choice(_WORDS)[:3]}{index:x}" for index in range(size * 4)]
+    return [
+        (
+            f"{rng.choice(_WORDS).title()} {rng.choice(vocabulary)} {index}",
+            " ".join(rng.choices(_WORDS, k=3) + rng.choices(vocabulary, k=60)),
+        )
+        for index in range(size)
+    ]
+
+
+def _per_query_us(search, queries: list[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for query in queries:
+            search(query)
+    return (time.perf_counter() - started) / (rounds * len(queries)) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'projects':>9} {'query':<22} {'scan':>12} {'index':>12} {'matches':>8}")
+    for size in args.sizes:
+        corpus = _corpus(size)
+        rare = corpus[size // 2][0].split()[1]
+        index = SearchIndex(
+            [title for title, _ in corpus],
+            [((title, 3.0), (body, 1.0)) for title, body in corpus],
+        )
+
+        def _scan(query: str, corpus: list[tuple[str, str]] = corpus) -> list[str]:
+            needle = query.lower()
+            return [
+                title
+                for title, body in corpus
+                if needle in title.lower() or needle in body.lower()
+            ]
+
+        for query in (rare, rare[:5], "fastapi redis", "zzzz"):
+            scan_us = _per_query_us(_scan, [query], args.rounds)
+            index_us = _per_query_us(index.search, [query], args.rounds)
+            print(
+                f"{size:>9} {query:<22} {scan_us:>10.1f}us {index_us:>10.1f}us "
+                f"{len(index.search(query)):>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
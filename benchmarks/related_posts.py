@@ -0,0 +1,55 @@
+"""Time the related-posts TF-IDF pass that runs once per blog snapshot.
+
+Usage:
+    uv run python -m benchmarks.related_posts --sizes 500 2000 5000
+"""
+
+import argparse
+import random
+import time
+
+from app.infrastructure.related_posts import nearest_neighbors
+
+_TOPICS = [
+    "api", "async", "cache", "docker", "fastapi", "kafka", "kubernetes",
+    "logging", "metrics", "postgres", "python", "queue", "redis", "rust",
+    "security", "sqlite", "testing", "tracing",
+]  # fmt: skip
+_FILLER = ["the", "and", "with", "for", "that", "this", "from", "when"]
+
+
+def _corpus(size: int) -> list[tuple[tuple[str, float], ...]]:
+    rng = random.Random(size)
+    vocabulary = [f"{rng.choice(_TOPICS)}{index:x}" for index in range(size * 8)]
+    documents = []
+    for index in range(size):
+        tags = rng.sample(_TOPICS, k=3)
+        body = rng.choices(_FILLER, k=400) + rng.choices(tags, k=40)
+        body += rng.choices(vocabulary, k=400)
+        documents.append(
+            (
+                (f"Post {index} about {tags[0]}", 2.0),
+                (" ".join(tags), 3.0),
+                (" ".join(body), 1.0),
+            )
+        )
+    return documents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--top", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'posts':>7} {'seconds':>9} {'per post':>10}")
+    for size in args.sizes:
+        documents = _corpus(size)
+        started = time.perf_counter()
+        nearest_neighbors(documents, args.top)
+        elapsed = time.perf_counter() - started
+        print(f"{size:>7} {elapsed:>8.2f}s {elapsed / size * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Load test: latency of a cheap route while heavy pages render concurrently.
+
+Drives the app in-process over ASGI with the page cache off, so every heavy
+request renders. One probe polls ``/health`` while ``--concurrency`` clients
+fetch ``--heavy``. Runs once with rendering inline on the event loop and once
+on the render thread pool, and reports p50/p99 for both routes.
+
+Usage:
+    uv run python -m benchmarks.render_load --seconds 5 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+os.environ.setdefault("CONTENT_CACHE_DIR", "")
+os.environ.setdefault("CONTENT_SEARCH_INDEX_PATH", "")
+os.environ.setdefault("CONTENT_PAGE_CACHE_SIZE", "0")
+os.environ.setdefault("CONTENT_WARM_ON_STARTUP", "false")
+os.environ.setdefault("DEFAULT_RATE_LIMIT", "1000000/minute")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx
+
+from app.core import rendering
+from app.core.render_executor import RenderExecutor
+from app.infrastructure.markdown import warm_content
+from app.main import create_app
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return value, value
+    cuts = statistics.quantiles(samples, n=100)
+    return statistics.median(samples), cuts[98]
+
+
+async def _run(
+    client: httpx.AsyncClient, heavy: str, concurrency: int, seconds: float
+) -> tuple[list[float], list[float]]:
+    deadline = time.perf_counter() + seconds
+    probe: list[float] = []
+    pages: list[float] = []
+
+    async def timed(path: str, samples: list[float]) -> None:
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    async def heavy_client() -> None:
+        while time.perf_counter() < deadline:
+            await timed(heavy, pages)
+
+    async def probe_client() -> None:
+        while time.perf_counter() < deadline:
+            await timed("/health", probe)
+            await asyncio.sleep(0.005)
+
+    await asyncio.gather(probe_client(), *(heavy_client() for _ in range(concurrency)))
+    return probe, pages
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--heavy", default="/blog/tags")
+    args = parser.parse_args()
+
+    warm_content()
+    transport = httpx.ASGITransport(app=create_app())
+    print(
+        f"{'mode':<12} {'health p50':>11} {'health p99':>11}"
+        f" {'page p50':>9} {'page p99':>9} {'pages/s':>8}"
+    )
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        for label, threads in (
+            ("inline", 0),
+            (f"{args.threads} threads", args.threads),
+        ):
+            rendering._render_executor = RenderExecutor(threads)
+            await _run(client, args.heavy, args.concurrency, 0.5)
+            probe, pages = await _run(
+                client, args.heavy, args.concurrency, args.seconds
+            )
+            rendering._render_executor.shutdown()
+            health_p50, health_p99 = _percentiles(probe)
+            page_p50, page_p99 = _percentiles(pages)
+            print(
+                f"{label:<12} {health_p50:>9.1f}ms {health_p99:>9.1f}ms"
+                f" {page_p50:>7.1f}ms {page_p99:>7.1f}ms"
+                f" {len(pages) / args.seconds:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""Compare sequential and process-pool markdown rendering on a synthetic corpus.
+
+Usage:
+    uv run python -m benchmarks.render_pool --posts 5000 --workers 4
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+os.environ.setdefault("CONTENT_CACHE_DIR", "")
+
+from app.infrastructure.markdown import _render_sanitized_markdown  # noqa: E402
+from app.infrastructure.render_pool import (  # noqa: E402
+    render_batch,
+    resolve_worker_count,
+    shutdown_render_pool,
+)
+
+_POST_TEMPLATE = """# Synthetic post {index}
+
+Intro paragraph for post {index} with **bold** text, `inline code` and a
+[link](https://example.com/{index}).
+
+## Section
+
+```python
+def handler_{index}(request: dict[str, str]) -> dict[str, int]:
+    total = sum(len(value) for value in request.values())
+    return {{"post": {index}, "total": total}}
+```
+
+| Column | Value |
+| ------ | ----- |
+| post   | {index} |
+
+```sql
+SELECT id, title FROM posts WHERE id = {index} ORDER BY created_at DESC;
+```
+
+- item one
+- item two
+"""
+
+
+def _corpus(size: int) -> list[str]:
+    return [_POST_TEMPLATE.format(index=index) for index in range(size)]
+
+
+def _time(label: str, run) -> tuple[float, list[str]]:
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {elapsed:8.2f}s")
+    return elapsed, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=0, help="0 = one per CPU")
+    parser.add_argument("--chunk-size", type=int, default=16)
+    args = parser.parse_args()
+
+    corpus = _corpus(args.posts)
+    workers = resolve_worker_count(args.workers)
+    print(f"posts={len(corpus)} workers={workers} chunk_size={args.chunk_size}")
+
+    sequential_s, sequential = _time(
+        "sequential",
+        lambda: render_batch(
+            corpus,
+            _render_sanitized_markdown,
+            workers=1,
+            min_batch=1,
+            chunk_size=args.chunk_size,
+        ),
+    )
+    parallel_s, parallel = _time(
+        "pool",
+        lambda: render_batch(
+            corpus,
+            _render_sanitized_markdown,
+            workers=workers,
+            min_batch=1,
+            chunk_size=args.chunk_size,
+        ),
+    )
+    reused_s, reused = _time(
+        "pool reused",
+        lambda: render_batch(
+            corpus,
+            _render_sanitized_markdown,
+            workers=workers,
+            min_batch=1,
+            chunk_size=args.chunk_size,
+        ),
+    )
+    shutdown_render_pool()
+    assert parallel == sequential == reused, "pool output must match sequential order"
+    print(f"speedup      {sequential_s / parallel_s:8.2f}x")
+    print(f"reused       {sequential_s / reused_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,11 @@ import pytest
 os.environ["DEBUG"] = "false"
 os.environ["SECRET_KEY"] = "test-secret-key-with-sufficient-length"
 os.environ["FRONTEND_TELEMETRY_ENABLED"] = "false"
+os.environ["CONTENT_CACHE_DIR"] = ""
+os.environ["GITHUB_CACHE_DIR"] = ""
+os.environ["CONTENT_SEARCH_INDEX_PATH"] = ""
+os.environ["CONTENT_PAGE_CACHE_SIZE"] = "0"
+os.environ["CONTENT_WARM_ON_STARTUP"] = "false"
 
 
 @pytest.fixture(autouse=True)
@@ -176,3 +176,119 @@ def test_about_loader_allows_missing_optional_fields(
     assert certificate.credential_id == ""
 
     markdown_infra._content_cache.clear()
+
+
+def test_about_body_is_rendered_in_one_markdown_pass(monkeypatch) -> None:
+    body = dedent(
+        """
+        Hero **intro**.
+
+        ## About
+
+        About *me*.
+
+        ## Work Experience
+
+        ### Engineer
+
+        **Company:** Example Co
+
+        Shipped **things**.
+        """
+    ).strip()
+    calls: list[str] = []
+    original_render = markdown_infra._render_md
+
+    def _counting_render(content: str) -> str:
+        calls.append(content)
+        return original_render(content)
+
+    monkeypatch.setattr(markdown_infra, "_render_md", _counting_render)
+
+    parsed = markdown_infra._parse_about_body(body)
+
+    assert len(calls) == 1
+    assert parsed["hero_html"] == "<p>Hero <strong>intro</strong>.</p>"
+    assert parsed["about_html"] == "<p>About <em>me</em>.</p>"
+    experience = parsed["work_experience"][0]
+    assert experience.company == "Example Co"
+    assert experience.content_html == "<p>Shipped <strong>things</strong>.</p>"
+    assert "Example Co" in parsed["body_html"]
+    assert "about-node-marker" not in parsed["body_html"]
+
+
+def test_about_tree_keeps_headings_inside_code_fences_as_text() -> None:
+    body = dedent(
+        """
+        ## About
+
+        ```text
+        ## Not a section
+        ```
+
+        ~~~~
+        ### Not an entry
+        ```
+        ~~~~
+
+        ## Education
+
+        ### School
+        """
+    ).strip()
+
+    parsed = markdown_infra._parse_about_body(body)
+
+    assert "<h2>Not a section</h2>" not in parsed["body_html"]
+    assert "<h3>Not an entry</h3>" not in parsed["body_html"]
+    assert "## Not a section" in parsed["about_html"]
+    assert "### Not an entry" in parsed["about_html"]
+    assert "<h2>Education</h2>" in parsed["body_html"]
+    assert [item.school for item in parsed["education"]] == ["School"]
+
+
+def test_about_html_keeps_subsections_of_the_about_section() -> None:
+    body = dedent(
+        """
+        ## About
+
+        Intro text.
+
+        ### Values
+
+        I value *clarity*.
+
+        ## Skills
+
+        - Python
+        """
+    ).strip()
+
+    parsed = markdown_infra._parse_about_body(body)
+
+    assert "### Values" in parsed["about_markdown"]
+    assert "<h3>Values</h3>" in parsed["about_html"]
+    assert "<p>I value <em>clarity</em>.</p>" in parsed["about_html"]
+    assert "<h3>Values</h3>" in parsed["body_html"]
+
+
+def test_about_body_renders_whole_when_markers_do_not_split_cleanly() -> None:
+    # The unclosed fence swallows every marker paragraph after it.
+    body = dedent(
+        """
+        Hero text.
+
+        ```python
+        print("unterminated")
+
+        ## About
+
+        About text.
+        """
+    ).strip()
+
+    parsed = markdown_infra._parse_about_body(body)
+
+    assert parsed["body_html"] == markdown_infra._render_sanitized_markdown(body)
+    assert "about-node-marker" not in parsed["body_html"]
+    assert "about-node-marker" not in parsed["hero_html"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+from textwrap import dedent
+
+from app.content import main
+from app.infrastructure import markdown as markdown_infra
+from app.infrastructure.content_artifact import read_content_artifact
+
+
+def _fail_render(_: str) -> str:
+    raise AssertionError("markdown should be served from the content artifact")
+
+
+def _write_content(content_dir: Path) -> None:
+    (content_dir / "projects").mkdir(parents=True)
+    (content_dir / "blog").mkdir()
+    (content_dir / "about.md").write_text(
+        '---\nname: "Jane"\n---\nAbout **me**.', encoding="utf-8"
+    )
+    (content_dir / "projects" / "alpha.md").write_text(
+        dedent(
+            """
+            ---
+            title: "Alpha"
+            tags: ["python"]
+            date: "2026-01-02"
+            ---
+            Project **body**.
+            """
+        ).lstrip(),
+        encoding="utf-8",
+    )
+    for slug, day in (("first", "01"), ("second", "02")):
+        (content_dir / "blog" / f"{slug}.md").write_text(
+            f'---\ntitle: "{slug}"\ndate: "2026-03-{day}"\n---\nPost `{slug}`.',
+            encoding="utf-8",
+        )
+
+
+def test_compile_cli_writes_artifact_that_loaders_serve_without_rendering(
+    monkeypatch, tmp_path: Path
+) -> None:
+    content_dir = tmp_path / "content"
+    _write_content(content_dir)
+    monkeypatch.setattr(markdown_infra, "CONTENT_DIR", content_dir)
+    monkeypatch.setattr(markdown_infra, "PROJECTS_DIR", content_dir / "projects")
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", content_dir / "blog")
+    markdown_infra._blog_index.clear()
+    markdown_infra._project_index.clear()
+    artifact_path = tmp_path / "build" / "content.sqlite3"
+
+    assert main(["compile", "--output", str(artifact_path)]) == 0
+
+    artifact = read_content_artifact(artifact_path, markdown_infra._pipeline_version())
+    assert artifact is not None
+    assert read_content_artifact(artifact_path, "other-pipeline") is None
+    monkeypatch.setattr(markdown_infra, "_content_artifact", artifact)
+    monkeypatch.setattr(markdown_infra, "_render_md", _fail_render)
+    markdown_infra._content_cache.clear()
+    markdown_infra._body_cache.clear()
+
+    project = markdown_infra.get_project_by_slug("alpha")
+    posts = markdown_infra.load_all_blog_posts()
+
+    assert "<strong>me</strong>" in markdown_infra.load_about().body_html
+    assert project is not None and project.tags == ("python",)
+    assert project.date is not None and project.date.isoformat() == "2026-01-02"
+    assert "<strong>body</strong>" in markdown_infra.load_project_body(project)
+    assert [post.slug for post in posts] == ["second", "first"]
+    markdown_infra._content_cache.clear()
+    markdown_infra._blog_index.clear()
+    markdown_infra._project_index.clear()
+
+
+def test_artifact_reads_sources_relative_to_the_runtime_content_root(
+    monkeypatch, tmp_path: Path, caplog
+) -> None:
+    build_dir = tmp_path / "ci" / "content"
+    _write_content(build_dir)
+    monkeypatch.setattr(markdown_infra, "CONTENT_DIR", build_dir)
+    monkeypatch.setattr(markdown_infra, "PROJECTS_DIR", build_dir / "projects")
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", build_dir / "blog")
+    markdown_infra._blog_index.clear()
+    markdown_infra._project_index.clear()
+    artifact_path = tmp_path / "build" / "content.sqlite3"
+    assert main(["compile", "--output", str(artifact_path)]) == 0
+
+    runtime_dir = tmp_path / "app" / "content"
+    build_dir.parent.rename(runtime_dir.parent)
+    monkeypatch.setattr(markdown_infra, "CONTENT_DIR", runtime_dir)
+    monkeypatch.setattr(markdown_infra, "PROJECTS_DIR", runtime_dir / "projects")
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", runtime_dir / "blog")
+    artifact = read_content_artifact(artifact_path, markdown_infra._pipeline_version())
+    monkeypatch.setattr(markdown_infra, "_content_artifact", artifact)
+    monkeypatch.setattr(markdown_infra, "_project_snapshot", None)
+    markdown_infra._content_cache.clear()
+
+    caplog.clear()
+    with caplog.at_level("WARNING", logger="app.infrastructure.markdown"):
+        matches = markdown_infra.load_project_snapshot().search.search("body")
+        post = markdown_infra.load_all_blog_posts()[0]
+        body = markdown_infra._read_blog_body_markdown(post, fetch_gist=False)
+
+    assert [project.slug for project in matches] == ["alpha"]
+    assert post.source_path == "second.md"
+    assert body == "Post `second`."
+    assert not [record for record in caplog.records if record.levelname == "WARNING"]
+    markdown_infra._content_cache.clear()
+    markdown_infra._blog_index.clear()
+    markdown_infra._project_index.clear()
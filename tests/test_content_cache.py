@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from app.infrastructure.content_cache import SnapshotCache
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_snapshot_cache_coalesces_concurrent_cold_loads() -> None:
+    cache = SnapshotCache(ttl_seconds=60)
+    release = threading.Event()
+    calls: list[int] = []
+
+    def _loader() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "built"
+
+    results: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("posts", _loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    assert _wait_for(lambda: len(calls) == 1)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == ["built"] * 8
+    assert len(calls) == 1
+
+
+def test_snapshot_cache_serves_stale_value_while_refreshing() -> None:
+    cache = SnapshotCache(ttl_seconds=60)
+    release = threading.Event()
+    versions = iter(["v1", "v2"])
+
+    def _loader() -> str:
+        value = next(versions)
+        if value == "v2":
+            release.wait(timeout=5)
+        return value
+
+    assert cache.get("posts", _loader) == "v1"
+    generation = cache.generation
+    cache.mark_stale({"posts"})
+
+    started = time.perf_counter()
+    assert cache.get("posts", _loader) == "v1"
+    assert cache.get("posts", _loader) == "v1"
+    assert time.perf_counter() - started < 1
+
+    release.set()
+    assert _wait_for(lambda: not cache.is_stale("posts"))
+    assert cache.get("posts", _loader) == "v2"
+    assert cache.generation > generation
+
+
+def test_snapshot_cache_keeps_generation_when_a_refresh_is_unchanged() -> None:
+    cache = SnapshotCache(ttl_seconds=60)
+    first = ["same"]
+    versions = iter([first, ["same"]])
+
+    assert cache.get("posts", lambda: next(versions)) is first
+    generation = cache.generation
+    cache.mark_stale({"posts"})
+    assert cache.generation == generation
+
+    cache.get("posts", lambda: next(versions))
+    assert _wait_for(lambda: not cache.is_stale("posts"))
+
+    # The equal rebuild is dropped in favor of the value readers already hold.
+    assert cache.get("posts", lambda: next(versions)) is first
+    assert cache.generation == generation
+
+
+def test_snapshot_cache_notifies_listeners_only_when_a_value_changes() -> None:
+    cache = SnapshotCache(ttl_seconds=60)
+    versions = iter(["v1", "v1", "v2"])
+    swapped: list[str] = []
+    cache.add_listener(swapped.append)
+
+    cache.get("posts", lambda: next(versions))
+    for _ in range(2):
+        cache.mark_stale({"posts"})
+        cache.get("posts", lambda: next(versions))
+        assert _wait_for(lambda: not cache.is_stale("posts"))
+
+    assert swapped == ["posts", "posts"]
+    assert cache.get("posts", lambda: next(versions)) == "v2"
+
+
+def test_snapshot_cache_keeps_previous_snapshot_when_refresh_fails() -> None:
+    cache = SnapshotCache(ttl_seconds=0)
+    attempts = {"count": 0}
+
+    def _loader() -> str:
+        attempts["count"] += 1
+        if attempts["count"] > 1:
+            raise RuntimeError("boom")
+        return "good"
+
+    assert cache.get("about", _loader) == "good"
+    assert cache.get("about", _loader) == "good"
+    assert _wait_for(lambda: attempts["count"] >= 2)
+    assert cache.get("about", _loader) == "good"
+
+
+def test_snapshot_cache_backs_off_after_a_failed_refresh() -> None:
+    cache = SnapshotCache(ttl_seconds=60)
+    attempts = {"count": 0}
+
+    def _loader() -> str:
+        attempts["count"] += 1
+        if attempts["count"] > 1:
+            raise RuntimeError("broken content file")
+        return "good"
+
+    assert cache.get("about", _loader) == "good"
+    cache.mark_stale({"about"})
+    assert cache.get("about", _loader) == "good"
+    assert _wait_for(lambda: not cache.is_stale("about"))
+
+    for _ in range(20):
+        assert cache.get("about", _loader) == "good"
+    time.sleep(0.05)
+    assert attempts["count"] == 2
+
+    cache.mark_stale({"about"})
+    cache.get("about", _loader)
+    assert _wait_for(lambda: attempts["count"] == 3)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from textwrap import dedent
+
+from cachetools import LRUCache
+
+from app.infrastructure import markdown as markdown_infra
+from app.infrastructure.content_index import ContentIndex, SlugIndex
+
+
+def _write_project(path: Path, title: str, body: str = "Project body.") -> None:
+    path.write_text(
+        dedent(
+            f"""
+            ---
+            title: "{title}"
+            ---
+            """
+        ).lstrip()
+        + body,
+        encoding="utf-8",
+    )
+
+
+def test_content_index_rebuilds_only_added_changed_and_removed_files(
+    tmp_path: Path,
+) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.md").write_text(name, encoding="utf-8")
+
+    built: list[str] = []
+
+    def _build(sources: list[tuple[Path, str]]) -> list[str]:
+        built.extend(path.stem for path, _ in sources)
+        return [text for _, text in sources]
+
+    index: ContentIndex[str] = ContentIndex("test")
+    items, stats = index.refresh(tmp_path, _build)
+    assert items == ("c", "b", "a")
+    assert stats.added == 3
+    assert sorted(built) == ["a", "b", "c"]
+
+    built.clear()
+    items_again, stats = index.refresh(tmp_path, _build)
+    assert built == []
+    assert not stats.dirty
+    assert items_again is items
+
+    (tmp_path / "b.md").write_text("b2", encoding="utf-8")
+    (tmp_path / "c.md").unlink()
+    (tmp_path / "d.md").write_text("d", encoding="utf-8")
+    items, stats = index.refresh(tmp_path, _build)
+    assert sorted(built) == ["b", "d"]
+    assert (stats.added, stats.changed, stats.removed) == (1, 1, 1)
+    assert items == ("d", "b2", "a")
+
+
+def test_content_index_skips_rebuild_when_only_mtime_changes(tmp_path: Path) -> None:
+    target = tmp_path / "post.md"
+    target.write_text("same", encoding="utf-8")
+    calls = {"count": 0}
+
+    def _build(sources: list[tuple[Path, str]]) -> list[str]:
+        calls["count"] += len(sources)
+        return [text for _, text in sources]
+
+    index: ContentIndex[str] = ContentIndex("test")
+    index.refresh(tmp_path, _build)
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    items, stats = index.refresh(tmp_path, _build)
+
+    assert items == ("same",)
+    assert calls["count"] == 1
+    assert not stats.dirty
+
+
+def test_project_loader_reuses_unchanged_projects_after_cache_expiry(
+    monkeypatch, tmp_path: Path
+) -> None:
+    projects_dir = tmp_path / "projects"
+    projects_dir.mkdir()
+    _write_project(projects_dir / "alpha.md", "Alpha")
+    _write_project(projects_dir / "beta.md", "Beta")
+
+    rendered: list[str] = []
+    original_render = markdown_infra._render_md
+
+    def _tracking_render(content: str) -> str:
+        rendered.append(content)
+        return original_render(content)
+
+    monkeypatch.setattr(markdown_infra, "PROJECTS_DIR", projects_dir)
+    monkeypatch.setattr(markdown_infra, "_render_md", _tracking_render)
+    markdown_infra._content_cache.clear()
+
+    first = markdown_infra.load_all_projects()
+    assert [project.title for project in first] == ["Beta", "Alpha"]
+    assert len(rendered) == 2
+
+    _write_project(projects_dir / "beta.md", "Beta", body="Updated **body**.")
+    markdown_infra._content_cache.clear()
+    rendered.clear()
+
+    second = markdown_infra.load_all_projects()
+
+    assert rendered == ["Updated **body**."]
+    assert second[1] is first[1]
+    assert "<strong>body</strong>" in markdown_infra.load_project_body(second[0])
+    markdown_infra._content_cache.clear()
+
+
+def test_project_bodies_live_in_bounded_lru_and_render_on_miss(
+    monkeypatch, tmp_path: Path
+) -> None:
+    projects_dir = tmp_path / "projects"
+    projects_dir.mkdir()
+    _write_project(projects_dir / "alpha.md", "Alpha", body="Alpha **body**.")
+    _write_project(projects_dir / "beta.md", "Beta", body="Beta **body**.")
+
+    rendered: list[str] = []
+    original_render = markdown_infra._render_md
+
+    def _tracking_render(content: str) -> str:
+        rendered.append(content)
+        return original_render(content)
+
+    monkeypatch.setattr(markdown_infra, "PROJECTS_DIR", projects_dir)
+    monkeypatch.setattr(markdown_infra, "_render_md", _tracking_render)
+    monkeypatch.setattr(markdown_infra, "_body_cache", LRUCache(maxsize=1))
+    markdown_infra._content_cache.clear()
+    markdown_infra._project_index.clear()
+
+    projects = markdown_infra.load_all_projects()
+    assert len(markdown_infra._body_cache) == 1
+    assert not hasattr(projects[0], "content_html")
+    evicted = next(
+        project
+        for project in projects
+        if project.body_digest not in markdown_infra._body_cache
+    )
+
+    rendered.clear()
+    assert "<strong>body</strong>" in markdown_infra.load_project_body(evicted)
+    assert rendered == [f"{evicted.title} **body**."]
+
+    rendered.clear()
+    markdown_infra.load_project_body(evicted)
+    assert rendered == []
+    markdown_infra._content_cache.clear()
+    markdown_infra._project_index.clear()
+
+
+def test_slug_index_resolves_slugs_positions_and_neighbors() -> None:
+    items = ("c", "b", "a", "b")
+
+    index = SlugIndex.build(items, lambda item: item)
+
+    assert index.by_slug["a"] == "a"
+    assert index.positions == {"c": 0, "b": 1, "a": 2}
+    assert index.neighbors["c"] == (None, "b")
+    assert index.neighbors["b"] == ("c", "a")
+    assert index.neighbors["a"] == ("b", "b")
+    assert "missing" not in index.by_slug
+
+
+def test_unchanged_refresh_reuses_snapshots_without_reading_sources(
+    monkeypatch,
+) -> None:
+    markdown_infra._content_cache.clear()
+    projects = markdown_infra.load_project_snapshot()
+    posts = markdown_infra.load_blog_snapshot()
+
+    reads: list[Path] = []
+    original_parse = markdown_infra._parse_frontmatter
+
+    def _tracking_parse(path: Path) -> tuple[dict[str, object], str]:
+        reads.append(path)
+        return original_parse(path)
+
+    monkeypatch.setattr(markdown_infra, "_parse_frontmatter", _tracking_parse)
+    markdown_infra._content_cache.clear()
+
+    assert markdown_infra.load_project_snapshot() is projects
+    assert markdown_infra.load_blog_snapshot() is posts
+    assert reads == []
+    markdown_infra._content_cache.clear()
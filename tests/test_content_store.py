@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from app.infrastructure import markdown as markdown_infra
+from app.infrastructure.content_store import CompiledContentStore
+
+
+def _fail_render(_: str) -> str:
+    raise AssertionError("markdown should be served from the compiled store")
+
+
+@pytest.fixture
+def compiled_store(monkeypatch, tmp_path: Path) -> Iterator[CompiledContentStore]:
+    store = CompiledContentStore(tmp_path / "cache", "test-pipeline")
+    monkeypatch.setattr(markdown_infra, "_compiled_store", store)
+    markdown_infra._content_cache.clear()
+    markdown_infra._blog_index.clear()
+    markdown_infra._project_index.clear()
+    yield store
+    markdown_infra._content_cache.clear()
+    markdown_infra._blog_index.clear()
+    markdown_infra._project_index.clear()
+
+
+def test_compiled_store_round_trips_and_ignores_other_pipeline_versions(
+    tmp_path: Path,
+) -> None:
+    store = CompiledContentStore(tmp_path, "v1")
+    store.put("blog", "abc", {"content_html": "<p>x</p>"})
+
+    assert store.get("blog", "abc") == {"content_html": "<p>x</p>"}
+    assert store.get("blog", "missing") is None
+    assert CompiledContentStore(tmp_path, "v2").get("blog", "abc") is None
+    assert CompiledContentStore(None, "v1").get("blog", "abc") is None
+
+
+def test_compiled_store_treats_corrupt_entries_as_misses(tmp_path: Path) -> None:
+    store = CompiledContentStore(tmp_path, "v1")
+    store.put("projects", "abc", {"content_html": "<p>x</p>"})
+    (tmp_path / "v1" / "projects" / "abc.json").write_text("{", encoding="utf-8")
+
+    assert store.get("projects", "abc") is None
+
+
+def test_compiled_store_prunes_other_versions_and_unused_entries(
+    tmp_path: Path,
+) -> None:
+    CompiledContentStore(tmp_path, "v0").put("blog", "old", {"a": 1})
+    previous = CompiledContentStore(tmp_path, "v1")
+    for digest in ("read", "stale", "lazy"):
+        previous.put("blog", digest, {"a": 1})
+
+    store = CompiledContentStore(tmp_path, "v1")
+    store.get("blog", "read")
+    store.put("blog", "written", {"a": 1})
+    removed = store.prune([("blog", "lazy")])
+
+    assert removed == 2
+    assert not (tmp_path / "v0").exists()
+    assert sorted(path.stem for path in (tmp_path / "v1" / "blog").iterdir()) == [
+        "lazy",
+        "read",
+        "written",
+    ]
+    assert CompiledContentStore(None, "v1").prune() == 0
+
+
+def test_pruning_after_restart_keeps_entries_of_current_content(
+    monkeypatch, tmp_path: Path, compiled_store: CompiledContentStore
+) -> None:
+    blog_dir = tmp_path / "blog"
+    blog_dir.mkdir()
+    post = blog_dir / "edited.md"
+    front = '---\ntitle: "Edited"\ndate: "2026-03-05"\n---\n'
+    post.write_text(f"{front}First **draft**.\n", encoding="utf-8")
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", blog_dir)
+    monkeypatch.setattr(markdown_infra, "PROJECTS_DIR", tmp_path / "projects")
+    markdown_infra.load_all_blog_posts()
+    post.write_text(f"{front}Final **text**.\n", encoding="utf-8")
+    markdown_infra._content_cache.clear()
+    markdown_infra._blog_index.clear()
+    markdown_infra.load_all_blog_posts()
+
+    restarted = CompiledContentStore(tmp_path / "cache", "test-pipeline")
+    monkeypatch.setattr(markdown_infra, "_compiled_store", restarted)
+    markdown_infra._content_cache.clear()
+    markdown_infra._blog_index.clear()
+    markdown_infra._body_cache.clear()
+    monkeypatch.setattr(markdown_infra, "_render_md", _fail_render)
+    posts = markdown_infra.load_all_blog_posts()
+    markdown_infra.prune_compiled_store()
+
+    entries = sorted(
+        path.parent.name for path in (tmp_path / "cache").glob("*/*/*.json")
+    )
+    assert entries == ["blog", "body"]
+    assert "<strong>text</strong>" in markdown_infra.load_blog_post_body(posts[0])
+
+
+def test_blog_loader_reads_compiled_entries_after_restart(
+    monkeypatch, tmp_path: Path, compiled_store: CompiledContentStore
+) -> None:
+    blog_dir = tmp_path / "blog"
+    blog_dir.mkdir()
+    (blog_dir / "cached.md").write_text(
+        dedent(
+            """
+            ---
+            title: "Cached"
+            date: "2026-03-05"
+            tags: ["python"]
+            ---
+            Compiled **once**.
+            """
+        ).lstrip(),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", blog_dir)
+
+    first = markdown_infra.load_all_blog_posts()
+
+    markdown_infra._content_cache.clear()
+    markdown_infra._blog_index.clear()
+    monkeypatch.setattr(markdown_infra, "_render_md", _fail_render)
+    second = markdown_infra.load_all_blog_posts()
+
+    assert second == first
+    assert "<strong>once</strong>" in markdown_infra.load_blog_post_body(second[0])
+    assert second[0].description == "Compiled **once**."
+    assert second[0].tags == ("python",)
+
+
+def test_about_loader_reads_compiled_entry_after_restart(
+    monkeypatch, tmp_path: Path, compiled_store: CompiledContentStore
+) -> None:
+    content_dir = tmp_path / "content"
+    content_dir.mkdir()
+    (content_dir / "about.md").write_text(
+        dedent(
+            """
+            ---
+            name: "Test Engineer"
+            social_links:
+              github: "https://github.com/example"
+            ---
+            Intro **paragraph**.
+
+            ## Work Experience
+
+            ### Engineer
+
+            **Company:** Example Co
+            **Period:** 2020 - Present
+
+            Did useful work.
+            """
+        ).lstrip(),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(markdown_infra, "CONTENT_DIR", content_dir)
+
+    first = markdown_infra.load_about()
+
+    markdown_infra._content_cache.clear()
+    monkeypatch.setattr(markdown_infra, "_render_md", _fail_render)
+    second = markdown_infra.load_about()
+
+    assert second == first
+    assert second.work_experience[0].period == "2020 - Present"
+
+
+def test_compiled_store_warns_once_when_its_root_is_not_writable(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    store = CompiledContentStore(blocker, "v1")
+
+    with caplog.at_level("DEBUG", logger="app.infrastructure.content_store"):
+        store.put("blog", "a", {"content_html": "<p>a</p>"})
+        store.put("blog", "b", {"content_html": "<p>b</p>"})
+
+    warnings = [record for record in caplog.records if record.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert not any(record.exc_info for record in caplog.records)
+    assert store.get("blog", "a") is None
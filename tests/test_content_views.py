@@ -0,0 +1,145 @@
+from datetime import date
+
+import pytest
+
+from app.infrastructure import markdown as markdown_infra
+from app.infrastructure.content_views import (
+    BlogSnapshot,
+    ProjectSnapshot,
+    TagTaxonomy,
+    normalize_tag,
+)
+from app.models.models import BlogPost, BlogTag, Project
+from app.services import ProjectsPageService
+
+
+def _post(slug: str, tags: tuple[str, ...], featured: bool = False) -> BlogPost:
+    return BlogPost(
+        slug=slug,
+        title=slug.title(),
+        description="",
+        tags=tags,
+        date=date(2026, 1, 1),
+        featured=featured,
+    )
+
+
+def test_snapshots_precompute_featured_first_order() -> None:
+    posts = (
+        _post("c", ("python",)),
+        _post("b", ("python",), featured=True),
+        _post("a", ("rust",)),
+    )
+    projects = (
+        Project(slug="x", title="X", description=""),
+        Project(slug="y", title="Y", description="", featured=True),
+    )
+
+    blog = BlogSnapshot.build(posts)
+    project_snapshot = ProjectSnapshot.build(projects, ["", ""])
+
+    assert blog.index.items is posts
+    assert [post.slug for post in blog.featured_first] == ["b", "c", "a"]
+    assert blog.index.neighbors["b"] == (posts[0], posts[2])
+    assert [project.slug for project in project_snapshot.featured_first] == [
+        "y",
+        "x",
+    ]
+
+
+def test_tag_taxonomy_merges_aliases_across_posts_and_projects() -> None:
+    posts = (
+        _post("c", ("postgres", "Python")),
+        _post("b", ("PostgreSQL", "postgres")),
+        _post("a", (" ", "python")),
+    )
+    projects = (
+        Project(slug="x", title="X", description="", tags=("PostgreSQL", "Web APIs")),
+        Project(slug="y", title="Y", description="", tags=("web_apis",)),
+    )
+
+    taxonomy = TagTaxonomy.build(projects, posts)
+
+    entry = taxonomy.get("Postgres")
+    assert entry is not None
+    assert entry.name == "PostgreSQL"
+    assert [post.slug for post in entry.posts] == ["c", "b"]
+    assert [project.slug for project in entry.projects] == ["x"]
+    assert taxonomy.blog_tags == (
+        BlogTag(name="PostgreSQL", count=2),
+        BlogTag(name="Python", count=2),
+    )
+    assert taxonomy.project_tags == ("PostgreSQL", "Web APIs")
+    assert taxonomy.get("web-apis") is taxonomy.get("WEB APIS")
+    assert taxonomy.get("missing") is None
+    assert normalize_tag(" K8s ") == "kubernetes"
+
+
+def test_blog_snapshot_precomputes_related_posts_by_tfidf_similarity() -> None:
+    posts = (
+        _post("redis-caching", ("redis", "caching")),
+        _post("rust-ownership", ("rust",)),
+        _post("http-caching", ("http", "caching")),
+        _post("redis-queues", ("redis", "queues")),
+        _post("lifetimes", ("rust", "memory")),
+    )
+    bodies = [
+        "Cache invalidation with redis keys and expiry.",
+        "Ownership and borrowing rules in rust.",
+        "Cache headers, etag and expiry for http responses.",
+        "Job queues on redis lists with retries.",
+        "Borrowing, lifetimes and memory safety.",
+    ]
+
+    blog = BlogSnapshot.build(posts, bodies, related_count=2)
+
+    assert [post.slug for post in blog.related["rust-ownership"]] == ["lifetimes"]
+    assert [post.slug for post in blog.related["redis-caching"]] == [
+        "http-caching",
+        "redis-queues",
+    ]
+    assert all(
+        post.slug != slug and len(related) <= 2
+        for slug, related in blog.related.items()
+        for post in related
+    )
+    assert BlogSnapshot.build(posts, bodies, related_count=0).related == {
+        post.slug: () for post in posts
+    }
+
+
+def test_related_posts_keep_shared_terms_in_small_blogs() -> None:
+    posts = (
+        _post("postgres-indexes", ("postgres",)),
+        _post("postgres-vacuum", ("postgres",)),
+    )
+
+    blog = BlogSnapshot.build(posts, ["", ""], related_count=3)
+
+    assert blog.related["postgres-indexes"] == (posts[1],)
+    assert blog.related["postgres-vacuum"] == (posts[0],)
+
+    three = (*posts, _post("rust-traits", ("rust",)))
+    blog = BlogSnapshot.build(three, ["", "", ""], related_count=3)
+    assert blog.related["postgres-indexes"][0] is posts[1]
+
+
+def test_projects_tag_and_query_filter_reads_one_snapshot_generation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _fresh_snapshot() -> ProjectSnapshot:
+        # Every call stands for a swap: equal content, new project objects.
+        projects = (
+            Project(slug="x", title="Rust CLI", description="", tags=("rust",)),
+        )
+        return ProjectSnapshot.build(projects, [""])
+
+    monkeypatch.setattr(markdown_infra, "load_project_snapshot", _fresh_snapshot)
+    monkeypatch.setattr(
+        markdown_infra, "load_blog_snapshot", lambda: BlogSnapshot.build(())
+    )
+    monkeypatch.setattr(markdown_infra, "_taxonomy", None)
+
+    page = ProjectsPageService().build_list_page(q="cli", tag="rust")
+
+    assert [project.slug for project in page.context.projects] == ["x"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure import markdown as markdown_infra
+from app.infrastructure.content_watcher import ContentWatcher
+
+
+def _watch_once(watcher_root: Path, mutate, **kwargs) -> set[Path]:
+    received: set[Path] = set()
+    changed = threading.Event()
+
+    def _on_change(paths: set[Path]) -> None:
+        received.update(paths)
+        changed.set()
+
+    watcher = ContentWatcher(watcher_root, _on_change, debounce_seconds=0.05, **kwargs)
+    watcher.start()
+    try:
+        mutate()
+        assert changed.wait(timeout=5)
+    finally:
+        watcher.stop()
+    return received
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify only")
+def test_content_watcher_reports_changed_files_with_inotify(tmp_path: Path) -> None:
+    blog_dir = tmp_path / "blog"
+    blog_dir.mkdir()
+    target = blog_dir / "post.md"
+
+    received = _watch_once(
+        tmp_path, lambda: target.write_text("hello", encoding="utf-8")
+    )
+
+    assert target in received
+
+
+def test_content_watcher_polling_fallback_reports_changed_files(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(sys, "platform", "darwin")
+    target = tmp_path / "about.md"
+    target.write_text("before", encoding="utf-8")
+
+    received = _watch_once(
+        tmp_path,
+        lambda: target.write_text("after, longer", encoding="utf-8"),
+        poll_interval_seconds=0.05,
+    )
+
+    assert received == {target}
+
+
+def test_invalidate_content_paths_marks_only_affected_keys_stale(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(markdown_infra, "CONTENT_DIR", tmp_path)
+    monkeypatch.setattr(markdown_infra, "PROJECTS_DIR", tmp_path / "projects")
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", tmp_path / "blog")
+    cache = markdown_infra._content_cache
+    cache.clear()
+    for key in ("about", "all_projects", "all_blog_posts"):
+        cache.get(key, tuple)
+
+    markdown_infra.invalidate_content_paths({tmp_path / "blog" / "new-post.md"})
+
+    assert cache.is_stale("all_blog_posts")
+    assert "all_blog_posts" in cache
+    assert not cache.is_stale("all_projects")
+    assert not cache.is_stale("about")
+
+    markdown_infra.invalidate_content_paths({tmp_path})
+
+    assert all(
+        cache.is_stale(key) for key in ("about", "all_projects", "all_blog_posts")
+    )
+    cache.clear()
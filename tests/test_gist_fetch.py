@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.infrastructure import gist_fetch
+from app.infrastructure.gist_fetch import GistResponseCache
+
+_URL = "https://api.github.com/gists/abc"
+
+
+class _FakeGitHub:
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.responses: list[httpx.Response | Exception] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        outcome = self.responses.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def github(monkeypatch) -> Iterator[_FakeGitHub]:
+    fake = _FakeGitHub()
+    client = httpx.Client(transport=httpx.MockTransport(fake.handle))
+    monkeypatch.setattr(gist_fetch, "_client", client)
+    yield fake
+    client.close()
+
+
+def test_gist_cache_revalidates_with_etag_and_serves_last_good_copy(
+    tmp_path: Path, github
+) -> None:
+    cache = GistResponseCache(tmp_path)
+    github.responses.extend(
+        [
+            httpx.Response(200, text='{"id": "abc"}', headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+            httpx.ConnectError("offline"),
+            httpx.Response(403, text="rate limited"),
+        ]
+    )
+
+    first = cache.get(_URL, headers={})
+    revalidated = cache.get(_URL, headers={})
+    offline = cache.get(_URL, headers={})
+    rate_limited = cache.get(_URL, headers={})
+
+    assert first is not None and first.text == '{"id": "abc"}'
+    assert "If-None-Match" not in github.requests[0].headers
+    assert github.requests[1].headers["If-None-Match"] == '"v1"'
+    assert revalidated is not None and revalidated.text == first.text
+    assert not revalidated.stale
+    assert offline is not None and offline.stale and offline.text == first.text
+    assert rate_limited is not None and rate_limited.stale
+
+
+def test_gist_cache_drops_entry_on_not_found(tmp_path: Path, github) -> None:
+    cache = GistResponseCache(tmp_path)
+    github.responses.extend(
+        [
+            httpx.Response(200, text="{}", headers={"ETag": '"v1"'}),
+            httpx.Response(404),
+            httpx.ConnectError("offline"),
+        ]
+    )
+
+    cache.get(_URL, headers={})
+    gone = cache.get(_URL, headers={})
+
+    assert gone is not None and gone.status_code == 404
+    assert cache.get(_URL, headers={}) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_gist_cache_warns_once_when_its_root_is_not_writable(
+    tmp_path: Path, github, caplog: pytest.LogCaptureFixture
+) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    cache = GistResponseCache(blocker)
+    github.responses.extend(
+        [httpx.Response(200, text="one"), httpx.Response(200, text="two")]
+    )
+
+    with caplog.at_level("WARNING", logger="app.infrastructure.content_store"):
+        first = cache.get(_URL, headers={})
+        second = cache.get(_URL, headers={})
+
+    assert first is not None and first.text == "one"
+    assert second is not None and second.text == "two"
+    assert len(caplog.records) == 1
+    assert "not writable" in caplog.records[0].getMessage()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+
+import markdown
+
+from app.infrastructure import markdown_engine
+from app.infrastructure.markdown import _MARKDOWN_EXTENSIONS, _build_markdown_engine
+from app.infrastructure.markdown_engine import HighlightCache, MarkdownPool
+
+
+def _reference(text: str) -> str:
+    return markdown.markdown(text, extensions=list(_MARKDOWN_EXTENSIONS))
+
+
+def test_markdown_pool_matches_fresh_instances_and_resets_state() -> None:
+    pool = MarkdownPool(_build_markdown_engine, max_idle=1)
+    documents = [
+        "# Intro\n\n## Intro\n\nText with [ref][1].\n\n[1]: https://example.com",
+        "# Intro\n\nNo reference here: [ref][1].",
+        "```python\nprint('hi')\n```",
+    ]
+
+    for document in documents * 2:
+        assert pool.convert(document) == _reference(document)
+
+
+def test_markdown_pool_is_safe_across_threads() -> None:
+    pool = MarkdownPool(_build_markdown_engine, max_idle=2)
+    documents = [f"# Heading {index}\n\nBody **{index}**." for index in range(40)]
+    expected = [_reference(document) for document in documents]
+    results: dict[int, str] = {}
+
+    def _render(start: int) -> None:
+        for index in range(start, len(documents), 4):
+            results[index] = pool.convert(documents[index])
+
+    threads = [threading.Thread(target=_render, args=(start,)) for start in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert [results[index] for index in range(len(documents))] == expected
+
+
+def test_highlight_cache_reuses_unchanged_code_blocks(monkeypatch) -> None:
+    block = "```python\ndef handler() -> int:\n    return 1\n```"
+    first = f"Intro.\n\n{block}\n\n```sql\nSELECT 1;\n```"
+    edited = f"Edited intro.\n\n{block}\n\n```sql\nSELECT 1;\n```"
+    monkeypatch.setattr(markdown_engine, "highlight_cache", HighlightCache(0))
+    expected = [_reference(first), _reference(edited)]
+    cache = HighlightCache(16)
+    monkeypatch.setattr(markdown_engine, "highlight_cache", cache)
+    pool = MarkdownPool(_build_markdown_engine)
+
+    assert pool.convert(first) == expected[0]
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    assert pool.convert(edited) == expected[1]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_highlight_cache_only_applies_to_pool_instances(monkeypatch) -> None:
+    block = "```python\nprint('scoped')\n```"
+    cache = HighlightCache(16)
+    monkeypatch.setattr(markdown_engine, "highlight_cache", cache)
+
+    _reference(block)
+    assert (cache.hits, cache.misses) == (0, 0)
+
+    pool = MarkdownPool(_build_markdown_engine)
+    assert pool.convert(block) == _reference(block)
+    assert pool.convert(block) == _reference(block)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_highlight_cache_keeps_attrs_and_plain_blocks_identical() -> None:
+    pool = MarkdownPool(_build_markdown_engine)
+    documents = [
+        '```{.python #main hl_lines="1"}\nx = 1\n```',
+        "~~~\nno language\n~~~\n\n```sql\nSELECT 1;\n```",
+        "Text\n\n```python\nsame = True\n```\n\n```python\nsame = True\n```",
+    ]
+
+    for document in documents * 2:
+        assert pool.convert(document) == _reference(document)
+
+
+def test_highlight_cache_evicts_least_recently_used() -> None:
+    cache = HighlightCache(2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert len(cache) == 2
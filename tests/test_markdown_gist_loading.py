@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from textwrap import dedent
 
+from cachetools import LRUCache
+
+from app.core.config import settings
 from app.models.models import BlogComment
 from app.infrastructure import markdown as markdown_infra
 
@@ -67,11 +72,12 @@ def test_blog_loader_prefers_local_markdown_over_gist_content(
 
     assert len(posts) == 1
     post = posts[0]
-    assert "<strong>markdown</strong>" in post.content_html
+    assert "<strong>markdown</strong>" in markdown_infra.load_blog_post_body(post)
     assert payload_calls["count"] == 0
     assert post.gist_id == "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
     assert post.discussion_url.endswith("#comments")
-    assert len(post.comments) == 1
+    assert len(markdown_infra.load_gist_comments(post.gist_id)) == 1
+    markdown_infra._comments_cache.clear()
     markdown_infra._content_cache.clear()
 
 
@@ -108,14 +114,90 @@ def test_blog_loader_uses_gist_content_when_markdown_body_is_empty(
             }
         },
     )
-    monkeypatch.setattr(markdown_infra, "_fetch_gist_comments", lambda _: ())
     markdown_infra._content_cache.clear()
 
     posts = markdown_infra.load_all_blog_posts()
 
     assert len(posts) == 1
     post = posts[0]
-    assert "<strong>markdown</strong>" in post.content_html
+    assert "<strong>markdown</strong>" in markdown_infra.load_blog_post_body(post)
     assert post.description.startswith("Remote gist")
     assert post.gist_id == "bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
     markdown_infra._content_cache.clear()
+
+
+def test_blog_loader_fetches_gists_concurrently_and_keeps_partial_results(
+    monkeypatch, tmp_path: Path
+) -> None:
+    blog_dir = tmp_path / "blog"
+    blog_dir.mkdir(parents=True, exist_ok=True)
+    gist_ids = [f"{index:x}" * 32 for index in range(10, 14)]
+    for gist_id in gist_ids:
+        _write_blog_file(
+            blog_dir / f"{gist_id[:4]}.md",
+            frontmatter=f'title: "Post {gist_id[:4]}"\n'
+            f'gist_url: "https://gist.github.com/octocat/{gist_id}"',
+        )
+    slow_gist = gist_ids[0]
+    release = threading.Event()
+
+    def _fake_payload(gist_id: str) -> dict[str, object]:
+        if gist_id == slow_gist:
+            release.wait(timeout=5)
+        else:
+            time.sleep(0.2)
+        return {"files": {"post.md": {"content": f"Body of {gist_id[:4]}."}}}
+
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", blog_dir)
+    monkeypatch.setattr(markdown_infra, "_fetch_gist_payload", _fake_payload)
+    monkeypatch.setattr(settings, "github_fetch_concurrency", 8)
+    monkeypatch.setattr(settings, "github_fetch_deadline_seconds", 0.5)
+    markdown_infra._content_cache.clear()
+
+    started = time.perf_counter()
+    posts = markdown_infra.load_all_blog_posts()
+    elapsed = time.perf_counter() - started
+    release.set()
+
+    bodies = {post.gist_id: markdown_infra.load_blog_post_body(post) for post in posts}
+    assert elapsed < 2
+    assert "Content coming soon." in bodies[slow_gist]
+    for gist_id in gist_ids[1:]:
+        assert f"Body of {gist_id[:4]}." in bodies[gist_id]
+    markdown_infra._content_cache.clear()
+
+
+def test_uncached_gist_body_is_refreshed_off_the_request_path(
+    monkeypatch, tmp_path: Path
+) -> None:
+    blog_dir = tmp_path / "blog"
+    blog_dir.mkdir(parents=True, exist_ok=True)
+    _write_blog_file(
+        blog_dir / "gist-only.md",
+        frontmatter='title: "Gist Only"\n'
+        'gist_url: "https://gist.github.com/octocat/cccccccccccccccccccccccccccccccc"',
+    )
+    fetch_threads: list[str] = []
+
+    def _fake_payload(_: str) -> dict[str, object]:
+        fetch_threads.append(threading.current_thread().name)
+        return {"files": {"post.md": {"content": "Remote gist **markdown** body."}}}
+
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", blog_dir)
+    monkeypatch.setattr(markdown_infra, "_fetch_gist_payload", _fake_payload)
+    markdown_infra._content_cache.clear()
+    (post,) = markdown_infra.load_all_blog_posts()
+    request_thread = threading.current_thread().name
+    fetch_threads.clear()
+    monkeypatch.setattr(markdown_infra, "_body_cache", LRUCache(maxsize=4))
+
+    assert "Content coming soon." in markdown_infra.load_blog_post_body(post)
+    deadline = time.monotonic() + 5
+    while post.body_digest not in markdown_infra._body_cache:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert "<strong>markdown</strong>" in markdown_infra.load_blog_post_body(post)
+    assert fetch_threads
+    assert request_thread not in fetch_threads
+    markdown_infra._content_cache.clear()
@@ -0,0 +1,114 @@
+import dataclasses
+import gc
+import tracemalloc
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from cachetools import LRUCache
+
+from app.models import models
+from app.models.models import BlogPost, Project, intern_labels
+
+_POST_COUNT = 2000
+_LABEL_SETS = (["python", "fastapi"], ["rust"], ["python", "perf", "sqlite"])
+
+
+def test_models_are_slotted_and_share_label_tuples() -> None:
+    first = Project(slug="a", title="A", description="", tags=["python", "fastapi"])
+    second = Project(slug="b", title="B", description="", tags=("python", "fastapi"))
+    post = BlogPost(slug="c", title="C", description="", tags=["python", "fastapi"])
+
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(post, "__dict__")
+    assert first.tags is second.tags is post.tags
+    assert first.tags == ("python", "fastapi")
+
+
+def test_posts_with_the_same_tags_share_one_tuple() -> None:
+    posts = [
+        BlogPost(
+            slug=f"post-{index}",
+            title=f"Post {index}",
+            description="",
+            tags=list(_LABEL_SETS[index % len(_LABEL_SETS)]),
+            author="Author",
+            date=date(2026, 1, 1),
+        )
+        for index in range(_POST_COUNT)
+    ]
+
+    assert len({id(post.tags) for post in posts}) == len(_LABEL_SETS)
+    assert len({id(post.author) for post in posts}) == 1
+
+
+# The same fields as BlogPost in a plain dataclass: a per-instance __dict__
+# and a fresh tags tuple per post, as the models were before slots/interning.
+_DictBlogPost = dataclasses.make_dataclass(
+    "_DictBlogPost",
+    [field.name for field in dataclasses.fields(BlogPost)],
+    frozen=True,
+)
+
+
+def _retained_bytes_per_post(build: Callable[[dict[str, Any]], object]) -> float:
+    # Build every string up front so only the model instances are measured.
+    rows = [
+        {
+            "slug": f"post-{index}",
+            "title": f"Post {index}",
+            "description": f"Description {index}",
+            "tags": list(_LABEL_SETS[index % len(_LABEL_SETS)]),
+            "author": "Author",
+            "discussion_url": "",
+            "gist_url": "",
+            "gist_id": "",
+            "date": date(2026, 1, 1),
+            "featured": False,
+            "read_time_minutes": 1,
+            "body_digest": f"{index:064x}",
+            "source_path": f"content/blog/post-{index}.md",
+        }
+        for index in range(_POST_COUNT)
+    ]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        posts = [build(row) for row in rows]
+        # Drop the parsed inputs, as the loaders do, so only retained memory counts.
+        del rows
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (current - baseline) / len(posts)
+
+
+def test_blog_post_uses_less_memory_than_an_unslotted_model(
+    record_property: Callable[[str, object], None],
+) -> None:
+    slotted = _retained_bytes_per_post(lambda row: BlogPost(**row))
+    unslotted = _retained_bytes_per_post(
+        lambda row: _DictBlogPost(**{**row, "tags": tuple(row["tags"])})
+    )
+    record_property("blog_post_bytes", round(slotted))
+    record_property("dict_blog_post_bytes", round(unslotted))
+
+    # Both run in this process, so the ratio holds across interpreter builds.
+    assert slotted < unslotted * 0.8, (
+        f"BlogPost: {slotted:.0f} bytes per post, unslotted: {unslotted:.0f}"
+    )
+
+
+def test_shared_label_table_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(models, "_shared_labels", LRUCache(maxsize=2))
+
+    old = intern_labels(["old-tag"])
+    intern_labels(["python"])
+    intern_labels(["rust"])
+
+    assert len(models._shared_labels) == 2
+    assert ("old-tag",) not in models._shared_labels
+    assert intern_labels(["rust"]) is intern_labels(("rust",))
+    assert intern_labels(["old-tag"]) == old
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from cachetools import LRUCache
+from fastapi.testclient import TestClient
+
+from app.core import rendering
+from app.core.dependencies import get_about_page_service
+from app.infrastructure import markdown as markdown_infra
+from app.main import create_app
+from app.services import AboutPageService
+from app.services.types import PageRenderData
+
+
+class CountingAboutPageService(AboutPageService):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def build_page(self) -> PageRenderData:
+        self.calls += 1
+        return super().build_page()
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> CountingAboutPageService:
+    monkeypatch.setattr(rendering, "_page_cache", rendering.PageCache(16))
+    return CountingAboutPageService()
+
+
+@pytest.fixture
+def client(service: CountingAboutPageService) -> Iterator[TestClient]:
+    app = create_app()
+    app.dependency_overrides[get_about_page_service] = lambda: service
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_repeat_gets_are_served_from_cache_with_a_strong_etag(
+    client: TestClient, service: CountingAboutPageService
+) -> None:
+    first = client.get("/about")
+    second = client.get("/about")
+    third = client.get("/about")
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    # The miss streams before the body is known; the cached copy has an ETag.
+    assert "etag" not in first.headers
+    etag = second.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert third.headers["etag"] == etag
+    assert first.headers["vary"] == second.headers["vary"] == "HX-Request"
+    assert service.calls == 1
+
+
+def test_matching_if_none_match_returns_304_without_rendering(
+    client: TestClient, service: CountingAboutPageService
+) -> None:
+    client.get("/about")
+    etag = client.get("/about").headers["etag"]
+
+    not_modified = client.get("/about", headers={"If-None-Match": f'"x", {etag}'})
+    mismatch = client.get("/about", headers={"If-None-Match": '"other"'})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert mismatch.status_code == 200
+    assert service.calls == 1
+
+
+def test_content_generation_change_and_query_retire_or_split_entries(
+    client: TestClient, service: CountingAboutPageService
+) -> None:
+    client.get("/about")
+    etag = client.get("/about").headers["etag"]
+    client.get("/about", params={"utm": "feed"})
+    assert service.calls == 2
+
+    markdown_infra._content_cache.clear()
+    rerendered = client.get("/about", headers={"If-None-Match": etag})
+    refreshed = client.get("/about", headers={"If-None-Match": etag})
+
+    # Re-rendered for the new generation, but the bytes and ETag are unchanged.
+    assert service.calls == 3
+    assert rerendered.status_code == 200
+    assert refreshed.status_code == 304
+
+
+def test_not_found_pages_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rendering, "_page_cache", rendering.PageCache(16))
+    with TestClient(create_app()) as test_client:
+        response = test_client.get("/blog/posts/slug-that-does-not-exist")
+
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+
+
+def test_streamed_page_flushes_head_first_and_matches_buffered_render() -> None:
+    page = AboutPageService().build_page()
+
+    chunks = [bytes(chunk) for chunk in rendering.iter_page(page)]
+    head = chunks[0].decode("utf-8")
+
+    assert head.startswith("<!DOCTYPE html>")
+    assert head.rstrip().endswith("</head>")
+    assert "/static/js/theme-bootstrap.js" in head
+    assert "<body" not in head
+    assert b"".join(chunks) == rendering.render_page(page).body
+
+
+def test_streamed_head_is_sent_before_the_body_renders(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    page = AboutPageService().build_page()
+    body_rendered = threading.Event()
+    original_body = rendering.render_body
+
+    def _render_body(page: PageRenderData) -> bytes:
+        body_rendered.set()
+        return original_body(page)
+
+    monkeypatch.setattr(rendering, "render_body", _render_body)
+
+    async def first_chunk() -> bytes:
+        response = await rendering.stream_page(page)
+        async for chunk in response.body_iterator:
+            return bytes(chunk)
+        return b""
+
+    head = asyncio.run(first_chunk())
+
+    assert head.rstrip().endswith(b"</head>")
+    assert not body_rendered.is_set()
+
+
+def test_template_error_in_a_streamed_body_aborts_and_is_not_cached(
+    service: CountingAboutPageService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    original_render = rendering.render_template
+
+    def _failing_body(template: str, **context: object) -> str:
+        if context.get("head_flushed"):
+            raise RuntimeError("broken page template")
+        return original_render(template, **context)
+
+    monkeypatch.setattr(rendering, "render_template", _failing_body)
+    app = create_app()
+    app.dependency_overrides[get_about_page_service] = lambda: service
+    with TestClient(app) as test_client:
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="broken page template"):
+                test_client.get("/about")
+
+    assert service.calls == 2
+
+
+def test_template_error_in_a_streamed_head_returns_500(
+    service: CountingAboutPageService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _failing_head(page: PageRenderData) -> bytes:
+        raise RuntimeError("broken head template")
+
+    monkeypatch.setattr(rendering, "render_head", _failing_head)
+    app = create_app()
+    app.dependency_overrides[get_about_page_service] = lambda: service
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        response = test_client.get("/about")
+
+    assert response.status_code == 500
+    assert "<!DOCTYPE html>" not in response.text
+
+
+def test_buffered_mode_sends_etag_on_first_response(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(rendering.settings, "content_stream_pages", False)
+
+    first = client.get("/about")
+    second = client.get("/about", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+
+
+def test_unchanged_content_refresh_keeps_cache_hits_and_304s(
+    client: TestClient, service: CountingAboutPageService
+) -> None:
+    client.get("/about")
+    etag = client.get("/about").headers["etag"]
+    keys = {"about", "all_projects", "all_blog_posts"}
+
+    markdown_infra.invalidate_content(keys)
+    during = client.get("/about", headers={"If-None-Match": etag})
+    assert _wait_for_refresh(keys)
+    after = client.get("/about", headers={"If-None-Match": etag})
+
+    assert during.status_code == after.status_code == 304
+    assert service.calls == 1
+
+
+def test_restored_gist_body_replaces_a_cached_placeholder_page(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    blog_dir = tmp_path / "blog"
+    blog_dir.mkdir()
+    (blog_dir / "gist-only.md").write_text(
+        '---\ntitle: "Gist Only"\n'
+        'gist_url: "https://gist.github.com/octocat/dddddddddddddddddddddddddddddddd"'
+        "\n---\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(markdown_infra, "BLOG_DIR", blog_dir)
+    monkeypatch.setattr(
+        markdown_infra,
+        "_fetch_gist_payload",
+        lambda _: {"files": {"post.md": {"content": "Remote gist **body**."}}},
+    )
+    monkeypatch.setattr(rendering, "_page_cache", rendering.PageCache(16))
+    markdown_infra._content_cache.clear()
+
+    markdown_infra.load_all_blog_posts()
+    monkeypatch.setattr(markdown_infra, "_body_cache", LRUCache(maxsize=4))
+
+    with TestClient(create_app()) as test_client:
+        placeholder = test_client.get("/blog/posts/gist-only")
+        deadline = time.monotonic() + 5
+        while (
+            "<strong>body</strong>" not in test_client.get("/blog/posts/gist-only").text
+        ):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    assert "Content coming soon." in placeholder.text
+    markdown_infra._content_cache.clear()
+
+
+def _wait_for_refresh(keys: set[str], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not any(markdown_infra._content_cache.is_stale(key) for key in keys):
+            return True
+        time.sleep(0.01)
+    return False
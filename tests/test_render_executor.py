@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import rendering
+from app.core.dependencies import get_about_page_service
+from app.core.render_executor import RenderExecutor
+from app.main import create_app
+from app.services import AboutPageService
+from app.services.types import PageRenderData
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+class RecordingMetrics:
+    def __init__(self) -> None:
+        self.queued = 0
+        self.waits: list[float] = []
+        self.finished = 0
+        self.cancelled = 0
+
+    def render_task_queued(self) -> None:
+        self.queued += 1
+
+    def render_task_started(self, *, wait_ms: float) -> None:
+        self.waits.append(wait_ms)
+
+    def render_task_finished(self) -> None:
+        self.finished += 1
+
+    def render_task_cancelled(self) -> None:
+        self.cancelled += 1
+
+
+class BlockingAboutPageService(AboutPageService):
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def build_page(self) -> PageRenderData:
+        self.started.set()
+        assert self.release.wait(timeout=10)
+        return super().build_page()
+
+
+def test_run_uses_render_threads_and_keeps_context() -> None:
+    metrics = RecordingMetrics()
+    executor = RenderExecutor(2, metrics=metrics)  # type: ignore[arg-type]
+
+    def work(suffix: str) -> tuple[str, str]:
+        return threading.current_thread().name, _request_id.get() + suffix
+
+    async def main() -> tuple[str, str]:
+        _request_id.set("req-1")
+        return await executor.run(work, suffix="!")
+
+    thread_name, value = asyncio.run(main())
+    executor.shutdown()
+
+    assert thread_name.startswith("render")
+    assert value == "req-1!"
+    assert metrics.queued == metrics.finished == 1
+    assert len(metrics.waits) == 1
+
+
+def test_run_queues_beyond_max_workers() -> None:
+    executor = RenderExecutor(1, metrics=RecordingMetrics())  # type: ignore[arg-type]
+    release = threading.Event()
+
+    async def main() -> list[str]:
+        first = asyncio.ensure_future(executor.run(release.wait, 10))
+        second = asyncio.ensure_future(executor.run(str, "done"))
+        while executor.active == 0:
+            await asyncio.sleep(0.001)
+        assert executor.queued == 1
+        release.set()
+        return [str(await first), await second]
+
+    assert asyncio.run(main()) == ["True", "done"]
+    assert executor.queued == executor.active == 0
+    executor.shutdown()
+
+
+def test_cancelled_queued_render_leaves_the_queue() -> None:
+    metrics = RecordingMetrics()
+    executor = RenderExecutor(1, metrics=metrics)  # type: ignore[arg-type]
+    release = threading.Event()
+    ran: list[str] = []
+
+    async def main() -> None:
+        first = asyncio.ensure_future(executor.run(release.wait, 10))
+        second = asyncio.ensure_future(executor.run(ran.append, "second"))
+        while executor.active == 0 or executor.queued == 0:
+            await asyncio.sleep(0.001)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        release.set()
+        await first
+
+    asyncio.run(main())
+    executor.shutdown()
+
+    assert ran == []
+    assert executor.queued == executor.active == 0
+    assert metrics.queued == metrics.finished + metrics.cancelled
+    assert metrics.cancelled == 1
+
+
+def test_zero_workers_runs_inline_on_the_event_loop() -> None:
+    executor = RenderExecutor(0, metrics=RecordingMetrics())  # type: ignore[arg-type]
+
+    async def main() -> str:
+        return await executor.run(lambda: threading.current_thread().name)
+
+    assert asyncio.run(main()) == threading.current_thread().name
+
+
+@pytest.fixture
+def blocking_service() -> BlockingAboutPageService:
+    return BlockingAboutPageService()
+
+
+@pytest.fixture
+def client(blocking_service: BlockingAboutPageService) -> Iterator[TestClient]:
+    app = create_app()
+    app.dependency_overrides[get_about_page_service] = lambda: blocking_service
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_health_answers_while_a_page_render_is_blocked(
+    client: TestClient,
+    blocking_service: BlockingAboutPageService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(rendering, "_render_executor", RenderExecutor(2))
+    page_status: list[int] = []
+    page_thread = threading.Thread(
+        target=lambda: page_status.append(client.get("/about").status_code)
+    )
+    page_thread.start()
+    try:
+        assert blocking_service.started.wait(timeout=10)
+        assert client.get("/health").json() == {"status": "ok"}
+    finally:
+        blocking_service.release.set()
+        page_thread.join(timeout=10)
+
+    assert page_status == [200]
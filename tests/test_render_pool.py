@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from app.infrastructure import render_pool
+from app.infrastructure.markdown import _render_sanitized_markdown
+from app.infrastructure.render_pool import (
+    MAX_DEFAULT_WORKERS,
+    render_batch,
+    resolve_worker_count,
+    shutdown_render_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _stop_pool() -> Iterator[None]:
+    yield
+    shutdown_render_pool()
+
+
+def _corpus() -> list[str]:
+    return [
+        f"# Post {index}\n\n```python\nprint({index})\n```\n\nBody **{index}**."
+        for index in range(12)
+    ]
+
+
+def test_render_batch_pool_matches_sequential_order() -> None:
+    corpus = _corpus()
+    sequential = render_batch(
+        corpus, _render_sanitized_markdown, workers=1, min_batch=1, chunk_size=2
+    )
+    parallel = render_batch(
+        corpus, _render_sanitized_markdown, workers=2, min_batch=1, chunk_size=2
+    )
+    pool = render_pool._pool
+    again = render_batch(
+        corpus, _render_sanitized_markdown, workers=2, min_batch=1, chunk_size=2
+    )
+
+    assert parallel == sequential == again
+    assert "<strong>11</strong>" in parallel[-1]
+    assert pool is not None and render_pool._pool is pool
+
+
+def test_render_batch_stays_in_process_below_min_batch() -> None:
+    calls: list[str] = []
+
+    def _render(source: str) -> str:
+        calls.append(source)
+        return source.upper()
+
+    # A local function cannot be pickled, so this only passes in-process.
+    assert render_batch(["a", "b"], _render, workers=4, min_batch=3, chunk_size=1) == [
+        "A",
+        "B",
+    ]
+    assert calls == ["a", "b"]
+
+
+def test_resolve_worker_count_uses_the_affinity_mask_for_zero(monkeypatch) -> None:
+    monkeypatch.setattr(render_pool.os, "cpu_count", lambda: 96)
+    monkeypatch.setattr(render_pool.os, "sched_getaffinity", lambda _: {0, 1, 2})
+
+    assert resolve_worker_count(5) == 5
+    assert resolve_worker_count(0) == 3
+
+    monkeypatch.setattr(render_pool.os, "sched_getaffinity", lambda _: set(range(96)))
+    assert resolve_worker_count(0) == MAX_DEFAULT_WORKERS
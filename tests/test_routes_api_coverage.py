@@ -14,6 +14,7 @@ from app.core.dependencies import (
     get_contact_orchestrator,
     get_projects_page_service,
 )
+from app.models.models import BlogComment, BlogPost
 from app.models.schemas import SEOMeta
 from app.models.schemas import ContactForm
 from app.infrastructure.notifications.email import (
@@ -143,6 +144,19 @@ class WrongBlogTagsPageService:
         )
 
 
+class StubBlogCommentsPageService:
+    def __init__(self, post: BlogPost | None) -> None:
+        self._post = post
+
+    def get_post(self, slug: str) -> BlogPost | None:
+        del slug
+        return self._post
+
+    def get_post_comments(self, post: BlogPost) -> tuple[BlogComment, ...]:
+        del post
+        return (BlogComment(author="octocat", body="Lazy loaded comment."),)
+
+
 class WrongProjectsPageService:
     def build_list_page(
         self,
@@ -341,6 +355,34 @@ def test_blog_tags_route_returns_fragment_for_htmx_requests() -> None:
         assert "<html" not in response.text.lower()
 
 
+def test_blog_post_comments_route_returns_comments_fragment() -> None:
+    post = BlogPost(
+        slug="gist-post",
+        title="Gist Post",
+        description="",
+        discussion_url="https://gist.github.com/octocat/abc#comments",
+        gist_id="abc",
+    )
+    overrides = {get_blog_page_service: lambda: StubBlogCommentsPageService(post)}
+
+    for client in _build_client(overrides=overrides):
+        response = client.get("/blog/posts/gist-post/comments")
+
+        assert response.status_code == 200
+        assert "Lazy loaded comment." in response.text
+        assert "hx-trigger" not in response.text
+        assert "<html" not in response.text.lower()
+
+
+def test_blog_post_comments_route_returns_not_found_for_unknown_post() -> None:
+    overrides = {get_blog_page_service: lambda: StubBlogCommentsPageService(None)}
+
+    for client in _build_client(overrides=overrides):
+        response = client.get("/blog/posts/missing/comments")
+
+        assert response.status_code == 404
+
+
 def test_blog_tag_detail_route_raises_type_error_for_invalid_htmx_context() -> None:
     overrides = {get_blog_page_service: lambda: WrongBlogTagsPageService()}
 
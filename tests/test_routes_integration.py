@@ -3,10 +3,18 @@ from __future__ import annotations
 import re
 from collections.abc import Iterator
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app.core.security import validate_csrf_token
+from app.infrastructure import markdown as markdown_infra
 from app.main import create_app
-from app.infrastructure.markdown import load_all_blog_posts, load_all_projects
+from app.infrastructure.markdown import (
+    get_related_blog_posts,
+    load_all_blog_posts,
+    load_all_projects,
+    sync_search_index,
+)
 
 
 def _extract_csrf_token(html: str) -> str:
@@ -67,6 +75,27 @@ def test_contact_page_renders_htmx_and_alpine_form_enhancement() -> None:
         assert '@submit.prevent="submit"' in response.text
 
 
+def test_home_and_contact_pages_load_csrf_token_through_fragment() -> None:
+    for client in _build_client():
+        for path in ("/", "/contact"):
+            first = client.get(path, headers={"user-agent": "agent-a"})
+            second = client.get(path, headers={"user-agent": "agent-b"})
+
+            assert first.status_code == 200
+            assert first.content == second.content
+            assert 'hx-get="/contact/token"' in first.text
+            assert re.search(r'name="csrf_token" value="[^"]+"', first.text) is None
+
+        token_response = client.get("/contact/token", headers={"user-agent": "agent-a"})
+
+        assert token_response.status_code == 200
+        assert token_response.headers["cache-control"] == "no-store"
+        assert "<html" not in token_response.text
+        assert validate_csrf_token(
+            _extract_csrf_token(token_response.text), user_agent="agent-a"
+        )
+
+
 def test_project_detail_existing_and_missing_slug() -> None:
     projects = load_all_projects()
     assert projects
@@ -173,7 +202,9 @@ def test_blog_feed_returns_rss_xml() -> None:
 
 def test_contact_submission_success_flow() -> None:
     for client in _build_client():
-        get_response = client.get("/contact", headers={"user-agent": "pytest-agent"})
+        get_response = client.get(
+            "/contact/token", headers={"user-agent": "pytest-agent"}
+        )
         csrf_token = _extract_csrf_token(get_response.text)
 
         post_response = client.post(
@@ -212,7 +243,9 @@ def test_contact_submission_rejects_invalid_csrf() -> None:
 
 def test_contact_submission_returns_validation_errors() -> None:
     for client in _build_client():
-        get_response = client.get("/contact", headers={"user-agent": "pytest-agent"})
+        get_response = client.get(
+            "/contact/token", headers={"user-agent": "pytest-agent"}
+        )
         csrf_token = _extract_csrf_token(get_response.text)
 
         post_response = client.post(
@@ -233,7 +266,9 @@ def test_contact_submission_returns_validation_errors() -> None:
 
 def test_contact_submission_returns_fragment_for_htmx_validation_errors() -> None:
     for client in _build_client():
-        get_response = client.get("/contact", headers={"user-agent": "pytest-agent"})
+        get_response = client.get(
+            "/contact/token", headers={"user-agent": "pytest-agent"}
+        )
         csrf_token = _extract_csrf_token(get_response.text)
 
         post_response = client.post(
@@ -254,3 +289,50 @@ def test_contact_submission_returns_fragment_for_htmx_validation_errors() -> Non
         assert post_response.status_code == 422
         assert 'id="contact-form-section"' in post_response.text
         assert "<html" not in post_response.text.lower()
+
+
+def test_search_page_and_htmx_fragment_return_highlighted_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project = load_all_projects()[0]
+    term = project.title.split()[0]
+    # The warm-up does this off the request path; it is off in tests. Later
+    # tests start from an unsynced index again, so swaps start no syncs.
+    monkeypatch.setattr(markdown_infra, "_search_synced", ())
+    sync_search_index()
+
+    for client in _build_client():
+        page = client.get("/search", params={"q": term})
+        fragment = client.get(
+            "/search", params={"q": term}, headers={"HX-Request": "true"}
+        )
+        restored = client.get(
+            "/search",
+            params={"q": term},
+            headers={"HX-Request": "true", "HX-History-Restore-Request": "true"},
+        )
+        empty = client.get("/search", params={"q": "zzzznotaword"})
+
+        assert page.status_code == 200
+        assert 'name="q"' in page.text
+        assert f'href="/projects/{project.slug}"' in page.text
+        assert fragment.status_code == 200
+        assert "<html" not in fragment.text
+        assert 'id="search-results"' in fragment.text
+        assert f'href="/projects/{project.slug}"' in fragment.text
+        assert "<html" in restored.text
+        assert "No results found." in empty.text
+
+
+def test_blog_post_page_lists_precomputed_related_posts() -> None:
+    post = load_all_blog_posts()[0]
+    related = get_related_blog_posts(post.slug)
+    assert related
+
+    for client in _build_client():
+        response = client.get(f"/blog/posts/{post.slug}")
+
+        assert response.status_code == 200
+        assert "Related Posts" in response.text
+        for related_post in related:
+            assert f'href="/blog/posts/{related_post.slug}"' in response.text
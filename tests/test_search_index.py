@@ -0,0 +1,64 @@
+import time
+
+from app.infrastructure.search_index import SearchIndex, tokenize
+
+
+def _index(documents: list[tuple[str, str]]) -> SearchIndex[str]:
+    return SearchIndex(
+        [title for title, _ in documents],
+        [((title, 3.0), (body, 1.0)) for title, body in documents],
+    )
+
+
+def test_tokenize_casefolds_and_splits_on_punctuation() -> None:
+    assert tokenize("FastAPI, Pydantic_v2 & Straße!") == [
+        "fastapi",
+        "pydantic",
+        "v2",
+        "strasse",
+    ]
+
+
+def test_search_ranks_title_hits_and_requires_every_term() -> None:
+    index = _index(
+        [
+            ("Queue worker", "Redis backed jobs with retries."),
+            ("Redis cache", "Caching layer for the API."),
+            ("Contact form", "Sends email through a queue."),
+        ]
+    )
+
+    assert index.search("redis") == ("Redis cache", "Queue worker")
+    assert index.search("redis retries") == ("Queue worker",)
+    assert index.search("redis email") == ()
+    assert index.search("   ") == ()
+
+
+def test_search_matches_prefixes_and_prefers_exact_terms() -> None:
+    index = _index(
+        [
+            ("Fast path", "Notes on latency."),
+            ("FastAPI service", "An HTTP API."),
+        ]
+    )
+
+    assert index.search("fastap") == ("FastAPI service",)
+    assert index.search("fast") == ("Fast path", "FastAPI service")
+    assert index.search("f") == ()
+
+
+def test_search_latency_does_not_scan_the_corpus() -> None:
+    documents = [
+        (f"Project {index}", f"service number{index} with filler words")
+        for index in range(20_000)
+    ]
+    documents.append(("Needle project", "the rare haystackneedle term"))
+    index = _index(documents)
+
+    started = time.perf_counter()
+    for _ in range(100):
+        results = index.search("haystackn")
+    per_query = (time.perf_counter() - started) / 100
+
+    assert results == ("Needle project",)
+    assert per_query < 0.001
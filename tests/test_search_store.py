@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure import markdown as markdown_infra
+from app.infrastructure.search_store import FullTextIndex, SearchDocument
+
+
+def _document(
+    key: str, title: str, digest: str, *, kind: str = "post"
+) -> SearchDocument:
+    return SearchDocument(
+        key=key,
+        kind=kind,
+        title=title,
+        url=f"/{kind}/{key}",
+        tags="python",
+        body_digest=digest,
+    )
+
+
+def test_sync_writes_only_added_changed_and_removed_documents(tmp_path: Path) -> None:
+    index = FullTextIndex(tmp_path / "search.sqlite3")
+    bodies = {
+        "a": "Async workers and queues.",
+        "b": "Caching with sqlite.",
+        "c": "Tracing requests end to end.",
+    }
+    loaded: list[str] = []
+
+    def load_body(document: SearchDocument) -> str:
+        loaded.append(document.key)
+        return bodies[document.key]
+
+    documents = [_document(key, key.upper(), f"{key}1") for key in bodies]
+    assert index.sync(documents, load_body) == 3
+    assert index.sync(documents, load_body) == 0
+    assert sorted(loaded) == ["a", "b", "c"]
+
+    loaded.clear()
+    bodies["b"] = "Caching with redis."
+    documents = [_document("a", "A", "a1"), _document("b", "B", "b2")]
+    assert index.sync(documents, load_body) == 2
+    assert loaded == ["b"]
+
+    assert [result.title for result in index.search("redis")] == ["B"]
+    assert index.search("sqlite") == ()
+    assert index.search("tracing") == ()
+    index.close()
+
+    reopened = FullTextIndex(tmp_path / "search.sqlite3")
+    assert reopened.sync(documents, load_body) == 0
+    assert [result.title for result in reopened.search("queue")] == ["A"]
+    reopened.close()
+
+
+def test_search_highlights_prefix_matches_and_escapes_snippets() -> None:
+    index = FullTextIndex(None)
+    index.sync(
+        [_document("a", "Templates", "a1"), _document("b", "Kubernetes", "b1")],
+        lambda document: {
+            "a": "Render <script>alert(1)</script> safely with Jinja templates.",
+            "b": "Deploying workers to Kubernetes clusters.",
+        }[document.key],
+    )
+
+    (result,) = index.search("templ")
+    assert result.url == "/post/a"
+    assert "<mark>templates</mark>" in result.snippet_html
+    assert "&lt;script&gt;" in result.snippet_html
+    assert "<script>" not in result.snippet_html
+
+    assert [result.title for result in index.search("deploy clusters")] == [
+        "Kubernetes"
+    ]
+    assert index.search("deploy templates") == ()
+    assert index.search('"); DROP TABLE search; --') == ()
+    index.close()
+
+
+def test_unwritable_index_path_falls_back_to_memory(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    index = FullTextIndex(blocker / "search.sqlite3")
+
+    written = index.sync(
+        [_document("a", "Queues", "a1")], lambda _document: "Async workers."
+    )
+
+    assert written == 1
+    assert [result.title for result in index.search("workers")] == ["Queues"]
+    assert not (blocker / "search.sqlite3").exists()
+
+
+def test_search_only_queries_and_syncs_on_a_background_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index = FullTextIndex(None)
+    sync_threads: list[str] = []
+    original_sync = index.sync
+    release = threading.Event()
+
+    def _recording_sync(*args: object, **kwargs: object) -> None:
+        sync_threads.append(threading.current_thread().name)
+        assert release.wait(timeout=5)
+        original_sync(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(index, "sync", _recording_sync)
+    monkeypatch.setattr(markdown_infra, "_search_index", index)
+    monkeypatch.setattr(markdown_infra, "_search_synced", ())
+    project = markdown_infra.load_all_projects()[0]
+    term = project.title.split()[0]
+
+    # The query returns while the sync is still held back.
+    assert markdown_infra.search_content(term) == ()
+    release.set()
+    deadline = time.monotonic() + 5
+    while not markdown_infra._search_index_current():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert sync_threads == ["search-sync"]
+    assert any(
+        result.url == f"/projects/{project.slug}"
+        for result in markdown_infra.search_content(term)
+    )
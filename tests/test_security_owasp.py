@@ -102,7 +102,7 @@ def test_owasp_contact_requires_csrf_token_field(client: TestClient) -> None:
 def test_owasp_contact_csrf_token_is_user_agent_bound(
     client: TestClient,
 ) -> None:
-    get_response = client.get("/contact", headers={"user-agent": "agent-a"})
+    get_response = client.get("/contact/token", headers={"user-agent": "agent-a"})
     csrf_token = _extract_csrf_token(get_response.text)
 
     response = client.post(
@@ -116,7 +116,7 @@ def test_owasp_contact_csrf_token_is_user_agent_bound(
 
 
 def test_owasp_contact_rate_limit_blocks_bruteforce(client: TestClient) -> None:
-    get_response = client.get("/contact", headers={"user-agent": "pytest-agent"})
+    get_response = client.get("/contact/token", headers={"user-agent": "pytest-agent"})
     csrf_token = _extract_csrf_token(get_response.text)
     payload = _contact_payload(csrf_token)
 
@@ -135,7 +135,7 @@ def test_owasp_contact_rate_limit_blocks_bruteforce(client: TestClient) -> None:
 def test_owasp_contact_rejects_oversized_message_payload(
     client: TestClient,
 ) -> None:
-    get_response = client.get("/contact", headers={"user-agent": "pytest-agent"})
+    get_response = client.get("/contact/token", headers={"user-agent": "pytest-agent"})
     csrf_token = _extract_csrf_token(get_response.text)
 
     response = client.post(
@@ -150,7 +150,7 @@ def test_owasp_contact_rejects_oversized_message_payload(
 def test_owasp_contact_handles_injection_strings_as_plain_data(
     client: TestClient,
 ) -> None:
-    get_response = client.get("/contact", headers={"user-agent": "pytest-agent"})
+    get_response = client.get("/contact/token", headers={"user-agent": "pytest-agent"})
     csrf_token = _extract_csrf_token(get_response.text)
 
     response = client.post(
@@ -189,7 +189,9 @@ def test_owasp_contact_body_size_limit_rejects_oversized_payload(
     monkeypatch.setattr(settings, "contact_max_body_bytes", 128)
     app = create_app()
     with TestClient(app) as client:
-        get_response = client.get("/contact", headers={"user-agent": "pytest-agent"})
+        get_response = client.get(
+            "/contact/token", headers={"user-agent": "pytest-agent"}
+        )
         csrf_token = _extract_csrf_token(get_response.text)
         response = client.post(
             "/contact",
@@ -28,7 +28,6 @@ def test_seo_for_project_uses_article_type_and_project_path() -> None:
         slug="secure-contact-pipeline",
         title="Secure Contact Pipeline",
         description="A secure contact pipeline.",
-        content_html="<p>content</p>",
         thumbnail="/static/images/secure-contact.png",
         tags=["fastapi", "security"],
         tech_stack=["FastAPI", "Pydantic"],